@@ -0,0 +1,3 @@
+"""
+Processing - 動画解析・評価処理パッケージ
+"""
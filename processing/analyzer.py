@@ -1,9 +1,9 @@
 """
 Purpose: THF Motion Scanのメインエントリーポイント
 Responsibility: 動画解析・スコアリング・結果保存の統合処理
-Dependencies: mediapipe, opencv, config.json
+Dependencies: mediapipe, opencv, config.json, landmarks.py, json_io.py, video_io.py
 Created: 2025-10-19 by Claude
-Decision Log: ADR-002
+Decision Log: ADR-002, ADR-010, ADR-011, ADR-012
 
 CRITICAL: config.json閾値参照必須、ハードコード禁止
 """
@@ -12,9 +12,35 @@ import mediapipe as mp
 import numpy as np
 import json
 import argparse
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+# CRITICAL: `python processing/analyzer.py`（ファイル直接実行）でもパッケージ相対importを解決
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    __package__ = 'processing'
+
+from .json_io import dump_json
+from .landmarks import (
+    LANDMARK_DTYPE,
+    NUM_CHANNELS,
+    NUM_LANDMARKS,
+    Y,
+    as_landmark_array,
+    save_landmarks_npz,
+    landmark_list_to_array,
+)
+from .video_io import DECODE_QUEUE_SIZE, FramePreprocessor, decode_frames, open_capture
+
+# 対応する姿勢推定バックエンド
+SUPPORTED_BACKENDS = ('mediapipe',)
+
 class MotionAnalyzer:
     """
     What: THF Motion Scan 分析クラス
@@ -23,11 +49,15 @@ class MotionAnalyzer:
 
     CRITICAL: config.json依存、初期化時に設定読み込み必須
     """
+    # 共有インスタンス（config.jsonパスごと、get_shared()参照）
+    _shared_instances = {}
+    _shared_lock = threading.Lock()
+
     def __init__(self, config_path='config.json'):
         """
         What: MediaPipe初期化とconfig.json読み込み
         Why: 閾値外部化によるデータ整合性保証（ADR-002）
-        Design Decision: config.json一元管理
+        Design Decision: config.json一元管理、model_complexityもconfig.json参照
 
         CRITICAL: config_path変更時は全テスト更新必須
         """
@@ -35,14 +65,28 @@ class MotionAnalyzer:
         with open(config_path, 'r', encoding='utf-8') as f:
             self.config = json.load(f)
 
+        # CRITICAL: MediaPipe設定はconfig.json参照（未設定時はFullモデル）
+        mp_config = self.config.get('mediapipe', {})
+        backend = mp_config.get('backend', 'mediapipe')
+        if backend not in SUPPORTED_BACKENDS:
+            raise ValueError(f"未対応のbackend: {backend}")
+
         self.mp_pose = mp.solutions.pose
         self.pose = self.mp_pose.Pose(
             static_image_mode=False,
-            model_complexity=2,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
+            model_complexity=mp_config.get('model_complexity', 1),
+            min_detection_confidence=mp_config.get('min_detection_confidence', 0.5),
+            min_tracking_confidence=mp_config.get('min_tracking_confidence', 0.5)
         )
-        self.mp_drawing = mp.solutions.drawing_utils
+        # 描画ユーティリティは可視化時のみ遅延ロード（mp_drawingプロパティ参照）
+        self._mp_drawing = None
+
+        # CRITICAL: mp.Poseはスレッド非安全かつ動画単位でトラッキング状態を持つため
+        # 1動画の推論ループ全体を排他制御
+        self._pose_lock = threading.Lock()
+
+        # RGB変換・縮小（モデル入力は256x256のため、高解像度フレームは推論前に縮小）
+        self._preprocess = FramePreprocessor(mp_config.get('max_frame_height'))
         
     def analyze_video(self, video_path, test_type):
         """
@@ -55,7 +99,7 @@ class MotionAnalyzer:
         print(f"🎥 動画を解析中: {video_path}")
         print(f"📋 テストタイプ: {test_type}")
         
-        cap = cv2.VideoCapture(str(video_path))
+        cap = open_capture(video_path, self.config.get('mediapipe', {}).get('hw_decode', True))
         if not cap.isOpened():
             raise ValueError(f"動画を開けません: {video_path}")
         
@@ -65,42 +109,66 @@ class MotionAnalyzer:
         
         print(f"📊 動画情報: {frame_count}フレーム, {fps:.1f}fps, {duration:.1f}秒")
         
-        # フレームごとのランドマークを保存
-        all_landmarks = []
-        frame_idx = 0
+        # CRITICAL: ランドマークはSoA配列（F, 33, 4）に直接格納（ADR-010）
+        # CAP_PROP_FRAME_COUNTは概算値のため、不足時は倍増で拡張
+        landmarks = np.empty((max(frame_count, 1), NUM_LANDMARKS, NUM_CHANNELS), dtype=LANDMARK_DTYPE)
+        detected_mask = np.zeros(len(landmarks), dtype=bool)
+        processed_frames = 0
+
+        # CRITICAL: 間引き時も記録するフレーム番号は元動画の通し番号
+        frame_stride = max(1, int(self.config.get('mediapipe', {}).get('frame_stride', 1)))
+        progress_step = max(1, frame_count // 10)
+        next_progress = progress_step
         
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-            
-            # RGB変換
-            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.pose.process(image)
-            
-            if results.pose_landmarks:
-                landmarks = []
-                for lm in results.pose_landmarks.landmark:
-                    landmarks.append({
-                        'x': lm.x,
-                        'y': lm.y,
-                        'z': lm.z,
-                        'visibility': lm.visibility
-                    })
-                all_landmarks.append({
-                    'frame': frame_idx,
-                    'timestamp': frame_idx / fps,
-                    'landmarks': landmarks
-                })
+        # PHASE CORE LOGIC: デコード（別スレッド）と姿勢推定（本スレッド）を並行実行
+        frame_queue = queue.Queue(maxsize=DECODE_QUEUE_SIZE)
+        stop_event = threading.Event()
+        decoder = threading.Thread(
+            target=decode_frames, args=(cap, frame_queue, stop_event, frame_stride), daemon=True
+        )
+        # CRITICAL: 共有インスタンスのpose推論は排他（例外時もwithでロック解放）
+        with self._pose_lock:
+            try:
+                # CRITICAL: 前の動画のトラッキング状態を破棄（共有インスタンスでも動画ごとに独立した結果）
+                self.pose.reset()
+                decoder.start()
+                while True:
+                    item = frame_queue.get()
+                    if item is None:
+                        break
+                    frame_idx, frame = item
+
+                    # 縮小・RGB変換（事前確保バッファへ書き込み、フレームごとの画像確保を回避）
+                    results = self.pose.process(self._preprocess(frame))
             
-            frame_idx += 1
+                    while frame_idx >= len(landmarks):
+                        landmarks = np.concatenate([landmarks, np.empty_like(landmarks)])
+                        detected_mask = np.concatenate([detected_mask, np.zeros_like(detected_mask)])
+
+                    if results.pose_landmarks:
+                        # 33ランドマーク分を一括コピー（ランドマークごとの代入を回避）
+                        landmarks[frame_idx] = landmark_list_to_array(results.pose_landmarks.landmark)
+                        detected_mask[frame_idx] = True
             
-            # 進捗表示（10%ごと）
-            if frame_idx % max(1, frame_count // 10) == 0:
-                progress = (frame_idx / frame_count) * 100
-                print(f"⏳ 進捗: {progress:.0f}%")
-        
-        cap.release()
+                    processed_frames = frame_idx + 1
+
+                    # 進捗表示（10%ごと、間引き時は区間を跨いだフレームで表示）
+                    # CRITICAL: CAP_PROP_FRAME_COUNTは0・過小の場合あり（0除算・100%超を回避）
+                    if processed_frames >= next_progress:
+                        progress = processed_frames / max(frame_count, processed_frames) * 100
+                        print(f"⏳ 進捗: {progress:.0f}%")
+                        while next_progress <= processed_frames:
+                            next_progress += progress_step
+            finally:
+                # CRITICAL: 例外時（スレッド起動失敗含む）もデコードスレッド停止後にリソース解放
+                stop_event.set()
+                if decoder.ident is not None:
+                    decoder.join()
+                cap.release()
+
+        # 検出成功フレームのみ抽出（フレーム番号は別配列で保持）
+        detected_frames = np.flatnonzero(detected_mask[:processed_frames])
+        all_landmarks = landmarks[detected_frames]
         print(f"✅ 解析完了: {len(all_landmarks)}フレーム検出")
         
         # テストタイプに応じてスコアリング
@@ -115,9 +183,36 @@ class MotionAnalyzer:
             'detected_frames': len(all_landmarks),
             'score': score,
             'landmarks': all_landmarks,
+            'frames': detected_frames,
             'analyzed_at': datetime.now().isoformat()
         }
     
+    @classmethod
+    def get_shared(cls, config_path='config.json'):
+        """
+        What: config.jsonごとに共有MotionAnalyzerインスタンスを取得
+        Why: 複数動画のバッチ処理でMediaPipeグラフ・モデルの再ロードを回避
+        Design Decision: クラス属性dictでパス単位にキャッシュ、生成はロックで排他
+
+        CRITICAL: トラッキング状態はanalyze_video()冒頭でリセット（動画間で引き継がない）
+        """
+        key = str(Path(config_path).resolve())
+        with cls._shared_lock:
+            if key not in cls._shared_instances:
+                cls._shared_instances[key] = cls(config_path)
+            return cls._shared_instances[key]
+
+    @property
+    def mp_drawing(self):
+        """
+        What: MediaPipe描画ユーティリティ（初回アクセス時にロード）
+        Why: ヘッドレスのバッチ処理で描画依存の初期化コストを払わない
+        Design Decision: 遅延ロード + インスタンスキャッシュ
+        """
+        if self._mp_drawing is None:
+            self._mp_drawing = mp.solutions.drawing_utils
+        return self._mp_drawing
+
     def calculate_score(self, landmarks_data, test_type):
         """
         What: テスト種別に応じたスコアリングロジック振り分け
@@ -126,7 +221,7 @@ class MotionAnalyzer:
 
         CRITICAL: 新規テスト追加時は対応メソッド実装必須
         """
-        if not landmarks_data:
+        if len(landmarks_data) == 0:
             return {'total': 0, 'details': '姿勢が検出できませんでした'}
         
         if test_type == 'pelvic_stability':
@@ -142,26 +237,20 @@ class MotionAnalyzer:
 
         CRITICAL: 閾値変更はconfig.jsonのみ、ここでのハードコード禁止
         """
-        # PHASE CORE LOGIC: 骨盤傾き計算（landmarks 23, 24）
-        hip_angles = []
+        # PHASE CORE LOGIC: 骨盤傾き計算（landmarks 23, 24、SoA一括計算、ADR-010）
+        arr = as_landmark_array(landmarks_data)
+        hip_tilts = np.abs(arr[:, 23, Y] - arr[:, 24, Y])
+        hip_tilts = hip_tilts[~np.isnan(hip_tilts)]
 
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > 24:
-                left_hip = landmarks[23]
-                right_hip = landmarks[24]
-
-                # 骨盤の傾き（Y座標の差）を計算
-                hip_tilt = abs(left_hip['y'] - right_hip['y'])
-                hip_angles.append(hip_tilt)
-
-        if not hip_angles:
+        if hip_tilts.size == 0:
             return {'total': 0, 'details': '腰のランドマークが検出できませんでした'}
 
-        # 統計値計算
-        avg_tilt = np.mean(hip_angles)
-        max_tilt = np.max(hip_angles)
-        std_tilt = np.std(hip_angles)
+        # 統計値計算（平均は1回のみ計算し、標準偏差は偏差の内積から算出）
+        # CRITICAL: sum_sq/n - mean**2形式は桁落ちするため使用禁止
+        avg_tilt = hip_tilts.mean()
+        max_tilt = hip_tilts.max()
+        centered = hip_tilts - avg_tilt
+        std_tilt = np.sqrt(np.dot(centered, centered) / hip_tilts.size)
 
         # CRITICAL: config.json閾値参照（ハードコード禁止）
         thresholds = self.config['thresholds']['pelvic_stability']
@@ -190,7 +279,7 @@ class MotionAnalyzer:
                 'avg_tilt': float(avg_tilt),
                 'max_tilt': float(max_tilt),
                 'std_tilt': float(std_tilt),
-                'frames_analyzed': len(hip_angles)
+                'frames_analyzed': int(hip_tilts.size)
             }
         }
     
@@ -205,21 +294,94 @@ class MotionAnalyzer:
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # CRITICAL: 並列解析時の同一秒内保存で上書きしないようマイクロ秒まで付与
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
         filename = f"{results['test_type']}_{timestamp}.json"
         filepath = output_path / filename
+
+        # CRITICAL: ランドマークは同名.npzサイドカーにint16量子化で保存（ADR-011）
+        # JSONにはサイドカーのファイル名のみ記録、復元はlandmarks.load_landmarks_npz()
+        landmarks_path = filepath.with_suffix('.npz')
+        save_landmarks_npz(landmarks_path, results['landmarks'], results['frames'], results['fps'])
+
+        serializable = {k: v for k, v in results.items() if k not in ('landmarks', 'frames')}
+        serializable['landmarks_file'] = landmarks_path.name
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # orjson利用可能時は高速シリアライズ（ADR-012）
+        dump_json(serializable, filepath)
         
         print(f"💾 結果を保存: {filepath}")
         return filepath
 
+def _analyze_in_worker(config_path, video_path, test_type, output_dir):
+    """
+    What: ワーカープロセスで1動画を解析（batch_analyze()用）
+    Why: プロセスごとに独立したMediaPipeグラフで並列実行
+    Design Decision: プロセス内ではget_shared()で解析器を再利用
+
+    CRITICAL: 例外は呼び出し元へ返さず結果dictのerrorに格納（他動画の処理継続）
+    """
+    try:
+        analyzer = MotionAnalyzer.get_shared(config_path)
+        results = analyzer.analyze_video(video_path, test_type)
+        if output_dir:
+            analyzer.save_results(results, output_dir)
+        return results
+    except Exception as e:
+        return {'video_path': str(video_path), 'test_type': test_type, 'error': str(e)}
+
+
+def batch_analyze(video_paths, test_type, workers=None,
+                  config_path='config.json', output_dir=None):
+    """
+    What: 複数動画をプロセスプールで並列解析
+    Why: 単一プロセスの解析器では多数動画のバッチ処理がボトルネック
+    Design Decision: spawnコンテキストのProcessPoolExecutor、結果は入力順で返却
+
+    Args:
+        video_paths: 動画パスのリスト
+        test_type: テストタイプ
+        workers: プロセス数（None: min(動画数, CPUコア数)）
+        config_path: config.jsonのパス
+        output_dir: 指定時は各ワーカーで結果を保存
+
+    Returns:
+        List[Dict]: analyze_video()の結果（失敗時は{'video_path', 'test_type', 'error'}）
+
+    CRITICAL: MediaPipeグラフはfork安全でないためspawn必須
+    """
+    video_paths = [str(p) for p in video_paths]
+    if not video_paths:
+        return []
+    if workers is None:
+        workers = min(len(video_paths), os.cpu_count() or 1)
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        futures = [
+            executor.submit(_analyze_in_worker, config_path, video_path, test_type, output_dir)
+            for video_path in video_paths
+        ]
+        return [future.result() for future in futures]
+
+
+def _print_summary(results):
+    print("\n" + "=" * 60)
+    print("📊 解析結果サマリー")
+    print("=" * 60)
+    print(f"スコア: {results['score']['total']}/3")
+    print(f"レベル: {results['score'].get('level', 'N/A')}")
+    print(f"詳細: {json.dumps(results['score']['details'], indent=2, ensure_ascii=False)}")
+    print("=" * 60)
+
+
 def main():
     parser = argparse.ArgumentParser(description='THF Motion Scan - 動画解析ツール')
-    parser.add_argument('--input', required=True, help='入力動画のパス')
+    parser.add_argument('--input', required=True, nargs='+', help='入力動画のパス（複数指定可）')
     parser.add_argument('--test', required=True, help='テストタイプ (例: pelvic_stability)')
     parser.add_argument('--output', default='processing/output', help='出力ディレクトリ')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='並列プロセス数（2以上で複数動画をプロセスプールで解析）')
     
     args = parser.parse_args()
     
@@ -227,24 +389,29 @@ def main():
     print("🏒 THF Motion Scan - 動画解析ツール")
     print("=" * 60)
     
-    analyzer = MotionAnalyzer()
+    if args.workers > 1 and len(args.input) > 1:
+        # 複数動画をプロセスプールで並列解析
+        for results in batch_analyze(args.input, args.test, args.workers,
+                                     output_dir=args.output):
+            if 'error' in results:
+                print(f"❌ エラー: {results['video_path']}: {results['error']}")
+            else:
+                _print_summary(results)
+        return
+
+    # 複数動画でMediaPipeモデルを再利用
+    analyzer = MotionAnalyzer.get_shared()
     
-    try:
-        results = analyzer.analyze_video(args.input, args.test)
-        analyzer.save_results(results, args.output)
-        
-        print("\n" + "=" * 60)
-        print("📊 解析結果サマリー")
-        print("=" * 60)
-        print(f"スコア: {results['score']['total']}/3")
-        print(f"レベル: {results['score'].get('level', 'N/A')}")
-        print(f"詳細: {json.dumps(results['score']['details'], indent=2, ensure_ascii=False)}")
-        print("=" * 60)
-        
-    except Exception as e:
-        print(f"❌ エラー: {e}")
-        import traceback
-        traceback.print_exc()
+    for video_path in args.input:
+        try:
+            results = analyzer.analyze_video(video_path, args.test)
+            analyzer.save_results(results, args.output)
+            _print_summary(results)
+            
+        except Exception as e:
+            print(f"❌ エラー: {e}")
+            import traceback
+            traceback.print_exc()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
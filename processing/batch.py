@@ -0,0 +1,85 @@
+"""
+Purpose: 複数動画ランドマークの品質チェック・正規化の並列実行
+Responsibility: HealthChecker品質チェックとBodyNormalizer代表値計算をプロセスプールで動画単位に分散
+Dependencies: numpy, concurrent.futures, health_check.py, normalizer.py, landmarks.py
+Created: 2026-10-15 by Claude
+Decision Log: ADR-004, ADR-010, ADR-013
+
+CRITICAL: 各ワーカープロセスでrandom_seed適用必須（乱数状態はプロセス間で共有されない）
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from .health_check import HealthChecker, apply_random_seed
+from .landmarks import LandmarkInput, load_landmarks_mmap
+from .normalizer import get_shared_normalizer
+
+# 動画ごとの入力（ランドマークデータ、またはsave_landmarks_npy()で保存した.npyパス）
+ClipInput = Union[LandmarkInput, str, Path]
+
+
+def check_and_normalize(clip: ClipInput, config_path: str = 'config.json') -> Dict:
+    """
+    What: 1動画分の品質チェックと正規化基準代表値の計算
+    Why: バッチ処理の動画単位（プロセスプールの1タスク）
+    Design Decision: .npyパス入力はワーカー側でメモリマップ参照（配列のpickle転送を回避、ADR-010）
+
+    Args:
+        clip: ランドマークデータ、または.npyファイルパス
+        config_path: config.jsonのパス
+
+    Returns:
+        Dict: {'is_quality_ok': bool, 'health_check': Dict, 'normalization': Dict}
+
+    CRITICAL: warningsは動画ごとのHealthCheckerに記録（プロセス間で集約しない）
+    """
+    if isinstance(clip, (str, Path)):
+        clip = load_landmarks_mmap(clip)
+
+    is_quality_ok, quality_result = HealthChecker(config_path).check_landmark_quality(clip)
+    rep_values, _ = get_shared_normalizer(config_path).normalize_landmarks_sequence(clip)
+
+    return {
+        'is_quality_ok': is_quality_ok,
+        'health_check': quality_result,
+        'normalization': rep_values
+    }
+
+
+def batch_check_and_normalize(clips: Sequence[ClipInput],
+                              workers: Optional[int] = None,
+                              config_path: str = 'config.json') -> List[Dict]:
+    """
+    What: 複数動画の品質チェック・正規化をプロセスプールで並列実行
+    Why: 動画単位で独立した処理を直列実行するとCPUコアが遊ぶ
+    Design Decision: spawnコンテキストのProcessPoolExecutor、結果は入力順で返却（analyzer.batch_analyze()と同一）、
+                     workers=1はプールを起動せず同一プロセスで実行
+
+    Args:
+        clips: 動画ごとのランドマークデータ、または.npyファイルパス
+        workers: プロセス数（None: min(動画数, CPUコア数)）
+        config_path: config.jsonのパス
+
+    Returns:
+        List[Dict]: 動画順のcheck_and_normalize()結果
+
+    CRITICAL: 各ワーカーの初期化時にapply_random_seed()を実行（ADR-004）
+    """
+    if not clips:
+        return []
+    if workers is None:
+        workers = min(len(clips), os.cpu_count() or 1)
+
+    if workers <= 1:
+        apply_random_seed(config_path)
+        return [check_and_normalize(clip, config_path) for clip in clips]
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=apply_random_seed,
+                             initargs=(config_path,)) as executor:
+        futures = [executor.submit(check_and_normalize, clip, config_path) for clip in clips]
+        return [future.result() for future in futures]
@@ -0,0 +1,51 @@
+"""
+Purpose: config.json読み込みの共通処理
+Responsibility: 解析済み設定のプロセス内キャッシュ
+Dependencies: config.json, json_io.py
+Created: 2026-10-15 by Claude
+Decision Log: ADR-002, ADR-012, ADR-013
+
+CRITICAL: 返却する設定dictは共有オブジェクト（読み取り専用、変更禁止）
+"""
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Tuple
+
+from .json_io import load_json
+
+
+def config_cache_key(config_path: str) -> Tuple[str, int]:
+    """
+    What: config.jsonのキャッシュキー（絶対パス, 更新時刻）を生成
+    Why: ファイル更新後に古い設定を返さないようにする
+    Design Decision: st_mtime_nsをキーに含め、更新時は自動で再読み込み（ADR-013）
+
+    CRITICAL: ファイルが存在しない場合は既存と同一メッセージでFileNotFoundError
+    """
+    config_file = Path(config_path)
+    if not config_file.exists():
+        raise FileNotFoundError(f"config.json not found: {config_path}")
+
+    return str(config_file.resolve()), config_file.stat().st_mtime_ns
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(resolved_path: str, mtime_ns: int) -> Dict:
+    return load_json(resolved_path)
+
+
+def load_config(config_path: str = 'config.json') -> Dict:
+    """
+    What: config.jsonを読み込み（同一ファイルは解析結果を再利用）
+    Why: 評価器インスタンスごとのファイルI/O・JSON解析の重複排除
+    Design Decision: (絶対パス, 更新時刻)単位のlru_cache（ADR-013）
+
+    Args:
+        config_path: config.jsonのパス
+
+    Returns:
+        Dict: 解析済み設定（共有オブジェクト）
+
+    CRITICAL: 戻り値は変更禁止（全インスタンスで共有されるため）
+    """
+    return _load_config_cached(*config_cache_key(config_path))
@@ -0,0 +1,70 @@
+"""
+Purpose: 関節角度のバッチ計算
+Responsibility: SoA配列から全フレーム分・複数関節分の3点角度を一括算出
+Dependencies: numpy
+Created: 2026-10-15 by Claude
+Decision Log: ADR-010
+
+CRITICAL: 計算不能（NaN入力・ゼロ長ベクトル）はNaNで返す（行削除禁止）
+"""
+from typing import Sequence, Union
+
+import numpy as np
+
+LandmarkIndex = Union[int, Sequence[int]]
+
+
+def joint_angles(proximal: np.ndarray,
+                 joint: np.ndarray,
+                 distal: np.ndarray) -> np.ndarray:
+    """
+    What: 3点（proximal-joint-distal）の関節角度を全フレーム一括計算
+    Why: フレームごとのnp.array生成・np.dot呼び出しのオーバーヘッド排除
+    Design Decision: 最終軸を座標として内積・ノルムを一括リダクション（ADR-010）
+
+    Args:
+        proximal: shape (..., D) 例: hip
+        joint: shape (..., D) 例: knee
+        distal: shape (..., D) 例: ankle
+
+    Returns:
+        np.ndarray: shape (...), 角度（度）、計算不能はNaN
+
+    CRITICAL: ゼロ長ベクトルはNaN（スカラー版_calculate_*_angleのNone相当）
+    """
+    # CRITICAL: float32入力でもfloat64で計算（arccosは0°付近で桁落ちするため）
+    v1 = np.subtract(proximal, joint, dtype=np.float64)
+    v2 = np.subtract(distal, joint, dtype=np.float64)
+
+    dot = (v1 * v2).sum(axis=-1)
+    den = np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1)
+
+    # CRITICAL: ゼロ除算回避（分母0はNaN扱い）
+    valid = den > 0
+    cos_angle = np.divide(dot, den, out=np.full_like(dot, np.nan), where=valid)
+    cos_angle = np.clip(cos_angle, -1.0, 1.0)  # 数値誤差対策
+
+    return np.degrees(np.arccos(cos_angle))
+
+
+def batch_joint_angles(lm: np.ndarray,
+                       proximal: LandmarkIndex,
+                       joint: LandmarkIndex,
+                       distal: LandmarkIndex) -> np.ndarray:
+    """
+    What: 複数関節の角度を全フレーム × 全関節で一括計算
+    Why: 関節ごとのjoint_angles()呼び出しを1回のNumPy演算に集約
+    Design Decision: インデックス配列によるfancy indexingで(F, J, D)を構築（ADR-010）
+
+    Args:
+        lm: shape (F, 33, D) ランドマーク座標（D=2でx, y）
+        proximal: proximal側ランドマークインデックス（intまたは長さJの列）
+        joint: 関節ランドマークインデックス（同上）
+        distal: distal側ランドマークインデックス（同上）
+
+    Returns:
+        np.ndarray: int指定時はshape (F,)、列指定時はshape (F, J)、計算不能はNaN
+
+    CRITICAL: proximal/joint/distalは同一長であること
+    """
+    return joint_angles(lm[:, proximal], lm[:, joint], lm[:, distal])
@@ -0,0 +1,166 @@
+"""
+Purpose: 評価処理の数値カーネル
+Responsibility: NumPy実装（既定）と長い時系列向けnumba JITカーネルの切り替え
+Dependencies: numpy, numba（任意、_kernels_numba.py）, _angles.py
+Created: 2026-10-15 by Claude
+Decision Log: ADR-010, ADR-012
+
+CRITICAL: numba有無で同一結果（計算不能はNaN）を返すこと、fastmath禁止（NaN判定が壊れる）
+"""
+import importlib.util
+from typing import Tuple
+
+import numpy as np
+
+from ._angles import batch_joint_angles
+
+# CRITICAL: numba本体のimport（約0.1秒）はJITカーネル初回使用時まで遅延（起動時間短縮）
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# JITカーネルを使う最小フレーム数（未満はNumPy実装）
+# 計測（左右膝角度、1コア）: NumPy約0.3µs/フレーム、JIT約0.1µs/フレーム、
+# 初回コンパイル約2.5秒（プロセスごと）・キャッシュ読み込み約0.45秒（numba import含む）
+# → キャッシュ読み込み分を1回の呼び出しで回収できる約220万フレーム以上のみJIT（通常の動画は常にNumPy）
+JIT_MIN_FRAMES = 2_500_000
+
+JointIndices = Tuple[int, int, int]
+
+# 左右集約モード
+_PAIR_MIN = 0
+_PAIR_MAX = 1
+_PAIR_MEAN = 2
+
+
+def _use_jit(n_frames: int) -> bool:
+    """
+    What: JITカーネルを使うか判定
+    Why: 数千フレームの動画ではコンパイル・キャッシュ読み込み時間が計算時間の短縮を上回る
+    Design Decision: numba利用可能かつJIT_MIN_FRAMES以上の場合のみ（ADR-012）
+    """
+    return NUMBA_AVAILABLE and n_frames >= JIT_MIN_FRAMES
+
+
+def _jit():
+    """
+    What: numba JITカーネルモジュールを取得
+    Why: numba本体のimportを初回使用時まで遅延
+    Design Decision: 2回目以降はsys.modulesから取得（ADR-012）
+    """
+    from . import _kernels_numba
+    return _kernels_numba
+
+
+def paired_joint_angles(lm: np.ndarray,
+                        left: JointIndices,
+                        right: JointIndices) -> np.ndarray:
+    """
+    What: 左右関節角度を集約せずに全フレーム一括計算
+    Why: 左右両方の角度を使う評価（軸脚判定 + 左右差）で角度計算を1回に集約
+    Design Decision: batch_joint_angles()、JIT_MIN_FRAMES以上かつnumba利用可能時のみJIT並列カーネル（ADR-012）
+
+    Args:
+        lm: shape (F, 33, D) ランドマーク座標（D=2でx, y）
+        left: 左側の(proximal, joint, distal)インデックス
+        right: 右側の(proximal, joint, distal)インデックス
+
+    Returns:
+        np.ndarray: shape (F, 2), 列は(左, 右)の角度（度）、計算不能はNaN
+    """
+    if _use_jit(len(lm)):
+        return _jit().paired_joint_angles(lm, *left, *right)
+    return batch_joint_angles(lm, *zip(left, right))
+
+
+def _pair_joint_angles(lm: np.ndarray,
+                       left: JointIndices,
+                       right: JointIndices,
+                       mode: int) -> np.ndarray:
+    """
+    What: 左右関節角度を計算し、フレームごとに左右を1値へ集約
+    Why: 評価器ごとの左右集約（min/max/平均）を同一カーネルで共通化
+    Design Decision: NumPy実装、min集約のみJIT_MIN_FRAMES以上かつnumba利用可能時にJIT並列カーネル
+                     （max/平均集約のJumpLanding・PushPullは短いクリップのみのためJITなし、ADR-012）
+
+    CRITICAL: 左右どちらかが計算不能ならNaN
+    """
+    if mode == _PAIR_MIN and _use_jit(len(lm)):
+        return _jit().min_joint_angles(lm, *left, *right)
+
+    # 左右を(F, 2)として1回で計算
+    angles = batch_joint_angles(lm, *zip(left, right))
+    left_angles, right_angles = angles[:, 0], angles[:, 1]
+    if mode == _PAIR_MIN:
+        return np.minimum(left_angles, right_angles)
+    if mode == _PAIR_MAX:
+        return np.maximum(left_angles, right_angles)
+    return 0.5 * (left_angles + right_angles)
+
+
+def min_joint_angles(lm: np.ndarray,
+                     left: JointIndices,
+                     right: JointIndices) -> np.ndarray:
+    """
+    What: 左右関節角度の小さい方を全フレーム一括計算
+    Why: 軸脚判定（より曲がっている側）の毎フレーム計算を1パスに融合
+    Design Decision: _pair_joint_angles()のmin集約（ADR-012）
+
+    Args:
+        lm: shape (F, 33, D) ランドマーク座標（D=2でx, y）
+        left: 左側の(proximal, joint, distal)インデックス
+        right: 右側の(proximal, joint, distal)インデックス
+
+    Returns:
+        np.ndarray: shape (F,), 角度（度）、左右どちらかが計算不能ならNaN
+    """
+    return _pair_joint_angles(lm, left, right, _PAIR_MIN)
+
+
+def max_joint_angles(lm: np.ndarray,
+                     left: JointIndices,
+                     right: JointIndices) -> np.ndarray:
+    """
+    What: 左右関節角度の大きい方を全フレーム一括計算
+    Why: 伸展している側（プッシュ時の肘等）の毎フレーム計算を1パスに融合
+    Design Decision: _pair_joint_angles()のmax集約（ADR-012）
+
+    Returns:
+        np.ndarray: shape (F,), 角度（度）、左右どちらかが計算不能ならNaN
+    """
+    return _pair_joint_angles(lm, left, right, _PAIR_MAX)
+
+
+def mean_joint_angles(lm: np.ndarray,
+                      left: JointIndices,
+                      right: JointIndices) -> np.ndarray:
+    """
+    What: 左右関節角度の平均を全フレーム一括計算
+    Why: 両脚で吸収する動作（着地時の膝等）の毎フレーム計算を1パスに融合
+    Design Decision: _pair_joint_angles()の平均集約（ADR-012）
+
+    Returns:
+        np.ndarray: shape (F,), 角度（度）、左右どちらかが計算不能ならNaN
+    """
+    return _pair_joint_angles(lm, left, right, _PAIR_MEAN)
+
+
+def nan_min_max_mean(values: np.ndarray) -> Tuple[float, float, float, int]:
+    """
+    What: 非有限値（NaN・inf）を除いた最小・最大・平均・有効数を集計
+    Why: 評価器ごとの欠損除外 + min/max/mean集計を共通化
+    Design Decision: NumPy実装のみ（1k要素程度ではJITのコンパイル時間を回収できない、ADR-012）
+
+    Args:
+        values: shape (F,) 時系列（計算不能フレームはNaN）
+
+    Returns:
+        Tuple[float, float, float, int]: (最小, 最大, 平均, 有効フレーム数)
+            有効フレームが0の場合は(NaN, NaN, NaN, 0)
+
+    CRITICAL: 平均はfloat64で累積（float32時系列でも桁落ちさせない）、
+              infを含めると最大値・平均が壊れるためNaNと同様に除外
+    """
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return np.nan, np.nan, np.nan, 0
+    return (float(finite.min()), float(finite.max()),
+            float(finite.mean(dtype=np.float64)), int(finite.size))
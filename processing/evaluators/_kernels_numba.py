@@ -0,0 +1,63 @@
+"""
+Purpose: 評価処理のnumba JITカーネル
+Responsibility: 関節角度のJIT並列カーネル定義
+Dependencies: numpy, numba
+Created: 2026-10-15 by Claude
+Decision Log: ADR-012
+
+CRITICAL: _kernels.pyからJIT_MIN_FRAMES以上の時系列で初回使用時のみimport（numba未導入環境ではimportしない）、
+          ディスクキャッシュはNUMBA_CACHE_DIR設定時のみ（未設定時はパッケージ配下への書き込みを行わない）、
+          fastmath禁止（NaN判定が壊れる）、結果はNumPy実装と同一であること
+"""
+import math
+import os
+
+import numba
+import numpy as np
+
+# CRITICAL: cache=Trueは既定で__pycache__（パッケージ配下）へ書き込むため、
+# 読み込み専用ファイルシステム（Lambda等）ではキャッシュ先の明示指定時のみ有効化
+_CACHE = bool(os.environ.get('NUMBA_CACHE_DIR'))
+
+
+@numba.njit(inline='always')
+def _angle_at(lm, i, p, j, d):
+    # 2点ベクトルの内積・ノルムを一時配列なしで計算（float64）
+    dot = 0.0
+    n1 = 0.0
+    n2 = 0.0
+    for c in range(lm.shape[2]):
+        a = np.float64(lm[i, p, c]) - np.float64(lm[i, j, c])
+        b = np.float64(lm[i, d, c]) - np.float64(lm[i, j, c])
+        dot += a * b
+        n1 += a * a
+        n2 += b * b
+    den = math.sqrt(n1) * math.sqrt(n2)
+    # CRITICAL: NaN入力・ゼロ長ベクトルはNaN
+    if not den > 0.0:
+        return np.nan
+    cos_angle = min(1.0, max(-1.0, dot / den))
+    return math.degrees(math.acos(cos_angle))
+
+
+@numba.njit(parallel=True, cache=_CACHE)
+def min_joint_angles(lm, lp, lj, ld, rp, rj, rd):
+    out = np.empty(lm.shape[0], dtype=np.float64)
+    for i in numba.prange(lm.shape[0]):
+        left = _angle_at(lm, i, lp, lj, ld)
+        right = _angle_at(lm, i, rp, rj, rd)
+        # CRITICAL: 片側NaNはNaN（np.minimumと同一）
+        if math.isnan(left) or math.isnan(right):
+            out[i] = np.nan
+        else:
+            out[i] = min(left, right)
+    return out
+
+
+@numba.njit(parallel=True, cache=_CACHE)
+def paired_joint_angles(lm, lp, lj, ld, rp, rj, rd):
+    out = np.empty((lm.shape[0], 2), dtype=np.float64)
+    for i in numba.prange(lm.shape[0]):
+        out[i, 0] = _angle_at(lm, i, lp, lj, ld)
+        out[i, 1] = _angle_at(lm, i, rp, rj, rd)
+    return out
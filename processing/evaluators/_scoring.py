@@ -0,0 +1,106 @@
+"""
+Purpose: 閾値バンドによるスコア判定
+Responsibility: if/elifの段階スコアリングを事前計算バンド + 二分探索で共通化、スコアラベル定義
+Dependencies: numpy
+Created: 2026-10-15 by Claude
+Decision Log: ADR-002
+
+CRITICAL: 境界値の扱い（以上/以下）は既存if/elifラダーと同一であること、
+          非有限値（NaN・inf）は0点（searchsortedはNaNを全境界の後ろに置くため事前判定）
+"""
+import math
+from typing import Sequence
+
+import numpy as np
+
+# スコア（0-3）ごとの評価ラベル（SCORE_LEVELS[score]で参照）
+SCORE_LEVELS = ("要トレーニング", "改善の余地あり", "良好", "優秀")
+
+# 評価詳細メッセージの計算不可表示
+NO_DATA = "(データなし)"
+
+
+def score_bands(bands: Sequence[float]) -> np.ndarray:
+    """
+    What: スコア境界値を昇順のfloat64配列に変換
+    Why: 評価器__init__で1回だけ閾値派生値（*0.8, +10等）を計算
+    Design Decision: float64保持（Python float比較と境界判定を一致させる）
+
+    CRITICAL: bandsは昇順であること
+    """
+    arr = np.asarray(bands, dtype=np.float64)
+    if np.any(np.diff(arr) < 0):
+        raise ValueError(f"score bands must be ascending: {bands}")
+    return arr
+
+
+def score_at_least(value: float, bands: np.ndarray) -> int:
+    """
+    What: 値が高いほど高得点のスコア判定
+    Why: `if value >= bands[-1]: 3 elif value >= bands[-2]: 2 ...`の置き換え
+    Design Decision: value以下の境界数 = スコア（np.searchsorted side='right'）
+
+    Args:
+        value: 測定値
+        bands: score_bands()の昇順境界（例: [min*0.6, min*0.8, min]）
+
+    Returns:
+        int: 0〜len(bands)、非有限値は0
+    """
+    if not math.isfinite(value):
+        return 0
+    return int(np.searchsorted(bands, value, side='right'))
+
+
+def score_at_most(value: float, bands: np.ndarray) -> int:
+    """
+    What: 値が低いほど高得点のスコア判定
+    Why: `if value <= bands[0]: 3 elif value <= bands[1]: 2 ...`の置き換え
+    Design Decision: value以上の境界数 = スコア（np.searchsorted side='left'）
+
+    Args:
+        value: 測定値
+        bands: score_bands()の昇順境界（例: [min, min+10, min+20]）
+
+    Returns:
+        int: 0〜len(bands)、非有限値は0
+    """
+    if not math.isfinite(value):
+        return 0
+    return len(bands) - int(np.searchsorted(bands, value, side='left'))
+
+
+def score_above(value: float, bands: np.ndarray) -> int:
+    """
+    What: 値が高いほど高得点のスコア判定（境界ちょうどは下位スコア）
+    Why: `if value > bands[-1]: 3 elif value > bands[-2]: 2 ...`の置き換え
+    Design Decision: value未満の境界数 = スコア（np.searchsorted side='left'）
+
+    Args:
+        value: 測定値
+        bands: score_bands()の昇順境界（例: [th*0.5, th*0.75, th]）
+
+    Returns:
+        int: 0〜len(bands)、非有限値は0
+    """
+    if not math.isfinite(value):
+        return 0
+    return int(np.searchsorted(bands, value, side='left'))
+
+
+def score_below(value: float, bands: np.ndarray) -> int:
+    """
+    What: 値が低いほど高得点のスコア判定（境界ちょうどは下位スコア）
+    Why: `if value < bands[0]: 3 elif value < bands[1]: 2 ...`の置き換え
+    Design Decision: valueより大きい境界数 = スコア（np.searchsorted side='right'）
+
+    Args:
+        value: 測定値
+        bands: score_bands()の昇順境界（例: [excellent, good, improvement]）
+
+    Returns:
+        int: 0〜len(bands)、非有限値は0
+    """
+    if not math.isfinite(value):
+        return 0
+    return len(bands) - int(np.searchsorted(bands, value, side='right'))
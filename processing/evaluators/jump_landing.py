@@ -1,19 +1,20 @@
 """
 Purpose: ジャンプランディング評価ロジック
 Responsibility: ジャンプ高さと着地時膝屈曲角度からジャンプランディングを評価
-Dependencies: numpy, config.json, normalizer.py
+Dependencies: numpy, config.json, config_loader.py, normalizer.py, landmarks.py, _kernels.py, _scoring.py
 Created: 2025-10-19 by Claude
-Decision Log: ADR-002, ADR-003
+Decision Log: ADR-002, ADR-003, ADR-010, ADR-012, ADR-013
 
 CRITICAL: config.json閾値参照必須、正規化処理統合必須
 """
 import numpy as np
-import json
-from pathlib import Path
-from typing import List, Dict, Optional
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-from normalizer import BodyNormalizer, normalize_value
+from typing import List, Dict, Tuple
+
+from ..config_loader import load_config
+from ..landmarks import LandmarkInput, X, Y, as_landmark_array
+from ..normalizer import get_shared_normalizer, normalize_value
+from ._kernels import mean_joint_angles, nan_min_max_mean
+from ._scoring import NO_DATA, SCORE_LEVELS, score_at_least, score_at_most, score_bands
 
 
 class JumpLandingEvaluator:
@@ -37,26 +38,31 @@ class JumpLandingEvaluator:
         """
         What: config.json読み込みと閾値初期化
         Why: 閾値外部化によるデータ整合性保証（ADR-002）
-        Design Decision: デフォルトパスでルート直下config.json参照
+        Design Decision: デフォルトパスでルート直下config.json参照、読み込み結果は共有
 
         Args:
             config_path: config.jsonのパス
 
         CRITICAL: config_path変更時は全テスト更新必須
         """
-        # PHASE CORE LOGIC: config.json読み込み
-        config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"config.json not found: {config_path}")
-
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # PHASE CORE LOGIC: config.json読み込み（プロセス内キャッシュ、ADR-013）
+        self.config = load_config(config_path)
 
         # CRITICAL: jump_landing閾値取得（ADR-002参照）
         self.thresholds = self.config['thresholds']['jump_landing']
-        self.normalizer = BodyNormalizer(config_path)
+        self.normalizer = get_shared_normalizer(config_path)
 
-    def evaluate(self, landmarks_data: List[Dict]) -> Dict:
+        # スコア境界の事前計算（閾値派生値はインスタンス生成時に1回のみ）
+        jump_height_ratio_min = self.thresholds['jump_height_ratio_min']
+        self._jump_height_bands = score_bands([
+            jump_height_ratio_min * 0.5, jump_height_ratio_min * 0.75, jump_height_ratio_min
+        ])
+        knee_flexion_max = self.thresholds['knee_flexion_max']
+        self._knee_flexion_bands = score_bands([
+            knee_flexion_max, knee_flexion_max + 10, knee_flexion_max + 20
+        ])
+
+    def evaluate(self, landmarks_data: LandmarkInput) -> Dict:
         """
         What: ジャンプランディング総合評価
         Why: ジャンプ高さと着地時膝屈曲の2指標を評価
@@ -75,7 +81,7 @@ class JumpLandingEvaluator:
 
         CRITICAL: landmarks_data空の場合はスコア0を返す（例外投げない）
         """
-        if not landmarks_data:
+        if len(landmarks_data) == 0:
             return {
                 'score': 0,
                 'jump_height': {'score': 0, 'ratio': None},
@@ -83,15 +89,72 @@ class JumpLandingEvaluator:
                 'details': '姿勢が検出できませんでした'
             }
 
+        # PHASE CORE LOGIC: 2指標の時系列をSoA配列から一括計算（ADR-010）
+        lm = as_landmark_array(landmarks_data)
+        hip_heights, knee_angles = self._compute_all(lm)
+
+        return self._evaluate_series(lm, hip_heights, knee_angles)
+
+    def evaluate_batch(self, clips: List[List[Dict]]) -> List[Dict]:
+        """
+        What: 複数動画のジャンプランディング一括評価
+        Why: データセット単位の評価で時系列計算カーネルの起動を1回に集約
+        Design Decision: 全クリップを連結して_compute_all()を1回実行（角度計算のNumPy演算を全フレーム一括で実行）、
+                         正規化・集計はクリップ単位（ADR-010, ADR-012）
+
+        Args:
+            clips: クリップごとのランドマークデータ（各要素はevaluate()の入力と同形式）
+
+        Returns:
+            List[Dict]: クリップ順のevaluate()結果
+
+        CRITICAL: 結果はクリップごとにevaluate()を呼んだ場合と同一であること
+        """
+        arrays = [as_landmark_array(clip) for clip in clips]
+        if not arrays:
+            return []
+
+        # PHASE CORE LOGIC: 連結配列で時系列を一括計算し、クリップ境界で分割
+        hip_heights, knee_angles = self._compute_all(np.concatenate(arrays))
+        bounds = np.cumsum([len(arr) for arr in arrays])[:-1]
+
+        results = []
+        for clip, arr, clip_hip_heights, clip_knee_angles in zip(
+            clips, arrays, np.split(hip_heights, bounds), np.split(knee_angles, bounds)
+        ):
+            # CRITICAL: 空クリップはevaluate()と同一のスコア0結果
+            if len(clip) == 0:
+                results.append(self.evaluate(clip))
+            else:
+                results.append(self._evaluate_series(arr, clip_hip_heights, clip_knee_angles))
+
+        return results
+
+    def _evaluate_series(self,
+                         lm: np.ndarray,
+                         hip_heights: np.ndarray,
+                         knee_angles: np.ndarray) -> Dict:
+        """
+        What: 計算済み時系列から2指標を評価し総合結果を生成
+        Why: evaluate()とevaluate_batch()で評価・集計処理を共通化
+        Design Decision: 正規化はSoA配列から、指標は時系列から算出（ADR-002, ADR-003, ADR-010）
+
+        Args:
+            lm: shape (F, 33, 4) ランドマーク配列（正規化用、_compute_all()の入力と共有）
+            hip_heights: _compute_all()の腰の高さ時系列
+            knee_angles: _compute_all()の両膝平均角度時系列
+
+        Returns:
+            Dict: evaluate()と同一形式
+        """
         # CRITICAL: 正規化処理（ADR-003）
-        rep_values, _ = self.normalizer.normalize_landmarks_sequence(landmarks_data)
+        rep_values, _ = self.normalizer.normalize_landmarks_sequence(lm)
 
-        # PHASE CORE LOGIC: 2指標評価
         # 1. ジャンプ高さ評価
-        height_result = self._evaluate_jump_height(landmarks_data, rep_values)
+        height_result = self._evaluate_jump_height(hip_heights, rep_values)
 
         # 2. 着地時膝屈曲角度評価
-        flexion_result = self._evaluate_landing_knee_flexion(landmarks_data)
+        flexion_result = self._evaluate_landing_knee_flexion(knee_angles)
 
         # 3. 総合スコアの計算（2指標全て満たす必要がある）
         total_score = min(height_result['score'], flexion_result['score'])
@@ -103,12 +166,42 @@ class JumpLandingEvaluator:
             'details': self._generate_details(total_score, height_result, flexion_result)
         }
 
-    def _evaluate_jump_height(self, landmarks_data: List[Dict], rep_values: Dict) -> Dict:
+    def _compute_all(self, lm: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        What: 腰の高さと両膝平均角度の時系列を一括計算
+        Why: 指標ごとのランドマーク走査を1回に集約
+        Design Decision: SoA配列から必要な列のみ参照（ADR-010）
+
+        Args:
+            lm: shape (F, 33, 4) ランドマーク配列
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (hip_heights, knee_angles) 各shape (F,)
+
+        CRITICAL: 計算不能フレームはNaN（除外は各評価メソッドで実施）
+        """
+        # 腰の高さ（左右hipの中点Y座標）
+        hip_heights = 0.5 * (lm[:, self.LEFT_HIP, Y] + lm[:, self.RIGHT_HIP, Y])
+
+        # 両膝の平均角度（着地時は両脚で吸収）
+        knee_angles = mean_joint_angles(
+            lm[:, :, X:Y + 1],
+            (self.LEFT_HIP, self.LEFT_KNEE, self.LEFT_ANKLE),
+            (self.RIGHT_HIP, self.RIGHT_KNEE, self.RIGHT_ANKLE)
+        )
+
+        return hip_heights, knee_angles
+
+    def _evaluate_jump_height(self, hip_heights: np.ndarray, rep_values: Dict) -> Dict:
         """
         What: ジャンプ高さ評価（leg_length比）
         Why: 十分なジャンプ高さを確認
         Design Decision: leg_length正規化、config.json閾値参照（ADR-003）
 
+        Args:
+            hip_heights: _compute_all()の腰の高さ時系列
+            rep_values: 正規化代表値
+
         Returns:
             Dict: {'score': int (0-3), 'ratio': float, 'max_height': float}
 
@@ -118,143 +211,65 @@ class JumpLandingEvaluator:
         if leg_length is None or np.isnan(leg_length):
             return {'score': 0, 'ratio': None, 'max_height': None}
 
-        # PHASE CORE LOGIC: ジャンプ高さ計算
-        # 腰の高さ（左右hipの中点Y座標）の変動を追跡
-        hip_heights = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_HIP, self.RIGHT_HIP):
-                # 左右腰の中点Y座標
-                left_hip_y = landmarks[self.LEFT_HIP]['y']
-                right_hip_y = landmarks[self.RIGHT_HIP]['y']
-                hip_center_y = (left_hip_y + right_hip_y) / 2
-                hip_heights.append(hip_center_y)
+        # PHASE CORE LOGIC: ジャンプ高さ計算（腰の高さの変動を追跡）
+        # CRITICAL: 腰ランドマーク欠損フレームは除外（NaN除外とmin/max/meanを1パスで集計）
+        # min_y: 最高点（Y座標が小さい）、max_y: 最低点（Y座標が大きい）
+        min_y, max_y, avg_height, count = nan_min_max_mean(hip_heights)
 
-        if not hip_heights:
+        if count == 0:
             return {'score': 0, 'ratio': None, 'max_height': None}
 
         # ジャンプ高さ = 最高点 - 最低点（Y座標は下向き正のため逆転）
-        min_y = np.min(hip_heights)  # 最高点（Y座標が小さい）
-        max_y = np.max(hip_heights)  # 最低点（Y座標が大きい）
         jump_height = max_y - min_y
 
-        avg_height = np.mean(hip_heights)
-
         # CRITICAL: 正規化（leg_length比、ADR-003）
         jump_height_ratio = normalize_value(jump_height, leg_length)
 
         if jump_height_ratio is None:
-            return {'score': 0, 'ratio': None, 'max_height': float(jump_height)}
+            return {'score': 0, 'ratio': None, 'max_height': jump_height}
 
         # CRITICAL: config.json閾値参照（ADR-002）
-        jump_height_ratio_min = self.thresholds['jump_height_ratio_min']
-
-        # スコアリング
-        if jump_height_ratio >= jump_height_ratio_min:
-            score = 3
-        elif jump_height_ratio >= jump_height_ratio_min * 0.75:
-            score = 2
-        elif jump_height_ratio >= jump_height_ratio_min * 0.5:
-            score = 1
-        else:
-            score = 0
+        # スコアリング（下肢長比が閾値以上で3、*0.75以上で2、*0.5以上で1）
+        score = score_at_least(jump_height_ratio, self._jump_height_bands)
 
         return {
             'score': score,
-            'ratio': float(jump_height_ratio),
-            'max_height': float(jump_height),
-            'avg_height': float(avg_height)
+            'ratio': jump_height_ratio,
+            'max_height': jump_height,
+            'avg_height': avg_height
         }
 
-    def _evaluate_landing_knee_flexion(self, landmarks_data: List[Dict]) -> Dict:
+    def _evaluate_landing_knee_flexion(self, knee_angles: np.ndarray) -> Dict:
         """
         What: 着地時膝屈曲角度評価
         Why: 十分な膝屈曲深度（90°以下）を確認
-        Design Decision: config.json閾値参照（ADR-002）
+        Design Decision: config.json閾値参照、_compute_all()の時系列を集計（ADR-002, ADR-010）
+
+        Args:
+            knee_angles: _compute_all()の両膝平均角度時系列
 
         Returns:
             Dict: {'score': int (0-3), 'min_angle': float, 'avg_angle': float}
 
         CRITICAL: 膝角度が閾値以下＝十分屈曲している（着地衝撃吸収）
         """
-        # PHASE CORE LOGIC: 膝角度計算
-        knee_angles = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_ANKLE, self.RIGHT_ANKLE):
-                # 左右の膝角度を計算
-                left_angle = self._calculate_knee_angle(
-                    landmarks[self.LEFT_HIP],
-                    landmarks[self.LEFT_KNEE],
-                    landmarks[self.LEFT_ANKLE]
-                )
-                right_angle = self._calculate_knee_angle(
-                    landmarks[self.RIGHT_HIP],
-                    landmarks[self.RIGHT_KNEE],
-                    landmarks[self.RIGHT_ANKLE]
-                )
-
-                # 両膝の平均角度（着地時は両脚で吸収）
-                if left_angle is not None and right_angle is not None:
-                    avg_knee_angle = (left_angle + right_angle) / 2
-                    knee_angles.append(avg_knee_angle)
-
-        if not knee_angles:
-            return {'score': 0, 'min_angle': None, 'avg_angle': None}
+        # PHASE CORE LOGIC: 膝角度集計
+        # CRITICAL: 左右どちらかが計算不能なフレームは除外
+        min_angle, _, avg_angle, count = nan_min_max_mean(knee_angles)
 
-        min_angle = np.min(knee_angles)
-        avg_angle = np.mean(knee_angles)
+        if count == 0:
+            return {'score': 0, 'min_angle': None, 'avg_angle': None}
 
         # CRITICAL: config.json閾値参照（ADR-002）
-        knee_flexion_max = self.thresholds['knee_flexion_max']
-
-        # スコアリング（膝角度が閾値以下＝十分屈曲している）
-        if min_angle <= knee_flexion_max:
-            score = 3
-        elif min_angle <= knee_flexion_max + 10:
-            score = 2
-        elif min_angle <= knee_flexion_max + 20:
-            score = 1
-        else:
-            score = 0
+        # スコアリング（膝角度が閾値以下＝十分屈曲している、+10以下で2、+20以下で1）
+        score = score_at_most(min_angle, self._knee_flexion_bands)
 
         return {
             'score': score,
-            'min_angle': float(min_angle),
-            'avg_angle': float(avg_angle)
+            'min_angle': min_angle,
+            'avg_angle': avg_angle
         }
 
-    def _calculate_knee_angle(self,
-                              hip: Dict,
-                              knee: Dict,
-                              ankle: Dict) -> Optional[float]:
-        """
-        What: 膝角度計算（hip-knee-ankle 3点から算出）
-        Why: 膝屈曲深度を定量評価
-        Design Decision: 2Dベクトル内積で角度計算（ADR-003）
-
-        Returns:
-            float: 膝の角度（度）、計算できない場合はNone
-
-        CRITICAL: NaN/ゼロ除算時はNoneを返す（例外投げない）
-        """
-        try:
-            # ベクトルを作成
-            v1 = np.array([hip['x'] - knee['x'], hip['y'] - knee['y']])
-            v2 = np.array([ankle['x'] - knee['x'], ankle['y'] - knee['y']])
-
-            # 内積とノルムから角度を計算
-            cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2))
-            cos_angle = np.clip(cos_angle, -1.0, 1.0)  # 数値誤差対策
-            angle = np.degrees(np.arccos(cos_angle))
-
-            return float(angle)
-        except (ValueError, ZeroDivisionError, KeyError):
-            # CRITICAL: エラー時はNoneを返す（データ保持）
-            return None
-
     def _generate_details(self,
                           total_score: int,
                           height_result: Dict,
@@ -269,29 +284,22 @@ class JumpLandingEvaluator:
 
         CRITICAL: NaNの場合は"データなし"と表示
         """
-        if total_score == 3:
-            level = "優秀"
-        elif total_score == 2:
-            level = "良好"
-        elif total_score == 1:
-            level = "改善の余地あり"
-        else:
-            level = "要トレーニング"
-
-        details = f"総合評価: {level}\n"
+        # 総合評価ラベル（スコア0-3で添字参照）
+        level = SCORE_LEVELS[total_score]
 
         # ジャンプ高さ
-        details += f"ジャンプ高さスコア: {height_result['score']}/3 "
-        if height_result['ratio'] is not None:
-            details += f"(下肢長比: {height_result['ratio']:.2f})\n"
-        else:
-            details += "(データなし)\n"
+        height_text = (f"(下肢長比: {height_result['ratio']:.2f})"
+                       if height_result['ratio'] is not None else NO_DATA)
 
         # 着地時膝屈曲
-        details += f"着地膝屈曲スコア: {flexion_result['score']}/3 "
-        if flexion_result['min_angle'] is not None:
-            details += f"(最小角: {flexion_result['min_angle']:.1f}度)"
-        else:
-            details += "(データなし)"
+        flexion_text = (f"(最小角: {flexion_result['min_angle']:.1f}度)"
+                        if flexion_result['min_angle'] is not None else NO_DATA)
+
+        # 行ごとに組み立てて1回で連結（文字列の逐次連結を避ける）
+        details = "\n".join([
+            f"総合評価: {level}",
+            f"ジャンプ高さスコア: {height_result['score']}/3 {height_text}",
+            f"着地膝屈曲スコア: {flexion_result['score']}/3 {flexion_text}",
+        ])
 
         return details
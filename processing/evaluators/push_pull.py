@@ -1,19 +1,20 @@
 """
 Purpose: プッシュプル評価ロジック
 Responsibility: プル距離とプッシュ角度からプッシュプル動作を評価
-Dependencies: numpy, config.json, normalizer.py
+Dependencies: numpy, config.json, config_loader.py, normalizer.py, landmarks.py, _kernels.py, _scoring.py
 Created: 2025-10-19 by Claude
-Decision Log: ADR-002, ADR-003
+Decision Log: ADR-002, ADR-003, ADR-010, ADR-012, ADR-013
 
 CRITICAL: config.json閾値参照必須、正規化処理統合必須
 """
 import numpy as np
-import json
-from pathlib import Path
-from typing import List, Dict, Optional
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-from normalizer import BodyNormalizer, normalize_value
+from typing import List, Dict, Tuple
+
+from ..config_loader import load_config
+from ..landmarks import LandmarkInput, X, Y, as_landmark_array
+from ..normalizer import get_shared_normalizer, normalize_value
+from ._kernels import max_joint_angles, nan_min_max_mean
+from ._scoring import NO_DATA, SCORE_LEVELS, score_at_least, score_bands
 
 
 class PushPullEvaluator:
@@ -39,26 +40,31 @@ class PushPullEvaluator:
         """
         What: config.json読み込みと閾値初期化
         Why: 閾値外部化によるデータ整合性保証（ADR-002）
-        Design Decision: デフォルトパスでルート直下config.json参照
+        Design Decision: デフォルトパスでルート直下config.json参照、読み込み結果は共有
 
         Args:
             config_path: config.jsonのパス
 
         CRITICAL: config_path変更時は全テスト更新必須
         """
-        # PHASE CORE LOGIC: config.json読み込み
-        config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"config.json not found: {config_path}")
-
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # PHASE CORE LOGIC: config.json読み込み（プロセス内キャッシュ、ADR-013）
+        self.config = load_config(config_path)
 
         # CRITICAL: push_pull閾値取得（ADR-002参照）
         self.thresholds = self.config['thresholds']['push_pull']
-        self.normalizer = BodyNormalizer(config_path)
+        self.normalizer = get_shared_normalizer(config_path)
 
-    def evaluate(self, landmarks_data: List[Dict]) -> Dict:
+        # スコア境界の事前計算（閾値派生値はインスタンス生成時に1回のみ）
+        pull_distance_ratio_min = self.thresholds['pull_distance_ratio_min']
+        self._pull_distance_bands = score_bands([
+            pull_distance_ratio_min * 0.6, pull_distance_ratio_min * 0.8, pull_distance_ratio_min
+        ])
+        push_angle_min = self.thresholds['push_angle_min']
+        self._push_angle_bands = score_bands([
+            push_angle_min - 15, push_angle_min - 8, push_angle_min
+        ])
+
+    def evaluate(self, landmarks_data: LandmarkInput) -> Dict:
         """
         What: プッシュプル総合評価
         Why: プル距離とプッシュ角度の2指標を評価
@@ -77,23 +83,80 @@ class PushPullEvaluator:
 
         CRITICAL: landmarks_data空の場合はスコア0を返す（例外投げない）
         """
-        if not landmarks_data:
+        if len(landmarks_data) == 0:
             return {
                 'score': 0,
                 'pull_distance': {'score': 0, 'ratio': None},
-                'push_angle': {'score': 0, 'min_angle': None},
+                'push_angle': {'score': 0, 'max_angle': None},
                 'details': '姿勢が検出できませんでした'
             }
 
+        # PHASE CORE LOGIC: 2指標の時系列をSoA配列から一括計算（ADR-010）
+        lm = as_landmark_array(landmarks_data)
+        pull_distances, elbow_angles = self._compute_all(lm)
+
+        return self._evaluate_series(lm, pull_distances, elbow_angles)
+
+    def evaluate_batch(self, clips: List[List[Dict]]) -> List[Dict]:
+        """
+        What: 複数動画のプッシュプル一括評価
+        Why: データセット単位の評価で時系列計算カーネルの起動を1回に集約
+        Design Decision: 全クリップを連結して_compute_all()を1回実行（角度計算のNumPy演算を全フレーム一括で実行）、
+                         正規化・集計はクリップ単位（ADR-010, ADR-012）
+
+        Args:
+            clips: クリップごとのランドマークデータ（各要素はevaluate()の入力と同形式）
+
+        Returns:
+            List[Dict]: クリップ順のevaluate()結果
+
+        CRITICAL: 結果はクリップごとにevaluate()を呼んだ場合と同一であること
+        """
+        arrays = [as_landmark_array(clip) for clip in clips]
+        if not arrays:
+            return []
+
+        # PHASE CORE LOGIC: 連結配列で時系列を一括計算し、クリップ境界で分割
+        pull_distances, elbow_angles = self._compute_all(np.concatenate(arrays))
+        bounds = np.cumsum([len(arr) for arr in arrays])[:-1]
+
+        results = []
+        for clip, arr, clip_pull_distances, clip_elbow_angles in zip(
+            clips, arrays, np.split(pull_distances, bounds), np.split(elbow_angles, bounds)
+        ):
+            # CRITICAL: 空クリップはevaluate()と同一のスコア0結果
+            if len(clip) == 0:
+                results.append(self.evaluate(clip))
+            else:
+                results.append(self._evaluate_series(arr, clip_pull_distances, clip_elbow_angles))
+
+        return results
+
+    def _evaluate_series(self,
+                         lm: np.ndarray,
+                         pull_distances: np.ndarray,
+                         elbow_angles: np.ndarray) -> Dict:
+        """
+        What: 計算済み時系列から2指標を評価し総合結果を生成
+        Why: evaluate()とevaluate_batch()で評価・集計処理を共通化
+        Design Decision: 正規化はSoA配列から、指標は時系列から算出（ADR-002, ADR-003, ADR-010）
+
+        Args:
+            lm: shape (F, 33, 4) ランドマーク配列（正規化用、_compute_all()の入力と共有）
+            pull_distances: _compute_all()のプル距離時系列
+            elbow_angles: _compute_all()の伸展側肘角度時系列
+
+        Returns:
+            Dict: evaluate()と同一形式
+        """
         # CRITICAL: 正規化処理（ADR-003）
-        rep_values, _ = self.normalizer.normalize_landmarks_sequence(landmarks_data)
+        rep_values, _ = self.normalizer.normalize_landmarks_sequence(lm)
 
-        # PHASE CORE LOGIC: 2指標評価
         # 1. プル距離評価
-        pull_result = self._evaluate_pull_distance(landmarks_data, rep_values)
+        pull_result = self._evaluate_pull_distance(pull_distances, rep_values)
 
         # 2. プッシュ角度評価
-        push_result = self._evaluate_push_angle(landmarks_data)
+        push_result = self._evaluate_push_angle(elbow_angles)
 
         # 3. 総合スコアの計算（2指標全て満たす必要がある）
         total_score = min(pull_result['score'], push_result['score'])
@@ -105,12 +168,47 @@ class PushPullEvaluator:
             'details': self._generate_details(total_score, pull_result, push_result)
         }
 
-    def _evaluate_pull_distance(self, landmarks_data: List[Dict], rep_values: Dict) -> Dict:
+    def _compute_all(self, lm: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        What: プル距離と伸展側肘角度の時系列を一括計算
+        Why: 指標ごとのランドマーク走査を1回に集約
+        Design Decision: SoA配列から必要な列のみ参照（ADR-010）
+
+        Args:
+            lm: shape (F, 33, 4) ランドマーク配列
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (pull_distances, elbow_angles) 各shape (F,)
+
+        CRITICAL: 計算不能フレームはNaN（除外は各評価メソッドで実施）
+        """
+        # 肩-手首間の水平距離（X軸方向）、左右の大きい方
+        # 差分配列を再利用しabs/maximumはin-place（一時配列は左右の差分2本のみ）
+        pull_distances = lm[:, self.LEFT_WRIST, X] - lm[:, self.LEFT_SHOULDER, X]
+        right_distances = lm[:, self.RIGHT_WRIST, X] - lm[:, self.RIGHT_SHOULDER, X]
+        np.abs(pull_distances, out=pull_distances)
+        np.abs(right_distances, out=right_distances)
+        np.maximum(pull_distances, right_distances, out=pull_distances)
+
+        # 両腕の肘角度のうち大きい方（プッシュ時は伸展している方）
+        elbow_angles = max_joint_angles(
+            lm[:, :, X:Y + 1],
+            (self.LEFT_SHOULDER, self.LEFT_ELBOW, self.LEFT_WRIST),
+            (self.RIGHT_SHOULDER, self.RIGHT_ELBOW, self.RIGHT_WRIST)
+        )
+
+        return pull_distances, elbow_angles
+
+    def _evaluate_pull_distance(self, pull_distances: np.ndarray, rep_values: Dict) -> Dict:
         """
         What: プル距離評価（shoulder_width比）
         Why: 十分な引き動作距離を確認
         Design Decision: shoulder_width正規化、config.json閾値参照（ADR-003）
 
+        Args:
+            pull_distances: _compute_all()のプル距離時系列
+            rep_values: 正規化代表値
+
         Returns:
             Dict: {'score': int (0-3), 'ratio': float, 'max_distance': float}
 
@@ -120,146 +218,62 @@ class PushPullEvaluator:
         if shoulder_width is None or np.isnan(shoulder_width):
             return {'score': 0, 'ratio': None, 'max_distance': None}
 
-        # PHASE CORE LOGIC: プル距離計算
-        pull_distances = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_WRIST, self.RIGHT_WRIST):
-                # 左右手首の水平移動距離（肩からの距離）
-                left_shoulder = landmarks[self.LEFT_SHOULDER]
-                right_shoulder = landmarks[self.RIGHT_SHOULDER]
-                left_wrist = landmarks[self.LEFT_WRIST]
-                right_wrist = landmarks[self.RIGHT_WRIST]
-
-                # 肩-手首間の水平距離（X軸方向）
-                left_distance = abs(left_wrist['x'] - left_shoulder['x'])
-                right_distance = abs(right_wrist['x'] - right_shoulder['x'])
+        # PHASE CORE LOGIC: プル距離集計
+        # CRITICAL: 肩・手首ランドマーク欠損フレームは除外（NaN除外とmax/meanを1パスで集計）
+        _, max_distance, avg_distance, count = nan_min_max_mean(pull_distances)
 
-                # 最大距離を記録
-                max_distance = max(left_distance, right_distance)
-                pull_distances.append(max_distance)
-
-        if not pull_distances:
+        if count == 0:
             return {'score': 0, 'ratio': None, 'max_distance': None}
 
-        max_distance = np.max(pull_distances)
-        avg_distance = np.mean(pull_distances)
-
         # CRITICAL: 正規化（shoulder_width比、ADR-003）
         pull_distance_ratio = normalize_value(max_distance, shoulder_width)
 
         if pull_distance_ratio is None:
-            return {'score': 0, 'ratio': None, 'max_distance': float(max_distance)}
+            return {'score': 0, 'ratio': None, 'max_distance': max_distance}
 
         # CRITICAL: config.json閾値参照（ADR-002）
-        pull_distance_ratio_min = self.thresholds['pull_distance_ratio_min']
-
-        # スコアリング
-        if pull_distance_ratio >= pull_distance_ratio_min:
-            score = 3
-        elif pull_distance_ratio >= pull_distance_ratio_min * 0.8:
-            score = 2
-        elif pull_distance_ratio >= pull_distance_ratio_min * 0.6:
-            score = 1
-        else:
-            score = 0
+        # スコアリング（肩幅比が閾値以上で3、*0.8以上で2、*0.6以上で1）
+        score = score_at_least(pull_distance_ratio, self._pull_distance_bands)
 
         return {
             'score': score,
-            'ratio': float(pull_distance_ratio),
-            'max_distance': float(max_distance),
-            'avg_distance': float(avg_distance)
+            'ratio': pull_distance_ratio,
+            'max_distance': max_distance,
+            'avg_distance': avg_distance
         }
 
-    def _evaluate_push_angle(self, landmarks_data: List[Dict]) -> Dict:
+    def _evaluate_push_angle(self, elbow_angles: np.ndarray) -> Dict:
         """
         What: プッシュ角度評価（肘伸展角度）
         Why: 十分な押し動作（肘伸展）を確認
-        Design Decision: config.json閾値参照（ADR-002）
+        Design Decision: config.json閾値参照、_compute_all()の時系列を集計（ADR-002, ADR-010）
+
+        Args:
+            elbow_angles: _compute_all()の伸展側肘角度時系列
 
         Returns:
-            Dict: {'score': int (0-3), 'min_angle': float, 'avg_angle': float}
+            Dict: {'score': int (0-3), 'max_angle': float, 'avg_angle': float}
 
         CRITICAL: 肘角度が閾値以上＝十分伸展している
         """
-        # PHASE CORE LOGIC: 肘角度計算
-        elbow_angles = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_WRIST, self.RIGHT_WRIST):
-                # 左右の肘角度を計算
-                left_angle = self._calculate_elbow_angle(
-                    landmarks[self.LEFT_SHOULDER],
-                    landmarks[self.LEFT_ELBOW],
-                    landmarks[self.LEFT_WRIST]
-                )
-                right_angle = self._calculate_elbow_angle(
-                    landmarks[self.RIGHT_SHOULDER],
-                    landmarks[self.RIGHT_ELBOW],
-                    landmarks[self.RIGHT_WRIST]
-                )
-
-                # 両腕の角度を記録（プッシュ時は伸展している方）
-                if left_angle is not None and right_angle is not None:
-                    max_extension_angle = max(left_angle, right_angle)
-                    elbow_angles.append(max_extension_angle)
-
-        if not elbow_angles:
-            return {'score': 0, 'min_angle': None, 'avg_angle': None}
-
-        max_angle = np.max(elbow_angles)
-        avg_angle = np.mean(elbow_angles)
+        # PHASE CORE LOGIC: 肘角度集計
+        # CRITICAL: 左右どちらかが計算不能なフレームは除外
+        _, max_angle, avg_angle, count = nan_min_max_mean(elbow_angles)
 
-        # CRITICAL: config.json閾値参照（ADR-002）
-        push_angle_min = self.thresholds['push_angle_min']
+        if count == 0:
+            # CRITICAL: _generate_details()はmax_angleキーを参照
+            return {'score': 0, 'max_angle': None, 'avg_angle': None}
 
-        # スコアリング（肘角度が閾値以上＝十分伸展している）
-        if max_angle >= push_angle_min:
-            score = 3
-        elif max_angle >= push_angle_min - 8:
-            score = 2
-        elif max_angle >= push_angle_min - 15:
-            score = 1
-        else:
-            score = 0
+        # CRITICAL: config.json閾値参照（ADR-002）
+        # スコアリング（肘角度が閾値以上＝十分伸展している、-8以上で2、-15以上で1）
+        score = score_at_least(max_angle, self._push_angle_bands)
 
         return {
             'score': score,
-            'max_angle': float(max_angle),
-            'avg_angle': float(avg_angle)
+            'max_angle': max_angle,
+            'avg_angle': avg_angle
         }
 
-    def _calculate_elbow_angle(self,
-                               shoulder: Dict,
-                               elbow: Dict,
-                               wrist: Dict) -> Optional[float]:
-        """
-        What: 肘角度計算（shoulder-elbow-wrist 3点から算出）
-        Why: 肘伸展度を定量評価
-        Design Decision: 2Dベクトル内積で角度計算（ADR-003）
-
-        Returns:
-            float: 肘の角度（度）、計算できない場合はNone
-
-        CRITICAL: NaN/ゼロ除算時はNoneを返す（例外投げない）
-        """
-        try:
-            # ベクトルを作成
-            v1 = np.array([shoulder['x'] - elbow['x'], shoulder['y'] - elbow['y']])
-            v2 = np.array([wrist['x'] - elbow['x'], wrist['y'] - elbow['y']])
-
-            # 内積とノルムから角度を計算
-            cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2))
-            cos_angle = np.clip(cos_angle, -1.0, 1.0)  # 数値誤差対策
-            angle = np.degrees(np.arccos(cos_angle))
-
-            return float(angle)
-        except (ValueError, ZeroDivisionError, KeyError):
-            # CRITICAL: エラー時はNoneを返す（データ保持）
-            return None
-
     def _generate_details(self,
                           total_score: int,
                           pull_result: Dict,
@@ -274,29 +288,22 @@ class PushPullEvaluator:
 
         CRITICAL: NaNの場合は"データなし"と表示
         """
-        if total_score == 3:
-            level = "優秀"
-        elif total_score == 2:
-            level = "良好"
-        elif total_score == 1:
-            level = "改善の余地あり"
-        else:
-            level = "要トレーニング"
-
-        details = f"総合評価: {level}\n"
+        # 総合評価ラベル（スコア0-3で添字参照）
+        level = SCORE_LEVELS[total_score]
 
         # プル距離
-        details += f"プル距離スコア: {pull_result['score']}/3 "
-        if pull_result['ratio'] is not None:
-            details += f"(肩幅比: {pull_result['ratio']:.2f})\n"
-        else:
-            details += "(データなし)\n"
+        pull_text = (f"(肩幅比: {pull_result['ratio']:.2f})"
+                     if pull_result['ratio'] is not None else NO_DATA)
 
         # プッシュ角度
-        details += f"プッシュ角度スコア: {push_result['score']}/3 "
-        if push_result['max_angle'] is not None:
-            details += f"(最大角: {push_result['max_angle']:.1f}度)"
-        else:
-            details += "(データなし)"
+        push_text = (f"(最大角: {push_result['max_angle']:.1f}度)"
+                     if push_result['max_angle'] is not None else NO_DATA)
+
+        # 行ごとに組み立てて1回で連結（文字列の逐次連結を避ける）
+        details = "\n".join([
+            f"総合評価: {level}",
+            f"プル距離スコア: {pull_result['score']}/3 {pull_text}",
+            f"プッシュ角度スコア: {push_result['score']}/3 {push_text}",
+        ])
 
         return details
@@ -1,17 +1,27 @@
 """
 Purpose: 片脚スタンススクワット評価ロジック
 Responsibility: 骨盤水平性と膝角度比から片脚立位スクワットを評価
-Dependencies: numpy, config.json, normalizer.py
+Dependencies: numpy, config.json, config_loader.py, normalizer.py, landmarks.py, _kernels.py
 Created: 2025-10-19 by Claude
-Decision Log: ADR-002, ADR-003
+Decision Log: ADR-002, ADR-003, ADR-010, ADR-012, ADR-013
 
 CRITICAL: config.json閾値参照必須、正規化処理統合必須
 """
 import numpy as np
-import json
-from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
+from ..config_loader import load_config
+from ..landmarks import (
+    DEFAULT_VISIBILITY_MIN,
+    LandmarkInput,
+    X,
+    Y,
+    as_landmark_array,
+    low_visibility_frames,
+)
+from ._kernels import nan_min_max_mean, paired_joint_angles
+from ._scoring import NO_DATA, SCORE_LEVELS, score_above, score_at_most, score_below, score_bands
+
 
 class SingleLegSquatEvaluator:
     """
@@ -30,41 +40,66 @@ class SingleLegSquatEvaluator:
     LEFT_ANKLE = 27
     RIGHT_ANKLE = 28
 
+    # 膝角度の(hip, knee, ankle)インデックス
+    _LEFT_LEG = (LEFT_HIP, LEFT_KNEE, LEFT_ANKLE)
+    _RIGHT_LEG = (RIGHT_HIP, RIGHT_KNEE, RIGHT_ANKLE)
+
+    # visibility判定対象（3指標で使用する全ランドマーク）
+    _VISIBILITY_LANDMARKS = _LEFT_LEG + _RIGHT_LEG
+
     def __init__(self, config_path: str = 'config.json'):
         """
         What: config.json読み込みと閾値初期化
         Why: 閾値外部化によるデータ整合性保証（ADR-002）
-        Design Decision: デフォルトパスでルート直下config.json参照
+        Design Decision: デフォルトパスでルート直下config.json参照、読み込み結果は共有
 
         Args:
             config_path: config.jsonのパス
 
         CRITICAL: config_path変更時は全テスト更新必須
         """
-        # PHASE CORE LOGIC: config.json読み込み
-        config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"config.json not found: {config_path}")
-
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # PHASE CORE LOGIC: config.json読み込み（プロセス内キャッシュ、ADR-013）
+        self.config = load_config(config_path)
 
         # CRITICAL: single_leg_squat閾値取得（ADR-002参照）
         self.thresholds = self.config['thresholds']['single_leg_squat']
+        # visibility_min追加前のconfig.jsonでも動作（未設定時は既定値、ADR-014）
+        self._visibility_min = float(
+            self.config['thresholds'].get('visibility_min', DEFAULT_VISIBILITY_MIN)
+        )
 
-    def evaluate(self, landmarks_data: List[Dict]) -> Dict:
+        # スコア境界の事前計算（閾値派生値はインスタンス生成時に1回のみ）
+        pelvic_thresholds = self.config['thresholds']['pelvic_stability']
+        self._pelvic_tilt_bands = score_bands([
+            pelvic_thresholds['tilt_excellent'],
+            pelvic_thresholds['tilt_good'],
+            pelvic_thresholds['tilt_improvement'],
+        ])
+        knee_flexion_min = self.thresholds['knee_flexion_min']
+        self._knee_flexion_bands = score_bands([
+            knee_flexion_min, knee_flexion_min + 10, knee_flexion_min + 20
+        ])
+        # CRITICAL: 膝角度差閾値は暫定ハードコード（将来config.json化）
+        knee_angle_diff_threshold = 20.0
+        self._knee_angle_diff_bands = score_bands([
+            knee_angle_diff_threshold * 0.5, knee_angle_diff_threshold * 0.75, knee_angle_diff_threshold
+        ])
+
+    def evaluate(self, landmarks_data: LandmarkInput, fast: bool = False) -> Dict:
         """
         What: 片脚スタンススクワット総合評価
         Why: 骨盤水平性と膝角度比の両指標を満たす必要がある
-        Design Decision: min(骨盤スコア, 膝角度スコア)で総合評価（ADR-002）
+        Design Decision: min(骨盤スコア, 膝角度スコア)で総合評価（ADR-002）、
+                         fast=Trueでは骨盤スコア0（総合0確定）時に膝角度計算を省略
 
         Args:
-            landmarks_data: フレームごとのランドマークデータ
+            landmarks_data: フレームごとのランドマークデータ、またはshape (F, 33, 4)のSoA配列
                 [{
                     'frame': int,
                     'timestamp': float,
                     'landmarks': [{'x': float, 'y': float, 'z': float, 'visibility': float}, ...]
                 }, ...]
+            fast: Trueの場合、骨盤スコア0で膝2指標を未評価（スコア0, 値None）として返す
 
         Returns:
             Dict: {
@@ -75,9 +110,11 @@ class SingleLegSquatEvaluator:
                 'details': str
             }
 
-        CRITICAL: landmarks_data空の場合はスコア0を返す（例外投げない）
+        CRITICAL: landmarks_data空の場合はスコア0を返す（例外投げない）、
+                  配列入力はList[Dict]の変換を省略（正規化不要のため辞書は参照しない）
         """
-        if not landmarks_data:
+        # CRITICAL: ndarrayの真偽値判定は不可のためlen()で空判定
+        if len(landmarks_data) == 0:
             return {
                 'score': 0,
                 'pelvic_stability': {'score': 0, 'avg_diff': None},
@@ -86,15 +123,86 @@ class SingleLegSquatEvaluator:
                 'details': '姿勢が検出できませんでした'
             }
 
-        # PHASE CORE LOGIC: 3指標評価
+        lm = as_landmark_array(landmarks_data)
+
+        if fast:
+            # 骨盤傾きのみ先に評価（O(F)の座標差、膝角度カーネルより軽量）
+            hip_diffs, _ = self._compute_all(lm, include_knees=False)
+            pelvic_result = self._evaluate_pelvic_stability(hip_diffs)
+
+            # CRITICAL: 総合スコアはmin集計のため、骨盤スコア0なら膝指標に関わらず0
+            if pelvic_result['score'] == 0:
+                knee_result = {'score': 0, 'avg_diff': None, 'max_diff': None, 'frames_analyzed': 0}
+                flexion_result = {'score': 0, 'min_angle': None, 'avg_angle': None, 'frames_analyzed': 0}
+                return {
+                    'score': 0,
+                    'pelvic_stability': pelvic_result,
+                    'knee_angle_ratio': knee_result,
+                    'knee_flexion': flexion_result,
+                    'details': self._generate_details(0, pelvic_result, knee_result, flexion_result)
+                }
+
+        # PHASE CORE LOGIC: 時系列を1回の走査で計算し、3指標評価
+        hip_diffs, knee_angles = self._compute_all(lm)
+
+        return self._evaluate_series(hip_diffs, knee_angles)
+
+    def evaluate_batch(self, clips: List[LandmarkInput]) -> List[Dict]:
+        """
+        What: 複数動画の片脚スタンススクワット一括評価
+        Why: データセット単位の評価で時系列計算カーネルの起動を1回に集約
+        Design Decision: 全クリップを連結して_compute_all()を1回実行（連結後JIT_MIN_FRAMES以上の場合のみJITカーネル）、
+                         集計・スコアリングはクリップ単位（ADR-010, ADR-012）
+
+        Args:
+            clips: クリップごとのランドマークデータ（各要素はevaluate()の入力と同形式）
+
+        Returns:
+            List[Dict]: クリップ順のevaluate()結果
+
+        CRITICAL: 結果はクリップごとにevaluate()を呼んだ場合と同一であること
+        """
+        arrays = [as_landmark_array(clip) for clip in clips]
+        if not arrays:
+            return []
+
+        # PHASE CORE LOGIC: 連結配列で時系列を一括計算し、クリップ境界で分割
+        hip_diffs, knee_angles = self._compute_all(np.concatenate(arrays))
+        bounds = np.cumsum([len(arr) for arr in arrays])[:-1]
+
+        results = []
+        for clip, clip_hip_diffs, clip_knee_angles in zip(
+            clips, np.split(hip_diffs, bounds), np.split(knee_angles, bounds)
+        ):
+            # CRITICAL: 空クリップはevaluate()と同一のスコア0結果
+            if len(clip) == 0:
+                results.append(self.evaluate(clip))
+            else:
+                results.append(self._evaluate_series(clip_hip_diffs, clip_knee_angles))
+
+        return results
+
+    def _evaluate_series(self, hip_diffs: np.ndarray, knee_angles: np.ndarray) -> Dict:
+        """
+        What: 計算済み時系列から3指標を評価し総合結果を生成
+        Why: evaluate()とevaluate_batch()で評価・集計処理を共通化
+        Design Decision: 指標は_compute_all()の時系列から算出（ADR-002）
+
+        Args:
+            hip_diffs: _compute_all()の骨盤傾き時系列
+            knee_angles: _compute_all()の左右膝角度 shape (F, 2)
+
+        Returns:
+            Dict: evaluate()と同一形式
+        """
         # 1. 骨盤水平性の評価
-        pelvic_result = self._evaluate_pelvic_stability(landmarks_data)
+        pelvic_result = self._evaluate_pelvic_stability(hip_diffs)
 
         # 2. 膝角度比の評価
-        knee_result = self._evaluate_knee_angle_ratio(landmarks_data)
+        knee_result = self._evaluate_knee_angle_ratio(knee_angles)
 
         # 3. 膝屈曲角度の評価（config.json: knee_flexion_min）
-        flexion_result = self._evaluate_knee_flexion(landmarks_data)
+        flexion_result = self._evaluate_knee_flexion(knee_angles)
 
         # 4. 総合スコアの計算（3指標全て満たす必要がある）
         total_score = min(pelvic_result['score'], knee_result['score'], flexion_result['score'])
@@ -107,223 +215,138 @@ class SingleLegSquatEvaluator:
             'details': self._generate_details(total_score, pelvic_result, knee_result, flexion_result)
         }
 
-    def _evaluate_pelvic_stability(self, landmarks_data: List[Dict]) -> Dict:
+    def _compute_all(self,
+                     lm: np.ndarray,
+                     include_knees: bool = True) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        What: 骨盤傾きと左右膝角度の時系列を一括計算
+        Why: 3指標で同じhip/knee/ankle列を繰り返し走査しない
+        Design Decision: SoA配列から必要な列のみ参照、左右膝角度は(F, 2)で一括計算（ADR-010）
+
+        Args:
+            lm: shape (F, 33, 4) ランドマーク配列
+            include_knees: Falseの場合は膝角度を計算せずNoneを返す
+
+        Returns:
+            Tuple[np.ndarray, Optional[np.ndarray]]:
+                (hip_diffs shape (F,), knee_angles shape (F, 2) 列は左, 右)
+
+        CRITICAL: 計算不能フレームはNaN（除外は各評価メソッドで実施）
+        """
+        # CRITICAL: 低visibilityフレームは計算不能扱い（NaN化、フレーム削除禁止、ADR-014）
+        low_visibility = low_visibility_frames(lm, self._VISIBILITY_LANDMARKS, self._visibility_min)
+
+        # 骨盤の傾き（左右hipのY座標の差）
+        hip_diffs = np.abs(lm[:, self.LEFT_HIP, Y] - lm[:, self.RIGHT_HIP, Y])
+        hip_diffs[low_visibility] = np.nan
+
+        if not include_knees:
+            return hip_diffs, None
+
+        # 左右の膝角度（(F, 33, 2)のx, yのみ使用）
+        knee_angles = paired_joint_angles(lm[:, :, X:Y + 1], self._LEFT_LEG, self._RIGHT_LEG)
+        knee_angles[low_visibility] = np.nan
+
+        return hip_diffs, knee_angles
+
+    def _evaluate_pelvic_stability(self, hip_diffs: np.ndarray) -> Dict:
         """
         What: 骨盤水平性評価（左右hip Y座標差）
         Why: 片脚立位時の骨盤水平保持能力を評価
-        Design Decision: pelvic_stability閾値はanalyzer.pyと共通（ADR-002）
+        Design Decision: pelvic_stability閾値はanalyzer.pyと共通、_compute_all()の時系列を集計（ADR-002, ADR-010）
+
+        Args:
+            hip_diffs: _compute_all()の骨盤傾き時系列
 
         Returns:
             Dict: {'score': int (0-3), 'avg_diff': float, 'max_diff': float, 'frames_analyzed': int}
 
         CRITICAL: config.json pelvic_stability閾値参照（ハードコード禁止）
         """
-        # PHASE CORE LOGIC: 骨盤傾き計算
-        hip_diffs = []
+        # CRITICAL: 腰ランドマーク欠損フレームは除外（NaN除外とmax/meanを1パスで集計）
+        _, max_diff, avg_diff, frames_analyzed = nan_min_max_mean(hip_diffs)
 
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_HIP, self.RIGHT_HIP):
-                left_hip = landmarks[self.LEFT_HIP]
-                right_hip = landmarks[self.RIGHT_HIP]
-
-                # 骨盤の傾き（Y座標の差）
-                diff = abs(left_hip['y'] - right_hip['y'])
-                hip_diffs.append(diff)
-
-        if not hip_diffs:
+        if frames_analyzed == 0:
             return {'score': 0, 'avg_diff': None, 'max_diff': None, 'frames_analyzed': 0}
 
-        avg_diff = np.mean(hip_diffs)
-        max_diff = np.max(hip_diffs)
-
         # CRITICAL: config.json閾値参照（ADR-002）
-        pelvic_thresholds = self.config['thresholds']['pelvic_stability']
-        tilt_excellent = pelvic_thresholds['tilt_excellent']
-        tilt_good = pelvic_thresholds['tilt_good']
-        tilt_improvement = pelvic_thresholds['tilt_improvement']
-
-        # スコアリング（0-3点）
-        if avg_diff < tilt_excellent:
-            score = 3
-        elif avg_diff < tilt_good:
-            score = 2
-        elif avg_diff < tilt_improvement:
-            score = 1
-        else:
-            score = 0
+        # スコアリング（tilt_excellent未満で3、tilt_good未満で2、tilt_improvement未満で1）
+        score = score_below(avg_diff, self._pelvic_tilt_bands)
 
         return {
             'score': score,
-            'avg_diff': float(avg_diff),
-            'max_diff': float(max_diff),
-            'frames_analyzed': len(hip_diffs)
+            'avg_diff': avg_diff,
+            'max_diff': max_diff,
+            'frames_analyzed': frames_analyzed
         }
 
-    def _evaluate_knee_flexion(self, landmarks_data: List[Dict]) -> Dict:
+    def _evaluate_knee_flexion(self, knee_angles: np.ndarray) -> Dict:
         """
         What: 軸脚膝屈曲角度評価
         Why: 十分な膝屈曲深度（90°以上）を確認
-        Design Decision: config.json knee_flexion_min閾値使用（ADR-002）
+        Design Decision: config.json knee_flexion_min閾値使用、_compute_all()の時系列を集計（ADR-002, ADR-010）
+
+        Args:
+            knee_angles: _compute_all()の左右膝角度 shape (F, 2)
 
         Returns:
             Dict: {'score': int (0-3), 'min_angle': float, 'avg_angle': float, 'frames_analyzed': int}
 
         CRITICAL: 軸脚判定は左右膝角度の小さい方（より曲がっている方）
         """
-        knee_angles = []
-
-        # PHASE CORE LOGIC: 軸脚膝角度計算
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_ANKLE, self.RIGHT_ANKLE):
-                # 左右の膝角度を計算
-                left_angle = self._calculate_knee_angle(
-                    landmarks[self.LEFT_HIP],
-                    landmarks[self.LEFT_KNEE],
-                    landmarks[self.LEFT_ANKLE]
-                )
-                right_angle = self._calculate_knee_angle(
-                    landmarks[self.RIGHT_HIP],
-                    landmarks[self.RIGHT_KNEE],
-                    landmarks[self.RIGHT_ANKLE]
-                )
-
-                # 軸脚は膝がより曲がっている方（角度が小さい方）
-                if left_angle is not None and right_angle is not None:
-                    axis_leg_angle = min(left_angle, right_angle)
-                    knee_angles.append(axis_leg_angle)
-
-        if not knee_angles:
-            return {'score': 0, 'min_angle': None, 'avg_angle': None, 'frames_analyzed': 0}
+        # PHASE CORE LOGIC: 軸脚は膝がより曲がっている方（角度が小さい方）
+        axis_knee_angles = np.minimum(knee_angles[:, 0], knee_angles[:, 1])
 
-        min_angle = np.min(knee_angles)
-        avg_angle = np.mean(knee_angles)
+        # CRITICAL: 左右どちらかが計算不能なフレームは除外
+        min_angle, _, avg_angle, frames_analyzed = nan_min_max_mean(axis_knee_angles)
 
-        # CRITICAL: config.json閾値参照（ADR-002）
-        knee_flexion_min = self.thresholds['knee_flexion_min']
+        if frames_analyzed == 0:
+            return {'score': 0, 'min_angle': None, 'avg_angle': None, 'frames_analyzed': 0}
 
+        # CRITICAL: config.json閾値参照（ADR-002）
         # スコアリング（膝角度が閾値以下＝十分屈曲している）
-        if min_angle <= knee_flexion_min:
-            score = 3
-        elif min_angle <= knee_flexion_min + 10:
-            score = 2
-        elif min_angle <= knee_flexion_min + 20:
-            score = 1
-        else:
-            score = 0
+        score = score_at_most(min_angle, self._knee_flexion_bands)
 
         return {
             'score': score,
-            'min_angle': float(min_angle),
-            'avg_angle': float(avg_angle),
-            'frames_analyzed': len(knee_angles)
+            'min_angle': min_angle,
+            'avg_angle': avg_angle,
+            'frames_analyzed': frames_analyzed
         }
 
-    def _evaluate_knee_angle_ratio(self, landmarks_data: List[Dict]) -> Dict:
+    def _evaluate_knee_angle_ratio(self, knee_angles: np.ndarray) -> Dict:
         """
         What: 膝角度比評価（軸脚と遊脚の差）
         Why: 軸脚のみが屈曲し、遊脚は伸展している状態を確認
-        Design Decision: 角度差20°以上で合格（現在はハードコード、将来config化）
+        Design Decision: 角度差20°以上で合格（現在はハードコード、将来config化）、_compute_all()の時系列を集計（ADR-010）
+
+        Args:
+            knee_angles: _compute_all()の左右膝角度 shape (F, 2)
 
         Returns:
             Dict: {'score': int (0-3), 'avg_diff': float, 'max_diff': float, 'frames_analyzed': int}
 
         CRITICAL: 将来的にconfig.json化予定
         """
-        # PHASE CORE LOGIC: 左右膝角度差計算
-        angle_diffs = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_ANKLE, self.RIGHT_ANKLE):
-                # 左脚と右脚の膝角度を計算
-                left_angle = self._calculate_knee_angle(
-                    landmarks[self.LEFT_HIP],
-                    landmarks[self.LEFT_KNEE],
-                    landmarks[self.LEFT_ANKLE]
-                )
-                right_angle = self._calculate_knee_angle(
-                    landmarks[self.RIGHT_HIP],
-                    landmarks[self.RIGHT_KNEE],
-                    landmarks[self.RIGHT_ANKLE]
-                )
-
-                if left_angle is not None and right_angle is not None:
-                    # 角度の差（軸脚はより曲がる）
-                    diff = abs(left_angle - right_angle)
-                    angle_diffs.append(diff)
-
-        if not angle_diffs:
-            return {'score': 0, 'avg_diff': None, 'max_diff': None, 'frames_analyzed': 0}
+        # PHASE CORE LOGIC: 左右膝角度差（軸脚はより曲がる）
+        angle_diffs = np.abs(knee_angles[:, 0] - knee_angles[:, 1])
 
-        avg_diff = np.mean(angle_diffs)
-        max_diff = np.max(angle_diffs)
+        # CRITICAL: 左右どちらかが計算不能なフレームは除外
+        _, max_diff, avg_diff, frames_analyzed = nan_min_max_mean(angle_diffs)
 
-        # CRITICAL: 暫定ハードコード（将来config.json化）
-        knee_angle_diff_threshold = 20.0
+        if frames_analyzed == 0:
+            return {'score': 0, 'avg_diff': None, 'max_diff': None, 'frames_analyzed': 0}
 
-        # スコアリング
-        if avg_diff > knee_angle_diff_threshold:
-            score = 3
-        elif avg_diff > knee_angle_diff_threshold * 0.75:
-            score = 2
-        elif avg_diff > knee_angle_diff_threshold * 0.5:
-            score = 1
-        else:
-            score = 0
+        # スコアリング（角度差が閾値超で3、*0.75超で2、*0.5超で1）
+        score = score_above(avg_diff, self._knee_angle_diff_bands)
 
         return {
             'score': score,
-            'avg_diff': float(avg_diff),
-            'max_diff': float(max_diff),
-            'frames_analyzed': len(angle_diffs)
+            'avg_diff': avg_diff,
+            'max_diff': max_diff,
+            'frames_analyzed': frames_analyzed
         }
 
-    def _calculate_knee_angle(self,
-                              hip: Dict,
-                              knee: Dict,
-                              ankle: Dict) -> Optional[float]:
-        """
-        What: 膝角度計算（hip-knee-ankle 3点から算出）
-        Why: 膝屈曲深度を定量評価
-        Design Decision: 2Dベクトル内積で角度計算（ADR-003）
-
-        Args:
-            hip, knee, ankle: ランドマーク座標 {'x': float, 'y': float, 'z': float}
-
-        Returns:
-            float: 膝の角度（度）、計算できない場合はNone
-
-        CRITICAL: NaN/ゼロ除算時はNoneを返す（例外投げない）
-        """
-        try:
-            # ベクトルを作成
-            v1 = np.array([hip['x'] - knee['x'], hip['y'] - knee['y']])
-            v2 = np.array([ankle['x'] - knee['x'], ankle['y'] - knee['y']])
-
-            # ノルムチェック（ゼロベクトル対策）
-            norm1 = np.linalg.norm(v1)
-            norm2 = np.linalg.norm(v2)
-
-            # CRITICAL: ゼロベクトルの場合はNone返却
-            if norm1 == 0 or norm2 == 0:
-                return None
-
-            # 内積とノルムから角度を計算
-            cos_angle = np.dot(v1, v2) / (norm1 * norm2)
-            cos_angle = np.clip(cos_angle, -1.0, 1.0)  # 数値誤差対策
-            angle = np.degrees(np.arccos(cos_angle))
-
-            # CRITICAL: NaN判定
-            if np.isnan(angle):
-                return None
-
-            return float(angle)
-        except (ValueError, ZeroDivisionError, KeyError):
-            # CRITICAL: エラー時はNoneを返す（データ保持）
-            return None
-
     def _generate_details(self,
                           total_score: int,
                           pelvic_result: Dict,
@@ -339,36 +362,27 @@ class SingleLegSquatEvaluator:
 
         CRITICAL: NaNの場合は"データなし"と表示
         """
-        if total_score == 3:
-            level = "優秀"
-        elif total_score == 2:
-            level = "良好"
-        elif total_score == 1:
-            level = "改善の余地あり"
-        else:
-            level = "要トレーニング"
-
-        details = f"総合評価: {level}\n"
+        # 総合評価ラベル（スコア0-3で添字参照）
+        level = SCORE_LEVELS[total_score]
 
         # 骨盤安定性
-        details += f"骨盤安定性スコア: {pelvic_result['score']}/3 "
-        if pelvic_result['avg_diff'] is not None:
-            details += f"(平均差: {pelvic_result['avg_diff']:.4f})\n"
-        else:
-            details += "(データなし)\n"
+        pelvic_text = (f"(平均差: {pelvic_result['avg_diff']:.4f})"
+                       if pelvic_result['avg_diff'] is not None else NO_DATA)
 
         # 膝屈曲角度
-        details += f"膝屈曲スコア: {flexion_result['score']}/3 "
-        if flexion_result['min_angle'] is not None:
-            details += f"(最小角: {flexion_result['min_angle']:.1f}度)\n"
-        else:
-            details += "(データなし)\n"
+        flexion_text = (f"(最小角: {flexion_result['min_angle']:.1f}度)"
+                        if flexion_result['min_angle'] is not None else NO_DATA)
 
         # 膝角度比
-        details += f"膝角度比スコア: {knee_result['score']}/3 "
-        if knee_result['avg_diff'] is not None:
-            details += f"(平均差: {knee_result['avg_diff']:.1f}度)"
-        else:
-            details += "(データなし)"
+        knee_text = (f"(平均差: {knee_result['avg_diff']:.1f}度)"
+                     if knee_result['avg_diff'] is not None else NO_DATA)
+
+        # 行ごとに組み立てて1回で連結（文字列の逐次連結を避ける）
+        details = "\n".join([
+            f"総合評価: {level}",
+            f"骨盤安定性スコア: {pelvic_result['score']}/3 {pelvic_text}",
+            f"膝屈曲スコア: {flexion_result['score']}/3 {flexion_text}",
+            f"膝角度比スコア: {knee_result['score']}/3 {knee_text}",
+        ])
 
         return details
@@ -1,19 +1,20 @@
 """
 Purpose: スケーターランジ評価ロジック
 Responsibility: ステップ幅、持ち上げ高さ、膝伸展角度からスケーターランジを評価
-Dependencies: numpy, config.json, normalizer.py
+Dependencies: numpy, config.json, config_loader.py, normalizer.py, landmarks.py, _kernels.py, _scoring.py
 Created: 2025-10-19 by Claude
-Decision Log: ADR-002, ADR-003
+Decision Log: ADR-002, ADR-003, ADR-010, ADR-012, ADR-013
 
 CRITICAL: config.json閾値参照必須、正規化処理統合必須
 """
 import numpy as np
-import json
-from pathlib import Path
-from typing import List, Dict, Optional
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-from normalizer import BodyNormalizer, normalize_value
+from typing import Dict, Optional, Tuple
+
+from ..config_loader import load_config
+from ..landmarks import LandmarkInput, X, Y, as_landmark_array
+from ..normalizer import get_shared_normalizer, normalize_value
+from ._kernels import max_joint_angles, nan_min_max_mean
+from ._scoring import NO_DATA, SCORE_LEVELS
 
 
 class SkaterLungeEvaluator:
@@ -37,26 +38,21 @@ class SkaterLungeEvaluator:
         """
         What: config.json読み込みと閾値初期化
         Why: 閾値外部化によるデータ整合性保証（ADR-002）
-        Design Decision: デフォルトパスでルート直下config.json参照
+        Design Decision: デフォルトパスでルート直下config.json参照、読み込み結果は共有
 
         Args:
             config_path: config.jsonのパス
 
         CRITICAL: config_path変更時は全テスト更新必須
         """
-        # PHASE CORE LOGIC: config.json読み込み
-        config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"config.json not found: {config_path}")
-
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # PHASE CORE LOGIC: config.json読み込み（プロセス内キャッシュ、ADR-013）
+        self.config = load_config(config_path)
 
         # CRITICAL: skater_lunge閾値取得（ADR-002参照）
         self.thresholds = self.config['thresholds']['skater_lunge']
-        self.normalizer = BodyNormalizer(config_path)
+        self.normalizer = get_shared_normalizer(config_path)
 
-    def evaluate(self, landmarks_data: List[Dict]) -> Dict:
+    def evaluate(self, landmarks_data: LandmarkInput) -> Dict:
         """
         What: スケーターランジ総合評価
         Why: ステップ幅、持ち上げ高さ、膝伸展の3指標を評価
@@ -76,7 +72,7 @@ class SkaterLungeEvaluator:
 
         CRITICAL: landmarks_data空の場合はスコア0を返す（例外投げない）
         """
-        if not landmarks_data:
+        if len(landmarks_data) == 0:
             return {
                 'score': 0,
                 'step_width': {'score': 0, 'ratio': None},
@@ -85,18 +81,23 @@ class SkaterLungeEvaluator:
                 'details': '姿勢が検出できませんでした'
             }
 
+        # SoA配列への変換は1回のみ（正規化と指標計算で共有、ADR-010）
+        lm = as_landmark_array(landmarks_data)
+
         # CRITICAL: 正規化処理（ADR-003）
-        rep_values, _ = self.normalizer.normalize_landmarks_sequence(landmarks_data)
+        rep_values, _ = self.normalizer.normalize_landmarks_sequence(lm)
+
+        # PHASE CORE LOGIC: 3指標の時系列をSoA配列から一括計算（ADR-010）
+        step_widths, lift_heights, knee_angles = self._compute_all(lm)
 
-        # PHASE CORE LOGIC: 3指標評価
         # 1. ステップ幅評価
-        step_result = self._evaluate_step_width(landmarks_data, rep_values)
+        step_result = self._evaluate_step_width(step_widths, rep_values)
 
         # 2. 持ち上げ高さ評価
-        lift_result = self._evaluate_lift_height(landmarks_data, rep_values)
+        lift_result = self._evaluate_lift_height(lift_heights, rep_values)
 
         # 3. 膝伸展角度評価
-        knee_result = self._evaluate_knee_extension(landmarks_data)
+        knee_result = self._evaluate_knee_extension(knee_angles)
 
         # 4. 総合スコアの計算（3指標全て満たす必要がある）
         total_score = min(step_result['score'], lift_result['score'], knee_result['score'])
@@ -109,11 +110,40 @@ class SkaterLungeEvaluator:
             'details': self._generate_details(total_score, step_result, lift_result, knee_result)
         }
 
-    def _evaluate_step_width(self, landmarks_data: List[Dict], rep_values: Dict) -> Dict:
+    def _compute_all(self, lm: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        What: ステップ幅・持ち上げ高さ・軸脚膝角度の時系列を一括計算
+        Why: 指標ごとのランドマーク走査を1回に集約
+        Design Decision: SoA配列から必要な列のみ参照（ADR-010）
+
+        Args:
+            lm: shape (F, 33, 4) ランドマーク配列
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (step_widths, lift_heights, knee_angles) 各shape (F,)
+
+        CRITICAL: 計算不能フレームはNaN（除外は各評価メソッドで実施）
+        """
+        # ステップ幅（左右足首間の水平距離）
+        step_widths = np.abs(lm[:, self.LEFT_ANKLE, X] - lm[:, self.RIGHT_ANKLE, X])
+
+        # 持ち上げ高さ（左右足首のY座標差の絶対値、高い方が遊脚）
+        lift_heights = np.abs(lm[:, self.LEFT_ANKLE, Y] - lm[:, self.RIGHT_ANKLE, Y])
+
+        # 軸脚は膝がより伸展している方（角度が大きい方、(F, 33, 2)のx, yのみ使用）
+        knee_angles = max_joint_angles(
+            lm[:, :, X:Y + 1],
+            (self.LEFT_HIP, self.LEFT_KNEE, self.LEFT_ANKLE),
+            (self.RIGHT_HIP, self.RIGHT_KNEE, self.RIGHT_ANKLE)
+        )
+
+        return step_widths, lift_heights, knee_angles
+
+    def _evaluate_step_width(self, step_widths: np.ndarray, rep_values: Dict) -> Dict:
         """
         What: ステップ幅評価（base_width比）
         Why: 十分な側方ステップ幅を確認
-        Design Decision: base_width正規化、config.json閾値参照（ADR-003）
+        Design Decision: base_width正規化、_compute_all()の時系列を集計（ADR-003, ADR-010）
 
         Returns:
             Dict: {'score': int (0-3), 'ratio': float, 'max_width': float}
@@ -124,30 +154,17 @@ class SkaterLungeEvaluator:
         if base_width is None or np.isnan(base_width):
             return {'score': 0, 'ratio': None, 'max_width': None}
 
-        # PHASE CORE LOGIC: ステップ幅計算
-        step_widths = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_ANKLE, self.RIGHT_ANKLE):
-                left_ankle = landmarks[self.LEFT_ANKLE]
-                right_ankle = landmarks[self.RIGHT_ANKLE]
+        # PHASE CORE LOGIC: 足首欠損フレーム除外とmax/meanを1パスで集計
+        _, max_width, avg_width, count = nan_min_max_mean(step_widths)
 
-                # 左右足首間の水平距離
-                step_width = abs(left_ankle['x'] - right_ankle['x'])
-                step_widths.append(step_width)
-
-        if not step_widths:
+        if count == 0:
             return {'score': 0, 'ratio': None, 'max_width': None}
 
-        max_width = np.max(step_widths)
-        avg_width = np.mean(step_widths)
-
         # CRITICAL: 正規化（base_width比、ADR-003）
         step_width_ratio = normalize_value(max_width, base_width)
 
         if step_width_ratio is None:
-            return {'score': 0, 'ratio': None, 'max_width': float(max_width)}
+            return {'score': 0, 'ratio': None, 'max_width': max_width}
 
         # CRITICAL: config.json閾値参照（ADR-002）
         step_width_ratio_min = self.thresholds['step_width_ratio_min']
@@ -164,16 +181,16 @@ class SkaterLungeEvaluator:
 
         return {
             'score': score,
-            'ratio': float(step_width_ratio),
-            'max_width': float(max_width),
-            'avg_width': float(avg_width)
+            'ratio': step_width_ratio,
+            'max_width': max_width,
+            'avg_width': avg_width
         }
 
-    def _evaluate_lift_height(self, landmarks_data: List[Dict], rep_values: Dict) -> Dict:
+    def _evaluate_lift_height(self, lift_heights: np.ndarray, rep_values: Dict) -> Dict:
         """
         What: 遊脚持ち上げ高さ評価（leg_length比）
         Why: 十分な足の持ち上げを確認
-        Design Decision: leg_length正規化、config.json閾値参照（ADR-003）
+        Design Decision: leg_length正規化、_compute_all()の時系列を集計（ADR-003, ADR-010）
 
         Returns:
             Dict: {'score': int (0-3), 'ratio': float, 'max_height': float}
@@ -184,31 +201,17 @@ class SkaterLungeEvaluator:
         if leg_length is None or np.isnan(leg_length):
             return {'score': 0, 'ratio': None, 'max_height': None}
 
-        # PHASE CORE LOGIC: 持ち上げ高さ計算
-        lift_heights = []
+        # PHASE CORE LOGIC: 足首欠損フレーム除外とmax/meanを1パスで集計
+        _, max_height, avg_height, count = nan_min_max_mean(lift_heights)
 
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_ANKLE, self.RIGHT_ANKLE):
-                # 左右足首のY座標差（高い方が遊脚）
-                left_ankle_y = landmarks[self.LEFT_ANKLE]['y']
-                right_ankle_y = landmarks[self.RIGHT_ANKLE]['y']
-
-                # 持ち上げ高さ（Y座標差の絶対値）
-                lift_height = abs(left_ankle_y - right_ankle_y)
-                lift_heights.append(lift_height)
-
-        if not lift_heights:
+        if count == 0:
             return {'score': 0, 'ratio': None, 'max_height': None}
 
-        max_height = np.max(lift_heights)
-        avg_height = np.mean(lift_heights)
-
         # CRITICAL: 正規化（leg_length比、ADR-003）
         lift_height_ratio = normalize_value(max_height, leg_length)
 
         if lift_height_ratio is None:
-            return {'score': 0, 'ratio': None, 'max_height': float(max_height)}
+            return {'score': 0, 'ratio': None, 'max_height': max_height}
 
         # CRITICAL: config.json閾値参照（ADR-002）
         lift_height_ratio_min = self.thresholds['lift_height_ratio_min']
@@ -225,50 +228,27 @@ class SkaterLungeEvaluator:
 
         return {
             'score': score,
-            'ratio': float(lift_height_ratio),
-            'max_height': float(max_height),
-            'avg_height': float(avg_height)
+            'ratio': lift_height_ratio,
+            'max_height': max_height,
+            'avg_height': avg_height
         }
 
-    def _evaluate_knee_extension(self, landmarks_data: List[Dict]) -> Dict:
+    def _evaluate_knee_extension(self, knee_angles: np.ndarray) -> Dict:
         """
         What: 軸脚膝伸展角度評価
         Why: 軸脚が十分伸展しているか確認
-        Design Decision: config.json閾値参照（ADR-002）
+        Design Decision: config.json閾値参照、_compute_all()の時系列を集計（ADR-002, ADR-010）
 
         Returns:
             Dict: {'score': int (0-3), 'min_angle': float, 'avg_angle': float}
 
         CRITICAL: 膝角度が閾値以上＝十分伸展している
         """
-        # PHASE CORE LOGIC: 軸脚膝角度計算
-        knee_angles = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_ANKLE, self.RIGHT_ANKLE):
-                # 左右の膝角度を計算
-                left_angle = self._calculate_knee_angle(
-                    landmarks[self.LEFT_HIP],
-                    landmarks[self.LEFT_KNEE],
-                    landmarks[self.LEFT_ANKLE]
-                )
-                right_angle = self._calculate_knee_angle(
-                    landmarks[self.RIGHT_HIP],
-                    landmarks[self.RIGHT_KNEE],
-                    landmarks[self.RIGHT_ANKLE]
-                )
-
-                # 軸脚は膝がより伸展している方（角度が大きい方）
-                if left_angle is not None and right_angle is not None:
-                    axis_leg_angle = max(left_angle, right_angle)
-                    knee_angles.append(axis_leg_angle)
-
-        if not knee_angles:
-            return {'score': 0, 'min_angle': None, 'avg_angle': None}
+        # CRITICAL: 左右どちらかが計算不能なフレームは除外
+        min_angle, _, avg_angle, count = nan_min_max_mean(knee_angles)
 
-        min_angle = np.min(knee_angles)
-        avg_angle = np.mean(knee_angles)
+        if count == 0:
+            return {'score': 0, 'min_angle': None, 'avg_angle': None}
 
         # CRITICAL: config.json閾値参照（ADR-002）
         knee_extension_min = self.thresholds['knee_extension_min']
@@ -285,8 +265,8 @@ class SkaterLungeEvaluator:
 
         return {
             'score': score,
-            'min_angle': float(min_angle),
-            'avg_angle': float(avg_angle)
+            'min_angle': min_angle,
+            'avg_angle': avg_angle
         }
 
     def _calculate_knee_angle(self,
@@ -333,36 +313,27 @@ class SkaterLungeEvaluator:
 
         CRITICAL: NaNの場合は"データなし"と表示
         """
-        if total_score == 3:
-            level = "優秀"
-        elif total_score == 2:
-            level = "良好"
-        elif total_score == 1:
-            level = "改善の余地あり"
-        else:
-            level = "要トレーニング"
-
-        details = f"総合評価: {level}\n"
+        # 総合評価ラベル（スコア0-3で添字参照）
+        level = SCORE_LEVELS[total_score]
 
         # ステップ幅
-        details += f"ステップ幅スコア: {step_result['score']}/3 "
-        if step_result['ratio'] is not None:
-            details += f"(基準幅比: {step_result['ratio']:.2f})\n"
-        else:
-            details += "(データなし)\n"
+        step_text = (f"(基準幅比: {step_result['ratio']:.2f})"
+                     if step_result['ratio'] is not None else NO_DATA)
 
         # 持ち上げ高さ
-        details += f"持ち上げ高さスコア: {lift_result['score']}/3 "
-        if lift_result['ratio'] is not None:
-            details += f"(下肢長比: {lift_result['ratio']:.2f})\n"
-        else:
-            details += "(データなし)\n"
+        lift_text = (f"(下肢長比: {lift_result['ratio']:.2f})"
+                     if lift_result['ratio'] is not None else NO_DATA)
 
         # 膝伸展角度
-        details += f"膝伸展スコア: {knee_result['score']}/3 "
-        if knee_result['min_angle'] is not None:
-            details += f"(最小角: {knee_result['min_angle']:.1f}度)"
-        else:
-            details += "(データなし)"
+        knee_text = (f"(最小角: {knee_result['min_angle']:.1f}度)"
+                     if knee_result['min_angle'] is not None else NO_DATA)
+
+        # 行ごとに組み立てて1回で連結（文字列の逐次連結を避ける）
+        details = "\n".join([
+            f"総合評価: {level}",
+            f"ステップ幅スコア: {step_result['score']}/3 {step_text}",
+            f"持ち上げ高さスコア: {lift_result['score']}/3 {lift_text}",
+            f"膝伸展スコア: {knee_result['score']}/3 {knee_text}",
+        ])
 
         return details
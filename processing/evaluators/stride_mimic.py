@@ -1,19 +1,20 @@
 """
 Purpose: ストライドミミック評価ロジック
 Responsibility: 股関節伸展角度と足持ち上げ高さからストライドミミックを評価
-Dependencies: numpy, config.json, normalizer.py
+Dependencies: numpy, config.json, config_loader.py, normalizer.py, landmarks.py, _kernels.py
 Created: 2025-10-19 by Claude
-Decision Log: ADR-002, ADR-003
+Decision Log: ADR-002, ADR-003, ADR-010, ADR-012, ADR-013
 
 CRITICAL: config.json閾値参照必須、正規化処理統合必須
 """
 import numpy as np
-import json
-from pathlib import Path
-from typing import List, Dict, Optional
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-from normalizer import BodyNormalizer, normalize_value
+from typing import List, Dict, Tuple
+
+from ..config_loader import load_config
+from ..landmarks import LandmarkInput, X, Y, as_landmark_array
+from ..normalizer import get_shared_normalizer, normalize_value
+from ._kernels import max_joint_angles, nan_min_max_mean
+from ._scoring import NO_DATA, SCORE_LEVELS, score_at_least, score_bands
 
 
 class StrideMimicEvaluator:
@@ -39,33 +40,40 @@ class StrideMimicEvaluator:
         """
         What: config.json読み込みと閾値初期化
         Why: 閾値外部化によるデータ整合性保証（ADR-002）
-        Design Decision: デフォルトパスでルート直下config.json参照
+        Design Decision: デフォルトパスでルート直下config.json参照、読み込み結果は共有
 
         Args:
             config_path: config.jsonのパス
 
         CRITICAL: config_path変更時は全テスト更新必須
         """
-        # PHASE CORE LOGIC: config.json読み込み
-        config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"config.json not found: {config_path}")
-
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # PHASE CORE LOGIC: config.json読み込み（プロセス内キャッシュ、ADR-013）
+        self.config = load_config(config_path)
 
         # CRITICAL: stride_mimic閾値取得（ADR-002参照）
         self.thresholds = self.config['thresholds']['stride_mimic']
-        self.normalizer = BodyNormalizer(config_path)
+        self.normalizer = get_shared_normalizer(config_path)
 
-    def evaluate(self, landmarks_data: List[Dict]) -> Dict:
+        # スコア境界の事前計算（閾値派生値はインスタンス生成時に1回のみ）
+        hip_extension_min = self.thresholds['hip_extension_min']
+        self._hip_extension_bands = score_bands([
+            hip_extension_min - 15, hip_extension_min - 8, hip_extension_min
+        ])
+        foot_clearance_ratio_min = self.thresholds['foot_clearance_ratio_min']
+        self._foot_clearance_bands = score_bands([
+            foot_clearance_ratio_min * 0.5, foot_clearance_ratio_min * 0.75, foot_clearance_ratio_min
+        ])
+
+    def evaluate(self, landmarks_data: LandmarkInput, fast: bool = False) -> Dict:
         """
         What: ストライドミミック総合評価
         Why: 股関節伸展と足クリアランスの2指標を評価
-        Design Decision: 2指標評価、min集計（ADR-002）
+        Design Decision: 2指標評価、min集計（ADR-002）、
+                         fast=Trueでは股関節スコア0（総合0確定）時に正規化・クリアランス評価を省略
 
         Args:
             landmarks_data: フレームごとのランドマークデータ
+            fast: Trueの場合、股関節スコア0で足クリアランスを未評価（スコア0, 値None）として返す
 
         Returns:
             Dict: {
@@ -77,7 +85,7 @@ class StrideMimicEvaluator:
 
         CRITICAL: landmarks_data空の場合はスコア0を返す（例外投げない）
         """
-        if not landmarks_data:
+        if len(landmarks_data) == 0:
             return {
                 'score': 0,
                 'hip_extension': {'score': 0, 'max_angle': None},
@@ -85,15 +93,86 @@ class StrideMimicEvaluator:
                 'details': '姿勢が検出できませんでした'
             }
 
-        # CRITICAL: 正規化処理（ADR-003）
-        rep_values, _ = self.normalizer.normalize_landmarks_sequence(landmarks_data)
+        # PHASE CORE LOGIC: 時系列を1回の走査で計算し、2指標評価
+        lm = as_landmark_array(landmarks_data)
+        hip_angles, clearances = self._compute_all(lm)
+
+        if fast:
+            hip_result = self._evaluate_hip_extension(hip_angles)
+
+            # CRITICAL: 総合スコアはmin集計のため、股関節スコア0なら足クリアランスに関わらず0
+            #           （フレームごとの正規化計算を省略）
+            if hip_result['score'] == 0:
+                clearance_result = {'score': 0, 'ratio': None, 'max_clearance': None}
+                return {
+                    'score': 0,
+                    'hip_extension': hip_result,
+                    'foot_clearance': clearance_result,
+                    'details': self._generate_details(0, hip_result, clearance_result)
+                }
+
+        return self._evaluate_series(lm, hip_angles, clearances)
+
+    def evaluate_batch(self, clips: List[List[Dict]]) -> List[Dict]:
+        """
+        What: 複数動画のストライドミミック一括評価
+        Why: データセット単位の評価で時系列計算カーネルの起動を1回に集約
+        Design Decision: 全クリップを連結して_compute_all()を1回実行（角度計算のNumPy演算を全フレーム一括で実行）、
+                         正規化・集計はクリップ単位（ADR-010, ADR-012）
+
+        Args:
+            clips: クリップごとのランドマークデータ（各要素はevaluate()の入力と同形式）
+
+        Returns:
+            List[Dict]: クリップ順のevaluate()結果
+
+        CRITICAL: 結果はクリップごとにevaluate()を呼んだ場合と同一であること
+        """
+        arrays = [as_landmark_array(clip) for clip in clips]
+        if not arrays:
+            return []
+
+        # PHASE CORE LOGIC: 連結配列で時系列を一括計算し、クリップ境界で分割
+        hip_angles, clearances = self._compute_all(np.concatenate(arrays))
+        bounds = np.cumsum([len(arr) for arr in arrays])[:-1]
+
+        results = []
+        for clip, arr, clip_hip_angles, clip_clearances in zip(
+            clips, arrays, np.split(hip_angles, bounds), np.split(clearances, bounds)
+        ):
+            # CRITICAL: 空クリップはevaluate()と同一のスコア0結果
+            if len(clip) == 0:
+                results.append(self.evaluate(clip))
+            else:
+                results.append(self._evaluate_series(arr, clip_hip_angles, clip_clearances))
+
+        return results
+
+    def _evaluate_series(self,
+                         lm: np.ndarray,
+                         hip_angles: np.ndarray,
+                         clearances: np.ndarray) -> Dict:
+        """
+        What: 計算済み時系列から2指標を評価し総合結果を生成
+        Why: evaluate()とevaluate_batch()で評価・集計処理を共通化
+        Design Decision: 正規化はSoA配列から、指標は時系列から算出（ADR-002, ADR-003, ADR-010）
 
-        # PHASE CORE LOGIC: 2指標評価
+        Args:
+            lm: shape (F, 33, 4) ランドマーク配列（正規化用、_compute_all()の入力と共有）
+            hip_angles: _compute_all()の股関節角度時系列
+            clearances: _compute_all()の足クリアランス時系列
+
+        Returns:
+            Dict: evaluate()と同一形式
+        """
         # 1. 股関節伸展角度評価
-        hip_result = self._evaluate_hip_extension(landmarks_data)
+        hip_result = self._evaluate_hip_extension(hip_angles)
+
+        # CRITICAL: 正規化処理（ADR-003）
+        rep_values, _ = self.normalizer.normalize_landmarks_sequence(lm)
 
         # 2. 足クリアランス評価
-        clearance_result = self._evaluate_foot_clearance(landmarks_data, rep_values)
+        clearance_result = self._evaluate_foot_clearance(clearances, rep_values)
 
         # 3. 総合スコアの計算（2指標全て満たす必要がある）
         total_score = min(hip_result['score'], clearance_result['score'])
@@ -105,70 +184,71 @@ class StrideMimicEvaluator:
             'details': self._generate_details(total_score, hip_result, clearance_result)
         }
 
-    def _evaluate_hip_extension(self, landmarks_data: List[Dict]) -> Dict:
+    def _compute_all(self, lm: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        What: 股関節角度と足クリアランスの時系列を一括計算
+        Why: 指標ごとのランドマーク走査を1回に集約
+        Design Decision: SoA配列から必要な列のみ参照（ADR-010）
+
+        Args:
+            lm: shape (F, 33, 4) ランドマーク配列
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (hip_angles, clearances) 各shape (F,)
+
+        CRITICAL: 計算不能フレームはNaN（除外は各評価メソッドで実施）
+        """
+        # 股関節角度（後脚は伸展している方、(F, 33, 2)のx, yのみ使用）
+        hip_angles = max_joint_angles(
+            lm[:, :, X:Y + 1],
+            (self.LEFT_SHOULDER, self.LEFT_HIP, self.LEFT_KNEE),
+            (self.RIGHT_SHOULDER, self.RIGHT_HIP, self.RIGHT_KNEE)
+        )
+
+        # クリアランス高さ（左右足首のY座標差の絶対値、高い方が遊脚）
+        clearances = np.abs(lm[:, self.LEFT_ANKLE, Y] - lm[:, self.RIGHT_ANKLE, Y])
+
+        return hip_angles, clearances
+
+    def _evaluate_hip_extension(self, hip_angles: np.ndarray) -> Dict:
         """
         What: 股関節伸展角度評価
         Why: 十分な股関節伸展（ほぼ直線）を確認
-        Design Decision: config.json閾値参照（ADR-002）
+        Design Decision: config.json閾値参照、_compute_all()の時系列を集計（ADR-002, ADR-010）
+
+        Args:
+            hip_angles: _compute_all()の股関節角度時系列（左右の大きい方）
 
         Returns:
             Dict: {'score': int (0-3), 'max_angle': float, 'avg_angle': float}
 
         CRITICAL: 股関節角度が閾値以上＝十分伸展している
         """
-        # PHASE CORE LOGIC: 股関節角度計算
-        hip_angles = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_ANKLE, self.RIGHT_ANKLE):
-                # 左右の股関節角度を計算
-                left_angle = self._calculate_hip_angle(
-                    landmarks[self.LEFT_SHOULDER],
-                    landmarks[self.LEFT_HIP],
-                    landmarks[self.LEFT_KNEE]
-                )
-                right_angle = self._calculate_hip_angle(
-                    landmarks[self.RIGHT_SHOULDER],
-                    landmarks[self.RIGHT_HIP],
-                    landmarks[self.RIGHT_KNEE]
-                )
-
-                # 両脚の角度を記録（後脚は伸展している方）
-                if left_angle is not None and right_angle is not None:
-                    max_extension_angle = max(left_angle, right_angle)
-                    hip_angles.append(max_extension_angle)
-
-        if not hip_angles:
-            return {'score': 0, 'max_angle': None, 'avg_angle': None}
+        # CRITICAL: 左右どちらかが計算不能なフレームは除外
+        _, max_angle, avg_angle, count = nan_min_max_mean(hip_angles)
 
-        max_angle = np.max(hip_angles)
-        avg_angle = np.mean(hip_angles)
+        if count == 0:
+            return {'score': 0, 'max_angle': None, 'avg_angle': None}
 
         # CRITICAL: config.json閾値参照（ADR-002）
-        hip_extension_min = self.thresholds['hip_extension_min']
-
         # スコアリング（股関節角度が閾値以上＝十分伸展している）
-        if max_angle >= hip_extension_min:
-            score = 3
-        elif max_angle >= hip_extension_min - 8:
-            score = 2
-        elif max_angle >= hip_extension_min - 15:
-            score = 1
-        else:
-            score = 0
+        score = score_at_least(max_angle, self._hip_extension_bands)
 
         return {
             'score': score,
-            'max_angle': float(max_angle),
-            'avg_angle': float(avg_angle)
+            'max_angle': max_angle,
+            'avg_angle': avg_angle
         }
 
-    def _evaluate_foot_clearance(self, landmarks_data: List[Dict], rep_values: Dict) -> Dict:
+    def _evaluate_foot_clearance(self, clearances: np.ndarray, rep_values: Dict) -> Dict:
         """
         What: 足クリアランス高さ評価（leg_length比）
         Why: 十分な足の持ち上げを確認
-        Design Decision: leg_length正規化、config.json閾値参照（ADR-003）
+        Design Decision: leg_length正規化、config.json閾値参照、_compute_all()の時系列を集計（ADR-003, ADR-010）
+
+        Args:
+            clearances: _compute_all()の足クリアランス時系列
+            rep_values: 正規化代表値（leg_length）
 
         Returns:
             Dict: {'score': int (0-3), 'ratio': float, 'max_clearance': float}
@@ -179,81 +259,29 @@ class StrideMimicEvaluator:
         if leg_length is None or np.isnan(leg_length):
             return {'score': 0, 'ratio': None, 'max_clearance': None}
 
-        # PHASE CORE LOGIC: 足クリアランス計算
-        clearances = []
+        # CRITICAL: 足首ランドマーク欠損フレームは除外（NaN除外とmax/meanを1パスで集計）
+        _, max_clearance, avg_clearance, count = nan_min_max_mean(clearances)
 
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_ANKLE, self.RIGHT_ANKLE):
-                # 左右足首のY座標差（高い方が遊脚）
-                left_ankle_y = landmarks[self.LEFT_ANKLE]['y']
-                right_ankle_y = landmarks[self.RIGHT_ANKLE]['y']
-
-                # クリアランス高さ（Y座標差の絶対値）
-                clearance = abs(left_ankle_y - right_ankle_y)
-                clearances.append(clearance)
-
-        if not clearances:
+        if count == 0:
             return {'score': 0, 'ratio': None, 'max_clearance': None}
 
-        max_clearance = np.max(clearances)
-        avg_clearance = np.mean(clearances)
-
         # CRITICAL: 正規化（leg_length比、ADR-003）
         clearance_ratio = normalize_value(max_clearance, leg_length)
 
         if clearance_ratio is None:
-            return {'score': 0, 'ratio': None, 'max_clearance': float(max_clearance)}
+            return {'score': 0, 'ratio': None, 'max_clearance': max_clearance}
 
         # CRITICAL: config.json閾値参照（ADR-002）
-        foot_clearance_ratio_min = self.thresholds['foot_clearance_ratio_min']
-
-        # スコアリング
-        if clearance_ratio >= foot_clearance_ratio_min:
-            score = 3
-        elif clearance_ratio >= foot_clearance_ratio_min * 0.75:
-            score = 2
-        elif clearance_ratio >= foot_clearance_ratio_min * 0.5:
-            score = 1
-        else:
-            score = 0
+        # スコアリング（下肢長比が閾値以上で3、*0.75以上で2、*0.5以上で1）
+        score = score_at_least(clearance_ratio, self._foot_clearance_bands)
 
         return {
             'score': score,
-            'ratio': float(clearance_ratio),
-            'max_clearance': float(max_clearance),
-            'avg_clearance': float(avg_clearance)
+            'ratio': clearance_ratio,
+            'max_clearance': max_clearance,
+            'avg_clearance': avg_clearance
         }
 
-    def _calculate_hip_angle(self,
-                             shoulder: Dict,
-                             hip: Dict,
-                             knee: Dict) -> Optional[float]:
-        """
-        What: 股関節角度計算（shoulder-hip-knee 3点から算出）
-        Why: 股関節伸展度を定量評価
-        Design Decision: 2Dベクトル内積で角度計算（ADR-003）
-
-        Returns:
-            float: 股関節の角度（度）、計算できない場合はNone
-
-        CRITICAL: NaN/ゼロ除算時はNoneを返す（例外投げない）
-        """
-        try:
-            # ベクトルを作成
-            v1 = np.array([shoulder['x'] - hip['x'], shoulder['y'] - hip['y']])
-            v2 = np.array([knee['x'] - hip['x'], knee['y'] - hip['y']])
-
-            # 内積とノルムから角度を計算
-            cos_angle = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2))
-            cos_angle = np.clip(cos_angle, -1.0, 1.0)  # 数値誤差対策
-            angle = np.degrees(np.arccos(cos_angle))
-
-            return float(angle)
-        except (ValueError, ZeroDivisionError, KeyError):
-            # CRITICAL: エラー時はNoneを返す（データ保持）
-            return None
-
     def _generate_details(self,
                           total_score: int,
                           hip_result: Dict,
@@ -268,29 +296,22 @@ class StrideMimicEvaluator:
 
         CRITICAL: NaNの場合は"データなし"と表示
         """
-        if total_score == 3:
-            level = "優秀"
-        elif total_score == 2:
-            level = "良好"
-        elif total_score == 1:
-            level = "改善の余地あり"
-        else:
-            level = "要トレーニング"
-
-        details = f"総合評価: {level}\n"
+        # 総合評価ラベル（スコア0-3で添字参照）
+        level = SCORE_LEVELS[total_score]
 
         # 股関節伸展角度
-        details += f"股関節伸展スコア: {hip_result['score']}/3 "
-        if hip_result['max_angle'] is not None:
-            details += f"(最大角: {hip_result['max_angle']:.1f}度)\n"
-        else:
-            details += "(データなし)\n"
+        hip_text = (f"(最大角: {hip_result['max_angle']:.1f}度)"
+                    if hip_result['max_angle'] is not None else NO_DATA)
 
         # 足クリアランス
-        details += f"足クリアランススコア: {clearance_result['score']}/3 "
-        if clearance_result['ratio'] is not None:
-            details += f"(下肢長比: {clearance_result['ratio']:.2f})"
-        else:
-            details += "(データなし)"
+        clearance_text = (f"(下肢長比: {clearance_result['ratio']:.2f})"
+                          if clearance_result['ratio'] is not None else NO_DATA)
+
+        # 行ごとに組み立てて1回で連結（文字列の逐次連結を避ける）
+        details = "\n".join([
+            f"総合評価: {level}",
+            f"股関節伸展スコア: {hip_result['score']}/3 {hip_text}",
+            f"足クリアランススコア: {clearance_result['score']}/3 {clearance_text}",
+        ])
 
         return details
@@ -1,19 +1,20 @@
 """
 Purpose: 上半身スイング評価ロジック
 Responsibility: 腕振り振幅と左右対称性から上半身スイング動作を評価
-Dependencies: numpy, config.json, normalizer.py
+Dependencies: numpy, config.json, config_loader.py, normalizer.py, landmarks.py, _kernels.py, _scoring.py
 Created: 2025-10-19 by Claude
-Decision Log: ADR-002, ADR-003
+Decision Log: ADR-002, ADR-003, ADR-010, ADR-012, ADR-013
 
 CRITICAL: config.json閾値参照必須、正規化処理統合必須
 """
 import numpy as np
-import json
-from pathlib import Path
-from typing import List, Dict, Optional
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
-from normalizer import BodyNormalizer, normalize_value
+from typing import List, Dict, Optional, Tuple
+
+from ..config_loader import load_config
+from ..landmarks import LandmarkInput, Y, as_landmark_array
+from ..normalizer import get_shared_normalizer, normalize_value
+from ._kernels import nan_min_max_mean
+from ._scoring import NO_DATA, SCORE_LEVELS, score_at_least, score_below, score_bands
 
 
 class UpperBodySwingEvaluator:
@@ -39,33 +40,36 @@ class UpperBodySwingEvaluator:
         """
         What: config.json読み込みと閾値初期化
         Why: 閾値外部化によるデータ整合性保証（ADR-002）
-        Design Decision: デフォルトパスでルート直下config.json参照
+        Design Decision: デフォルトパスでルート直下config.json参照、読み込み結果は共有
 
         Args:
             config_path: config.jsonのパス
 
         CRITICAL: config_path変更時は全テスト更新必須
         """
-        # PHASE CORE LOGIC: config.json読み込み
-        config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"config.json not found: {config_path}")
-
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # PHASE CORE LOGIC: config.json読み込み（プロセス内キャッシュ、ADR-013）
+        self.config = load_config(config_path)
 
         # CRITICAL: upper_body_swing閾値取得（ADR-002参照）
         self.thresholds = self.config['thresholds']['upper_body_swing']
-        self.normalizer = BodyNormalizer(config_path)
+        self.normalizer = get_shared_normalizer(config_path)
+
+        # スコア境界の事前計算（閾値派生値はインスタンス生成時に1回のみ）
+        arm_amplitude_ratio_min = self.thresholds['arm_amplitude_ratio_min']
+        self._arm_amplitude_bands = score_bands([
+            arm_amplitude_ratio_min * 0.5, arm_amplitude_ratio_min * 0.75, arm_amplitude_ratio_min
+        ])
+        # CRITICAL: 左右振幅差閾値は暫定ハードコード（将来config.json化）
+        self._symmetry_bands = score_bands([0.05, 0.10, 0.15])
 
-    def evaluate(self, landmarks_data: List[Dict]) -> Dict:
+    def evaluate(self, landmarks_data: LandmarkInput) -> Dict:
         """
         What: 上半身スイング総合評価
         Why: 腕振り振幅と左右対称性の両指標を評価
         Design Decision: 2指標評価（振幅、対称性）、min集計（ADR-002）
 
         Args:
-            landmarks_data: フレームごとのランドマークデータ
+            landmarks_data: フレームごとのランドマークデータ、または(F, 33, 4)配列
                 [{
                     'frame': int,
                     'timestamp': float,
@@ -82,7 +86,7 @@ class UpperBodySwingEvaluator:
 
         CRITICAL: landmarks_data空の場合はスコア0を返す（例外投げない）
         """
-        if not landmarks_data:
+        if len(landmarks_data) == 0:
             return {
                 'score': 0,
                 'arm_amplitude': {'score': 0, 'ratio': None},
@@ -90,15 +94,20 @@ class UpperBodySwingEvaluator:
                 'details': '姿勢が検出できませんでした'
             }
 
+        # SoA配列への変換は1回のみ（正規化と指標計算で共有、ADR-010）
+        lm = as_landmark_array(landmarks_data)
+
         # CRITICAL: 正規化処理（ADR-003）
-        rep_values, _ = self.normalizer.normalize_landmarks_sequence(landmarks_data)
+        rep_values, _ = self.normalizer.normalize_landmarks_sequence(lm)
+
+        # PHASE CORE LOGIC: 2指標の時系列をSoA配列から一括計算（ADR-010）
+        amplitudes, symmetry_diffs = self._compute_all(lm)
 
-        # PHASE CORE LOGIC: 2指標評価
         # 1. 腕振り振幅評価
-        amplitude_result = self._evaluate_arm_amplitude(landmarks_data, rep_values)
+        amplitude_result = self._evaluate_arm_amplitude(amplitudes, rep_values)
 
         # 2. 左右対称性評価
-        symmetry_result = self._evaluate_symmetry(landmarks_data)
+        symmetry_result = self._evaluate_symmetry(symmetry_diffs)
 
         # 3. 総合スコアの計算（両指標を満たす必要がある）
         total_score = min(amplitude_result['score'], symmetry_result['score'])
@@ -110,14 +119,38 @@ class UpperBodySwingEvaluator:
             'details': self._generate_details(total_score, amplitude_result, symmetry_result)
         }
 
-    def _evaluate_arm_amplitude(self, landmarks_data: List[Dict], rep_values: Dict) -> Dict:
+    def _compute_all(self, lm: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        What: 腕振り振幅と左右振幅差の時系列を一括計算
+        Why: 振幅評価・対称性評価で同一の左右振幅を二重計算しない
+        Design Decision: SoA配列から手首・肩のY座標のみ参照（ADR-010）
+
+        Args:
+            lm: shape (F, 33, 4) ランドマーク配列
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (amplitudes, symmetry_diffs) 各shape (F,)
+                amplitudes: 左右振幅の大きい方、symmetry_diffs: 左右振幅差
+
+        CRITICAL: 手首・肩が欠損したフレームはNaN（除外は各評価メソッドで実施）
+        """
+        # 肩の高さを基準に左右手首の振り幅を計算
+        left_amplitude = np.abs(lm[:, self.LEFT_WRIST, Y] - lm[:, self.LEFT_SHOULDER, Y])
+        right_amplitude = np.abs(lm[:, self.RIGHT_WRIST, Y] - lm[:, self.RIGHT_SHOULDER, Y])
+
+        amplitudes = np.maximum(left_amplitude, right_amplitude)
+        symmetry_diffs = np.abs(left_amplitude - right_amplitude)
+
+        return amplitudes, symmetry_diffs
+
+    def _evaluate_arm_amplitude(self, amplitudes: np.ndarray, rep_values: Dict) -> Dict:
         """
         What: 腕振り振幅評価（肩幅比）
         Why: 十分な腕振り幅を確認
-        Design Decision: shoulder_width正規化、config.json閾値参照（ADR-003）
+        Design Decision: shoulder_width正規化、_compute_all()の時系列を集計（ADR-003, ADR-010）
 
         Args:
-            landmarks_data: フレームごとのランドマークデータ
+            amplitudes: _compute_all()の腕振り振幅時系列（左右の大きい方）
             rep_values: 正規化基準値
 
         Returns:
@@ -129,117 +162,57 @@ class UpperBodySwingEvaluator:
         if shoulder_width is None or np.isnan(shoulder_width):
             return {'score': 0, 'ratio': None, 'max_amplitude': None}
 
-        # PHASE CORE LOGIC: 腕振り振幅計算
-        amplitudes = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_WRIST, self.RIGHT_WRIST):
-                # 左右手首のY座標範囲を計算
-                left_wrist_y = landmarks[self.LEFT_WRIST]['y']
-                right_wrist_y = landmarks[self.RIGHT_WRIST]['y']
-
-                # 肩の高さを基準に振り幅を計算
-                left_shoulder_y = landmarks[self.LEFT_SHOULDER]['y']
-                right_shoulder_y = landmarks[self.RIGHT_SHOULDER]['y']
-
-                left_amplitude = abs(left_wrist_y - left_shoulder_y)
-                right_amplitude = abs(right_wrist_y - right_shoulder_y)
+        # PHASE CORE LOGIC: 欠損フレーム除外とmax/meanを1パスで集計
+        _, max_amplitude, avg_amplitude, count = nan_min_max_mean(amplitudes)
 
-                # 最大振幅を記録
-                max_amp = max(left_amplitude, right_amplitude)
-                amplitudes.append(max_amp)
-
-        if not amplitudes:
+        if count == 0:
             return {'score': 0, 'ratio': None, 'max_amplitude': None}
 
-        max_amplitude = np.max(amplitudes)
-        avg_amplitude = np.mean(amplitudes)
-
         # CRITICAL: 正規化（shoulder_width比、ADR-003）
         amplitude_ratio = normalize_value(avg_amplitude, shoulder_width)
 
         if amplitude_ratio is None:
-            return {'score': 0, 'ratio': None, 'max_amplitude': float(max_amplitude)}
+            return {'score': 0, 'ratio': None, 'max_amplitude': max_amplitude}
 
         # CRITICAL: config.json閾値参照（ADR-002）
-        arm_amplitude_ratio_min = self.thresholds['arm_amplitude_ratio_min']
-
-        # スコアリング
-        if amplitude_ratio >= arm_amplitude_ratio_min:
-            score = 3
-        elif amplitude_ratio >= arm_amplitude_ratio_min * 0.75:
-            score = 2
-        elif amplitude_ratio >= arm_amplitude_ratio_min * 0.5:
-            score = 1
-        else:
-            score = 0
+        # スコアリング（arm_amplitude_ratio_min以上で3、×0.75以上で2、×0.5以上で1）
+        score = score_at_least(amplitude_ratio, self._arm_amplitude_bands)
 
         return {
             'score': score,
-            'ratio': float(amplitude_ratio),
-            'max_amplitude': float(max_amplitude),
-            'avg_amplitude': float(avg_amplitude)
+            'ratio': amplitude_ratio,
+            'max_amplitude': max_amplitude,
+            'avg_amplitude': avg_amplitude
         }
 
-    def _evaluate_symmetry(self, landmarks_data: List[Dict]) -> Dict:
+    def _evaluate_symmetry(self, symmetry_diffs: np.ndarray) -> Dict:
         """
         What: 左右対称性評価
         Why: バランスの取れた腕振りを確認
-        Design Decision: 左右振幅差で評価（ADR-002）
+        Design Decision: 左右振幅差で評価、_compute_all()の時系列を集計（ADR-002, ADR-010）
 
         Args:
-            landmarks_data: フレームごとのランドマークデータ
+            symmetry_diffs: _compute_all()の左右振幅差時系列
 
         Returns:
             Dict: {'score': int (0-3), 'balance': float, 'avg_diff': float}
 
         CRITICAL: 左右差が小さいほど高スコア
         """
-        # PHASE CORE LOGIC: 左右対称性計算
-        symmetry_diffs = []
-
-        for frame_data in landmarks_data:
-            landmarks = frame_data['landmarks']
-            if len(landmarks) > max(self.LEFT_WRIST, self.RIGHT_WRIST):
-                # 左右手首の振り幅を計算
-                left_wrist_y = landmarks[self.LEFT_WRIST]['y']
-                right_wrist_y = landmarks[self.RIGHT_WRIST]['y']
-                left_shoulder_y = landmarks[self.LEFT_SHOULDER]['y']
-                right_shoulder_y = landmarks[self.RIGHT_SHOULDER]['y']
-
-                left_amplitude = abs(left_wrist_y - left_shoulder_y)
-                right_amplitude = abs(right_wrist_y - right_shoulder_y)
-
-                # 左右差を計算
-                diff = abs(left_amplitude - right_amplitude)
-                symmetry_diffs.append(diff)
-
-        if not symmetry_diffs:
+        # PHASE CORE LOGIC: 欠損フレーム除外とmax/meanを1パスで集計
+        _, max_diff, avg_diff, count = nan_min_max_mean(symmetry_diffs)
+
+        if count == 0:
             return {'score': 0, 'balance': None, 'avg_diff': None}
 
-        avg_diff = np.mean(symmetry_diffs)
-        max_diff = np.max(symmetry_diffs)
-
-        # スコアリング（左右差が小さいほど高スコア）
-        if avg_diff < 0.05:
-            score = 3
-            balance_level = "優秀"
-        elif avg_diff < 0.10:
-            score = 2
-            balance_level = "良好"
-        elif avg_diff < 0.15:
-            score = 1
-            balance_level = "改善の余地あり"
-        else:
-            score = 0
-            balance_level = "要トレーニング"
+        # スコアリング（左右差が小さいほど高スコア、0.05未満で3、0.10未満で2、0.15未満で1）
+        score = score_below(avg_diff, self._symmetry_bands)
 
         return {
             'score': score,
-            'balance': balance_level,
-            'avg_diff': float(avg_diff),
-            'max_diff': float(max_diff)
+            'balance': SCORE_LEVELS[score],
+            'avg_diff': avg_diff,
+            'max_diff': max_diff
         }
 
     def _generate_details(self,
@@ -256,29 +229,22 @@ class UpperBodySwingEvaluator:
 
         CRITICAL: NaNの場合は"データなし"と表示
         """
-        if total_score == 3:
-            level = "優秀"
-        elif total_score == 2:
-            level = "良好"
-        elif total_score == 1:
-            level = "改善の余地あり"
-        else:
-            level = "要トレーニング"
-
-        details = f"総合評価: {level}\n"
+        # 総合評価ラベル（スコア0-3で添字参照）
+        level = SCORE_LEVELS[total_score]
 
         # 腕振り振幅
-        details += f"腕振り振幅スコア: {amplitude_result['score']}/3 "
-        if amplitude_result['ratio'] is not None:
-            details += f"(肩幅比: {amplitude_result['ratio']:.2f})\n"
-        else:
-            details += "(データなし)\n"
+        amplitude_text = (f"(肩幅比: {amplitude_result['ratio']:.2f})"
+                          if amplitude_result['ratio'] is not None else NO_DATA)
 
         # 左右対称性
-        details += f"対称性スコア: {symmetry_result['score']}/3 "
-        if symmetry_result['balance'] is not None:
-            details += f"({symmetry_result['balance']})"
-        else:
-            details += "(データなし)"
+        symmetry_text = (f"({symmetry_result['balance']})"
+                         if symmetry_result['balance'] is not None else NO_DATA)
+
+        # 行ごとに組み立てて1回で連結（文字列の逐次連結を避ける）
+        details = "\n".join([
+            f"総合評価: {level}",
+            f"腕振り振幅スコア: {amplitude_result['score']}/3 {amplitude_text}",
+            f"対称性スコア: {symmetry_result['score']}/3 {symmetry_text}",
+        ])
 
         return details
@@ -1,18 +1,32 @@
 """
 Purpose: データ品質検証とエラー集約管理（Health Check）
 Responsibility: ランドマーク品質チェック、warnings.json出力、再現性保証
-Dependencies: numpy, json, config.json
+Dependencies: numpy, config.json, config_loader.py, json_io.py, landmarks.py
 Created: 2025-10-19 by Claude
-Decision Log: ADR-004
+Decision Log: ADR-004, ADR-010, ADR-012, ADR-013
 
 CRITICAL: 個人情報・環境変数をwarnings.jsonに記録禁止、random_seed必須適用
 """
 import numpy as np
-import json
 import random
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .config_loader import load_config
+from .json_io import dump_json
+from .landmarks import VISIBILITY, X, LandmarkInput, as_landmark_array
+
+# config.json必須キー（(セクション, キー, エラー表示名)、モジュール読み込み時に1回だけ生成）
+REQUIRED_CONFIG_KEYS = tuple(
+    (section, key, f"{section}.{key}")
+    for section, key in (
+        ('thresholds', 'confidence_min'),
+        ('thresholds', 'frame_skip_tolerance'),
+        ('data_integrity', 'random_seed'),
+        ('data_integrity', 'nan_handling'),
+    )
+)
 
 
 class HealthChecker:
@@ -35,13 +49,8 @@ class HealthChecker:
 
         CRITICAL: random_seed適用必須（データ整合性ルール準拠）
         """
-        # PHASE CORE LOGIC: config.json読み込み
-        config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"config.json not found: {config_path}")
-
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # PHASE CORE LOGIC: config.json読み込み（解析結果はプロセス内で共有、ADR-013）
+        self.config = load_config(config_path)
 
         # CRITICAL: random_seed適用（再現性保証、ADR-004）
         seed = self.config['data_integrity']['random_seed']
@@ -52,13 +61,15 @@ class HealthChecker:
         self.confidence_min = self.config['thresholds']['confidence_min']
         self.frame_skip_tolerance = self.config['thresholds']['frame_skip_tolerance']
 
-        # warnings履歴
+        # warnings履歴（timestampはISO 8601文字列、worker・handlerが直接参照）
         self.warnings: List[Dict] = []
 
     def check_landmark_quality(
         self,
-        landmarks_data: List[Dict],
-        video_path: Optional[str] = None
+        landmarks_data: LandmarkInput,
+        video_path: Optional[str] = None,
+        verbose: bool = False,
+        frames: Optional[Sequence[int]] = None
     ) -> Tuple[bool, Dict]:
         """
         What: ランドマーク品質検証（visibility閾値、フレームスキップ許容）
@@ -66,45 +77,51 @@ class HealthChecker:
         Design Decision: config.json閾値参照でチェック（ADR-004）
 
         Args:
-            landmarks_data: フレームごとのランドマークデータ
+            landmarks_data: フレームごとのランドマークデータ、またはshape (F, 33, 4)のSoA配列
             video_path: 動画パス（警告記録用、個人情報除外処理あり）
+            verbose: Trueの場合、低visibilityランドマーク一覧を結果に含める
+            frames: SoA配列入力時の各行のフレーム番号（extract_landmarks()の'frames'、未指定時は行位置）
 
         Returns:
             Tuple[bool, Dict]:
                 - 品質OK: True/False
                 - 詳細: {'total_frames': int, 'detected_frames': int, ...}
+                  verbose=True時は'low_visibility_landmarks':
+                  [{'frame': int, 'landmark_idx': int, 'visibility': float}, ...]
 
         CRITICAL: video_pathは匿名化してwarnings.json記録
         """
         total_frames = len(landmarks_data)
-        detected_frames = 0
-        low_visibility_frames = 0
-        low_visibility_landmarks = []
-
-        # PHASE CORE LOGIC: visibility品質チェック
-        for frame_data in landmarks_data:
-            landmarks = frame_data.get('landmarks', [])
-            if not landmarks:
-                continue
-
-            detected_frames += 1
-            frame_idx = frame_data.get('frame', -1)
-
-            # 各ランドマークのvisibility確認
-            low_vis_count = 0
-            for lm_idx, lm in enumerate(landmarks):
-                visibility = lm.get('visibility', 0.0)
-                if visibility < self.confidence_min:
-                    low_vis_count += 1
-                    low_visibility_landmarks.append({
-                        'frame': frame_idx,
-                        'landmark_idx': lm_idx,
-                        'visibility': float(visibility)
-                    })
-
-            # フレーム内の低visibility割合
-            if landmarks and (low_vis_count / len(landmarks)) > 0.3:
-                low_visibility_frames += 1
+
+        # PHASE CORE LOGIC: visibility品質チェック（全ランドマークを1次元配列化して一括判定）
+        if isinstance(landmarks_data, np.ndarray):
+            landmark_counts, visibilities = self._array_visibilities(landmarks_data)
+        else:
+            landmark_counts = np.fromiter(
+                (len(frame_data.get('landmarks', [])) for frame_data in landmarks_data),
+                dtype=np.int64, count=total_frames
+            )
+            # CRITICAL: visibilityキー欠損は0.0扱い（低visibility）、NaNは閾値判定しない
+            visibilities = np.fromiter(
+                (lm.get('visibility', 0.0)
+                 for frame_data in landmarks_data
+                 for lm in frame_data.get('landmarks', [])),
+                dtype=np.float64, count=int(landmark_counts.sum())
+            )
+        low_visibility = visibilities < self.confidence_min
+
+        # フレームごとの低visibility数（ランドマークなしフレームは0）
+        frame_ids = np.repeat(np.arange(total_frames), landmark_counts)
+        low_per_frame = np.bincount(frame_ids, weights=low_visibility, minlength=total_frames)
+
+        detected = landmark_counts > 0
+        detected_frames = int(detected.sum())
+
+        # フレーム内の低visibility割合（ランドマーク数基準）
+        low_ratio = np.divide(low_per_frame, landmark_counts,
+                              out=np.zeros(total_frames), where=detected)
+        low_visibility_frames = int((low_ratio > 0.3).sum())
+        low_visibility_landmarks_count = int(low_visibility.sum())
 
         # フレームスキップ許容チェック
         detection_rate = detected_frames / total_frames if total_frames > 0 else 0
@@ -125,10 +142,16 @@ class HealthChecker:
             'detected_frames': detected_frames,
             'detection_rate': float(detection_rate),
             'low_visibility_frames': low_visibility_frames,
-            'low_visibility_landmarks_count': len(low_visibility_landmarks),
+            'low_visibility_landmarks_count': low_visibility_landmarks_count,
             'is_quality_ok': is_quality_ok
         }
 
+        # 低visibilityランドマーク一覧は要求時のみ生成（該当数kに比例、O(F×33)走査なし）
+        if verbose:
+            result['low_visibility_landmarks'] = self._low_visibility_details(
+                landmarks_data, landmark_counts, visibilities, low_visibility, frames
+            )
+
         # 品質NGの場合はwarning記録
         if not is_quality_ok:
             # SECURITY REQUIREMENT: video_path匿名化
@@ -145,6 +168,62 @@ class HealthChecker:
 
         return is_quality_ok, result
 
+    @staticmethod
+    def _array_visibilities(landmarks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        What: SoA配列からフレームごとのランドマーク数と検出ランドマークのvisibility列を取得
+        Why: List[Dict]入力と同じ1次元配列上の判定ロジックを共有
+        Design Decision: x座標NaNのランドマークは未検出扱い（ADR-010）
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (landmark_counts shape (F,), visibilities shape (N,))
+
+        CRITICAL: visibility欠損（NaN）は閾値判定しない（low_visibility_frames()と同一、ADR-014）
+        """
+        lm = as_landmark_array(landmarks)
+        present = ~np.isnan(lm[:, :, X])
+        return present.sum(axis=1), lm[:, :, VISIBILITY][present].astype(np.float64)
+
+    def _low_visibility_details(self,
+                                landmarks_data: LandmarkInput,
+                                landmark_counts: np.ndarray,
+                                visibilities: np.ndarray,
+                                low_visibility: np.ndarray,
+                                frames: Optional[Sequence[int]] = None) -> List[Dict]:
+        """
+        What: 低visibilityランドマークの(フレーム, ランドマーク番号, visibility)一覧を生成
+        Why: デバッグ用の詳細はverbose指定時のみ必要
+        Design Decision: 1次元配列上の該当位置からフレーム・ランドマーク番号を逆算（ADR-004）
+
+        CRITICAL: frameキー欠損フレームは-1、SoA配列入力はframes指定時のみ元のフレーム番号（未指定時は行位置）
+        """
+        positions = np.flatnonzero(low_visibility)
+        frame_ends = np.cumsum(landmark_counts)
+        frame_ids = np.searchsorted(frame_ends, positions, side='right')
+
+        if isinstance(landmarks_data, np.ndarray):
+            # 未検出ランドマークを飛ばした位置から元のランドマーク番号を復元
+            landmark_ids = np.nonzero(~np.isnan(landmarks_data[:, :, X]))[1]
+            frame_numbers = frame_ids if frames is None else np.asarray(frames)[frame_ids]
+            return [
+                {
+                    'frame': frame_number,
+                    'landmark_idx': int(landmark_ids[position]),
+                    'visibility': float(visibilities[position])
+                }
+                for position, frame_number in zip(positions.tolist(), frame_numbers.tolist())
+            ]
+
+        offsets = frame_ends - landmark_counts
+        return [
+            {
+                'frame': landmarks_data[frame_id].get('frame', -1),
+                'landmark_idx': int(position - offsets[frame_id]),
+                'visibility': float(visibilities[position])
+            }
+            for position, frame_id in zip(positions.tolist(), frame_ids.tolist())
+        ]
+
     def validate_config(self) -> Tuple[bool, List[str]]:
         """
         What: config.json整合性検証
@@ -158,33 +237,26 @@ class HealthChecker:
 
         CRITICAL: random_seed存在必須
         """
-        errors = []
-
-        # PHASE CORE LOGIC: 必須キー確認
-        required_keys = [
-            ('thresholds', 'confidence_min'),
-            ('thresholds', 'frame_skip_tolerance'),
-            ('data_integrity', 'random_seed'),
-            ('data_integrity', 'nan_handling')
+        # PHASE CORE LOGIC: 必須キー確認（セクションdictは1回だけ取得）
+        sections = {
+            'thresholds': self.config.get('thresholds', {}),
+            'data_integrity': self.config.get('data_integrity', {}),
+        }
+        errors = [
+            f"Missing required config key: {name}"
+            for section, key, name in REQUIRED_CONFIG_KEYS
+            if key not in sections[section]
         ]
 
-        for keys in required_keys:
-            obj = self.config
-            for key in keys:
-                if key not in obj:
-                    errors.append(f"Missing required config key: {'.'.join(keys)}")
-                    break
-                obj = obj[key]
-
         # 閾値範囲チェック
-        if 'confidence_min' in self.config.get('thresholds', {}):
-            conf_min = self.config['thresholds']['confidence_min']
+        if 'confidence_min' in sections['thresholds']:
+            conf_min = sections['thresholds']['confidence_min']
             if not (0.0 <= conf_min <= 1.0):
                 errors.append(f"Invalid confidence_min: {conf_min} (must be 0.0-1.0)")
 
         # random_seed型チェック
-        if 'random_seed' in self.config.get('data_integrity', {}):
-            seed = self.config['data_integrity']['random_seed']
+        if 'random_seed' in sections['data_integrity']:
+            seed = sections['data_integrity']['random_seed']
             if not isinstance(seed, int):
                 errors.append(f"Invalid random_seed type: {type(seed)} (must be int)")
 
@@ -230,8 +302,8 @@ class HealthChecker:
         # SECURITY REQUIREMENT: 環境変数除外確認
         # （現状、config.jsonに環境変数なし。将来Azure連携時に注意）
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(warnings_data, f, indent=2, ensure_ascii=False)
+        # orjson利用可能時は高速シリアライズ（ADR-012）
+        dump_json(warnings_data, output_file)
 
         return output_file
 
@@ -315,8 +387,7 @@ def apply_random_seed(config_path: str = 'config.json'):
 
     CRITICAL: 全処理開始前に必ず実行
     """
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    config = load_config(config_path)
 
     seed = config['data_integrity']['random_seed']
     random.seed(seed)
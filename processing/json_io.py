@@ -0,0 +1,89 @@
+"""
+Purpose: JSON入出力の共通処理
+Responsibility: orjson利用可能時の高速シリアライズ・パースと標準jsonへのフォールバック
+Dependencies: orjson（任意）, numpy
+Created: 2026-10-15 by Claude
+Decision Log: ADR-012
+
+CRITICAL: orjson未インストール環境でも同一APIで動作すること
+"""
+import json
+from pathlib import Path
+from typing import Any, Union
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 任意依存
+    orjson = None
+
+
+def _to_builtin(obj: Any) -> Any:
+    """
+    What: numpy型をJSON互換のPython組み込み型に変換（標準json用）
+    Why: orjsonのOPT_SERIALIZE_NUMPYと同等の入力を標準jsonでも受け付ける
+    Design Decision: json.dumpsのdefaultフック（ADR-012）
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any, indent: bool = True) -> bytes:
+    """
+    What: オブジェクトをUTF-8 JSONバイト列に変換
+    Why: 数値主体の大きなペイロードで標準jsonがボトルネック
+    Design Decision: orjson優先、未インストール時は標準json（ADR-012）
+
+    Args:
+        obj: シリアライズ対象（numpy配列・スカラー可）
+        indent: 2スペースインデントの有無
+
+    Returns:
+        bytes: UTF-8エンコード済みJSON（非ASCII文字はエスケープしない）
+
+    CRITICAL: orjsonはNaNをnullとして出力（標準jsonはNaNリテラル）
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    text = json.dumps(obj, indent=2 if indent else None,
+                      ensure_ascii=False, default=_to_builtin)
+    return text.encode('utf-8')
+
+
+def dump_json(obj: Any, filepath: Union[str, Path], indent: bool = True) -> None:
+    """
+    What: オブジェクトをJSONファイルに保存
+    Why: 保存処理のシリアライザ選択を一元化
+    Design Decision: バイト列を一括書き込み（ADR-012）
+    """
+    Path(filepath).write_bytes(dumps_json(obj, indent=indent))
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    What: JSONバイト列（または文字列）をPythonオブジェクトに変換
+    Why: 設定ファイル等の読み込みでもシリアライザ選択を一元化
+    Design Decision: orjson優先、未インストール時は標準json（ADR-012）
+
+    CRITICAL: orjsonはNaN/Infinityリテラルを受け付けない（標準jsonは受け付ける）
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(filepath: Union[str, Path]) -> Any:
+    """
+    What: JSONファイルを読み込み
+    Why: 読み込み処理のパーサ選択を一元化
+    Design Decision: バイト列を一括読み込みしてパース（ADR-012）
+    """
+    return loads_json(Path(filepath).read_bytes())
@@ -0,0 +1,263 @@
+"""
+Purpose: ランドマークデータのSoA（Structure of Arrays）変換
+Responsibility: List[Dict]形式のランドマークと(F, 33, 4) float32配列の相互変換、保存用量子化
+Dependencies: numpy
+Created: 2026-10-15 by Claude
+Decision Log: ADR-010, ADR-011
+
+CRITICAL: チャネル順序は(x, y, z, visibility)固定、欠損値はNaNで保持（行削除禁止）
+"""
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Union
+
+# CRITICAL: MediaPipe Pose標準仕様（33キーポイント × 4チャネル）
+NUM_LANDMARKS = 33
+LANDMARK_CHANNELS = ('x', 'y', 'z', 'visibility')
+NUM_CHANNELS = len(LANDMARK_CHANNELS)
+
+# チャネルインデックス（arr[..., X]形式で参照）
+X, Y, Z, VISIBILITY = range(NUM_CHANNELS)
+
+LandmarkInput = Union[List[Dict], np.ndarray]
+
+# 座標保持の精度（MediaPipe正規化座標は有効桁4桁程度、float64は過剰）
+# CRITICAL: 角度計算はarccos桁落ち回避のため_angles.pyでfloat64へ昇格（ADR-010）
+LANDMARK_DTYPE = np.float32
+
+# 量子化設定（1.0 = 10000、分解能1e-4、表現範囲±3.2767）
+# CRITICAL: z座標は負値を取るため符号付きint16、NaNは最小値で表現
+QUANT_SCALE = 10000
+QUANT_NAN = np.iinfo(np.int16).min
+QUANT_DTYPE = '<i2'
+
+# 非圧縮保存形式（.npy、(F, 33, 4) float32リトルエンディアン）
+PACKED_DTYPE = '<f4'
+
+# 評価に使うランドマークのvisibility下限の既定値（config.json thresholds.visibility_min未設定時、ADR-014）
+DEFAULT_VISIBILITY_MIN = 0.5
+
+
+def stack_landmarks(landmarks_data: List[Dict]) -> np.ndarray:
+    """
+    What: List[Dict]形式のランドマークを(F, 33, 4) float32配列に変換
+    Why: フレームごとのdictアクセスを排除し、評価処理をNumPyでベクトル化
+    Design Decision: 1回の走査で事前確保済み配列へ書き込み（ADR-010）
+
+    Args:
+        landmarks_data: [{'frame': int, 'timestamp': float, 'landmarks': [...]}, ...]
+
+    Returns:
+        np.ndarray: shape (F, 33, 4), dtype float32
+
+    CRITICAL: ランドマーク不足・キー欠損はNaNで保持（フレーム削除禁止）
+    """
+    nan = float('nan')
+    arr = np.full((len(landmarks_data), NUM_LANDMARKS, NUM_CHANNELS), np.nan, dtype=LANDMARK_DTYPE)
+
+    for frame_idx, frame_data in enumerate(landmarks_data):
+        landmarks = frame_data.get('landmarks', [])[:NUM_LANDMARKS]
+        if not landmarks:
+            continue
+        arr[frame_idx, :len(landmarks)] = [
+            (lm.get('x', nan), lm.get('y', nan), lm.get('z', nan), lm.get('visibility', nan))
+            for lm in landmarks
+        ]
+
+    return arr
+
+
+def landmark_list_to_array(landmark_list) -> np.ndarray:
+    """
+    What: MediaPipeのlandmark繰り返しフィールドを(N, 4) float32配列に変換
+    Why: ランドマークごとのdict生成・ndarray代入（33回/フレーム）を排除
+    Design Decision: np.fromiterで1回の確保・一括書き込み（ADR-010）
+
+    Args:
+        landmark_list: results.pose_landmarks.landmark（x, y, z, visibility属性を持つ要素列）
+
+    Returns:
+        np.ndarray: shape (N, 4), dtype float32
+
+    CRITICAL: チャネル順序はLANDMARK_CHANNELSと同一
+    """
+    values = np.fromiter(
+        (v for lm in landmark_list for v in (lm.x, lm.y, lm.z, lm.visibility)),
+        dtype=LANDMARK_DTYPE,
+        count=len(landmark_list) * NUM_CHANNELS
+    )
+    return values.reshape(-1, NUM_CHANNELS)
+
+
+def as_landmark_array(landmarks_data: LandmarkInput) -> np.ndarray:
+    """
+    What: 入力をSoA配列に正規化（ndarrayはそのまま、List[Dict]は変換）
+    Why: 既存のList[Dict]呼び出し元と配列呼び出し元を同一APIで受け付ける
+    Design Decision: ndarray入力時はコピーなし（ADR-010）
+
+    Returns:
+        np.ndarray: shape (F, 33, 4), dtype float32
+
+    CRITICAL: ndarray入力は(F, 33, 4)形状のみ受け付ける（形状不正はValueError）
+    """
+    if isinstance(landmarks_data, np.ndarray):
+        # 形状は入口で1回だけ検証（評価器側のフレームごとのランドマーク数チェックは不要）
+        if landmarks_data.ndim != 3 or landmarks_data.shape[1:] != (NUM_LANDMARKS, NUM_CHANNELS):
+            raise ValueError(f"ランドマーク配列の形状が不正です: {landmarks_data.shape}")
+        return landmarks_data.astype(LANDMARK_DTYPE, copy=False)
+    return stack_landmarks(landmarks_data)
+
+
+def save_landmarks_npy(filepath, landmarks: np.ndarray) -> None:
+    """
+    What: SoA配列を非圧縮.npyファイルに保存
+    Why: 長尺動画のランドマークをList[Dict]（約200バイト/点）を経ずに受け渡す（16バイト/点）
+    Design Decision: float32リトルエンディアン固定、量子化なし（ADR-010）
+
+    Args:
+        filepath: 保存先（.npy）
+        landmarks: shape (F, 33, 4)
+
+    CRITICAL: 読み込みはload_landmarks_mmap()（メモリマップ参照）
+    """
+    np.save(filepath, np.ascontiguousarray(as_landmark_array(landmarks), dtype=PACKED_DTYPE))
+
+
+def load_landmarks_mmap(filepath) -> np.ndarray:
+    """
+    What: save_landmarks_npy()の保存ファイルをメモリマップで参照
+    Why: 全フレームを一括読み込みせず、評価で参照した部分のみページイン
+    Design Decision: 読み取り専用mmap（mmap_mode='r'）、allow_pickle=False（ADR-010）
+
+    Returns:
+        np.ndarray: shape (F, 33, 4), dtype float32（np.memmap、読み取り専用）
+
+    CRITICAL: 形状・dtype不正はValueError（評価器へ渡す前に検証）
+    """
+    landmarks = np.load(filepath, mmap_mode='r', allow_pickle=False)
+    if landmarks.dtype != np.dtype(PACKED_DTYPE):
+        raise ValueError(f"ランドマーク配列のdtypeが不正です: {landmarks.dtype}")
+    return as_landmark_array(landmarks)
+
+
+def low_visibility_frames(lm: np.ndarray,
+                          indices: Sequence[int],
+                          threshold: float) -> np.ndarray:
+    """
+    What: 指定ランドマークのいずれかがvisibility閾値未満のフレームを判定
+    Why: 低信頼度フレームを評価の集計から除外（フレームごとのPython分岐なしで一括判定）
+    Design Decision: visibility欠損（NaN）は判定不能として除外しない（visibilityなし入力と互換、ADR-014）
+
+    Args:
+        lm: shape (F, 33, 4) ランドマーク配列
+        indices: 判定対象ランドマークインデックス
+        threshold: visibility下限（config.json visibility_min）
+
+    Returns:
+        np.ndarray: shape (F,), bool（Trueが低visibilityフレーム）
+
+    CRITICAL: フレームは削除しない（呼び出し側で時系列をNaN化）
+    """
+    return (lm[:, list(indices), VISIBILITY] < threshold).any(axis=1)
+
+
+def landmarks_to_records(
+    landmarks: np.ndarray,
+    frames: Sequence[int],
+    fps: Optional[float]
+) -> List[Dict]:
+    """
+    What: SoA配列をJSON互換のList[Dict]形式に戻す
+    Why: 保存ファイルのフォーマット互換性維持（ADR-005）
+    Design Decision: tolist()で一括Python float化（ADR-010）
+
+    Args:
+        landmarks: shape (F, 33, 4)
+        frames: 各行のフレーム番号
+        fps: 動画FPS（timestamp計算用）
+
+    Returns:
+        List[Dict]: [{'frame': int, 'timestamp': float, 'landmarks': [...]}, ...]
+
+    CRITICAL: 出力キー構成はextract_landmarks()の既存フォーマットと同一
+    """
+    records = []
+    for frame_idx, rows in zip(frames, landmarks.tolist()):
+        frame_idx = int(frame_idx)
+        records.append({
+            'frame': frame_idx,
+            'timestamp': frame_idx / fps if fps else 0,
+            'landmarks': [dict(zip(LANDMARK_CHANNELS, row)) for row in rows]
+        })
+    return records
+
+
+def quantize_landmarks(landmarks: np.ndarray) -> np.ndarray:
+    """
+    What: SoA配列をint16固定小数点に量子化
+    Why: 保存サイズをfloat32の1/2、List[Dict]の1/20以下に削減
+    Design Decision: 正規化座標に対し分解能1e-4（1080p画素幅≒5e-4より細かい、ADR-011）
+
+    Returns:
+        np.ndarray: landmarksと同形状、dtype int16
+
+    CRITICAL: NaNはQUANT_NANで保持（欠損情報を失わない）、範囲外は飽和
+    """
+    limit = np.iinfo(np.int16).max
+    scaled = np.rint(np.asarray(landmarks, dtype=np.float64) * QUANT_SCALE)
+    quantized = np.clip(np.nan_to_num(scaled), -limit, limit).astype(np.int16)
+    quantized[np.isnan(scaled)] = QUANT_NAN
+    return quantized
+
+
+def dequantize_landmarks(quantized: np.ndarray, scale: int = QUANT_SCALE) -> np.ndarray:
+    """
+    What: int16量子化配列をfloat32 SoA配列に復元
+    Why: 保存データの評価処理への再投入
+    Design Decision: quantize_landmarks()の逆変換（ADR-011）
+
+    CRITICAL: QUANT_NANはNaNに復元
+    """
+    arr = quantized.astype(LANDMARK_DTYPE) / scale
+    arr[quantized == QUANT_NAN] = np.nan
+    return arr
+
+
+def save_landmarks_npz(filepath, landmarks: np.ndarray, frames: Sequence[int],
+                       fps: Optional[float]) -> None:
+    """
+    What: SoA配列をnpzサイドカーファイルに保存
+    Why: JSONへのランドマーク埋め込み（テキスト化・base64化）を排除
+    Design Decision: int16量子化 + savez_compressed（ADR-011）
+
+    Args:
+        filepath: 保存先（.npz）
+        landmarks: shape (F, 33, 4)
+        frames: 各行のフレーム番号
+        fps: 動画FPS
+
+    CRITICAL: NaNはQUANT_NANで保持、復元はload_landmarks_npz()
+    """
+    np.savez_compressed(
+        filepath,
+        landmarks=quantize_landmarks(landmarks),
+        frames=np.asarray(frames, dtype=np.int64),
+        scale=np.int64(QUANT_SCALE),
+        fps=np.float64(fps or 0.0)
+    )
+
+
+def load_landmarks_npz(filepath) -> Dict:
+    """
+    What: save_landmarks_npz()の保存内容を復元
+    Why: 保存済み解析結果のランドマーク再利用
+    Design Decision: allow_pickle=False（任意コード実行防止）
+
+    Returns:
+        Dict: {'landmarks': (F, 33, 4) float32, 'frames': (F,) int64, 'fps': float}
+    """
+    with np.load(filepath, allow_pickle=False) as data:
+        return {
+            'landmarks': dequantize_landmarks(data['landmarks'], int(data['scale'])),
+            'frames': data['frames'],
+            'fps': float(data['fps'])
+        }
@@ -1,16 +1,49 @@
 """
 Purpose: 身体スケール正規化処理
 Responsibility: ランドマーク座標から身体基準距離を計算し、個人差・カメラ距離依存性を排除
-Dependencies: numpy, config.json
+Dependencies: numpy, config.json, config_loader.py, landmarks.py
 Created: 2025-10-19 by Claude
-Decision Log: ADR-003
+Decision Log: ADR-003, ADR-010, ADR-013
 
 CRITICAL: NaN保持必須（列削除禁止）、config.json normalization設定参照
 """
+import math
 import numpy as np
-import json
-from typing import Dict, List, Optional, Tuple
-from pathlib import Path
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from .config_loader import config_cache_key, load_config
+from .landmarks import LandmarkInput, X, Z, as_landmark_array
+
+# 正規化基準値のキー（代表値・フレーム別値の辞書キー順序）
+REFERENCE_KEYS = ('shoulder_width', 'pelvis_width', 'leg_length', 'base_width')
+
+# 1フレーム分のランドマーク（List[Dict]または(33, 4)配列）、または(F, 33, 4)時系列配列
+FrameLandmarks = Union[List[Dict], np.ndarray]
+
+
+class FrameNormalizations(Sequence):
+    """
+    What: フレーム別正規化基準値の読み取り専用ビュー
+    Why: 評価器は代表値のみ使用するため、全フレーム分の辞書生成を参照時まで遅延
+    Design Decision: (4, F)基準値行列を保持し、要素アクセス時に1フレーム分の辞書を生成（ADR-010）
+
+    CRITICAL: 各要素は従来のリスト要素と同じ{'shoulder_width': Optional[float], ...}形式
+    """
+
+    def __init__(self, widths: np.ndarray):
+        self._widths = widths
+
+    def __len__(self) -> int:
+        return self._widths.shape[1]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        # CRITICAL: 計算不可（NaN）はNone（キー削除禁止）
+        column = self._widths[:, index].tolist()
+        return {key: (None if value != value else value) for key, value in zip(REFERENCE_KEYS, column)}
 
 
 class BodyNormalizer:
@@ -33,6 +66,9 @@ class BodyNormalizer:
     LEFT_ANKLE = 27
     RIGHT_ANKLE = 28
 
+    # 脚長計算に必要な最小ランドマーク数（クラス定義時に1回だけ計算）
+    _MIN_LANDMARKS_LOWER = max(LEFT_ANKLE, RIGHT_ANKLE) + 1
+
     def __init__(self, config_path: str = 'config.json'):
         """
         What: config.json読み込みと正規化設定初期化
@@ -41,13 +77,8 @@ class BodyNormalizer:
 
         CRITICAL: config_path変更時は全テスト更新必須
         """
-        # PHASE CORE LOGIC: config.json読み込み
-        config_file = Path(config_path)
-        if not config_file.exists():
-            raise FileNotFoundError(f"config.json not found: {config_path}")
-
-        with open(config_file, 'r', encoding='utf-8') as f:
-            self.config = json.load(f)
+        # PHASE CORE LOGIC: config.json読み込み（プロセス内キャッシュ、ADR-013）
+        self.config = load_config(config_path)
 
         # 正規化設定を取得
         self.normalization_config = self.config.get('normalization', {})
@@ -68,101 +99,122 @@ class BodyNormalizer:
         CRITICAL: NaN入力時はNoneを返す（列削除禁止）
         """
         try:
-            # CRITICAL: NaN/None チェック
-            if any(key not in point1 or key not in point2 for key in ['x', 'y', 'z']):
-                return None
-
+            # CRITICAL: キー欠損はKeyErrorとしてNone返却
             x1, y1, z1 = point1['x'], point1['y'], point1['z']
             x2, y2, z2 = point2['x'], point2['y'], point2['z']
 
-            # NaNチェック
-            if any(np.isnan([x1, y1, z1, x2, y2, z2])):
+            # NaNチェック（x != x はNaNのみTrue、NumPy配列を生成しないスカラー比較）
+            if x1 != x1 or y1 != y1 or z1 != z1 or x2 != x2 or y2 != y2 or z2 != z2:
                 return None
 
             # 3D距離計算
-            distance = np.sqrt((x2 - x1)**2 + (y2 - y1)**2 + (z2 - z1)**2)
-
-            return float(distance)
+            return math.sqrt((x2 - x1)**2 + (y2 - y1)**2 + (z2 - z1)**2)
 
         except (KeyError, TypeError, ValueError):
             # CRITICAL: エラー時はNoneを返す（データ保持）
             return None
 
-    def calculate_shoulder_width(self, landmarks: List[Dict]) -> Optional[float]:
+    def _distance_series(self,
+                         coords: np.ndarray,
+                         idx1: int,
+                         idx2: int,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        What: 全フレームの2点間3D距離を一括計算
+        Why: calculate_distance()のフレームごと呼び出しを排除
+        Design Decision: 差分をfloat64で計算（スカラー版と同精度、ADR-010）、
+                         out指定時は確保済み配列へ書き込み
+
+        CRITICAL: どちらかの座標がNaNのフレームはNaN
+        """
+        diff = np.subtract(coords[:, idx1], coords[:, idx2], dtype=np.float64)
+        squared = np.einsum('ij,ij->i', diff, diff, out=out)
+        return np.sqrt(squared, out=squared)
+
+    def _pair_distance(self, landmarks: FrameLandmarks, idx1: int, idx2: int):
+        """
+        What: ランドマーク2点間距離（List[Dict]・配列入力の振り分け）
+        Why: 配列入力時はdictキー確認・NaNチェック用リスト生成を省略しNumPy演算のみで計算
+        Design Decision: (33, 4)配列はスカラー、(F, 33, 4)配列は(F,)時系列を返す（ADR-010）
+
+        Returns:
+            Optional[float] | np.ndarray: 距離（計算不可はNone、時系列ではNaN）
+
+        CRITICAL: List[Dict]入力は従来通りcalculate_distance()経由
+        """
+        if isinstance(landmarks, np.ndarray):
+            if landmarks.ndim == 3:
+                return self._distance_series(landmarks[:, :, X:Z + 1], idx1, idx2)
+            distance = self._distance_series(landmarks[np.newaxis, :, X:Z + 1], idx1, idx2)[0]
+            return None if np.isnan(distance) else float(distance)
+
+        # ランドマーク不足はIndexErrorで判定（呼び出しごとのmax()計算なし）
+        try:
+            point1, point2 = landmarks[idx1], landmarks[idx2]
+        except IndexError:
+            return None
+        return self.calculate_distance(point1, point2)
+
+    def calculate_shoulder_width(self, landmarks: FrameLandmarks) -> Optional[float]:
         """
         What: 肩幅計算（landmarks 11-12間距離）
         Why: 上半身動作の正規化基準（upper_body_swing, push_pull）
         Design Decision: LEFT_SHOULDER - RIGHT_SHOULDER 距離（ADR-003）
 
         Args:
-            landmarks: ランドマークリスト（33個想定）
+            landmarks: ランドマークリスト（33個想定）、または(33, 4) / (F, 33, 4)配列
 
         Returns:
-            float: 肩幅、計算不可の場合はNone
+            float: 肩幅、計算不可の場合はNone（(F, 33, 4)配列入力時は(F,)配列、計算不可はNaN）
 
         CRITICAL: landmarks不足時はNoneを返す（エラー投げない）
         """
         # PHASE CORE LOGIC: landmarks 11-12 distance
-        if len(landmarks) <= max(self.LEFT_SHOULDER, self.RIGHT_SHOULDER):
-            return None
+        return self._pair_distance(landmarks, self.LEFT_SHOULDER, self.RIGHT_SHOULDER)
 
-        left_shoulder = landmarks[self.LEFT_SHOULDER]
-        right_shoulder = landmarks[self.RIGHT_SHOULDER]
-
-        return self.calculate_distance(left_shoulder, right_shoulder)
-
-    def calculate_pelvis_width(self, landmarks: List[Dict]) -> Optional[float]:
+    def calculate_pelvis_width(self, landmarks: FrameLandmarks) -> Optional[float]:
         """
         What: 骨盤幅計算（landmarks 23-24間距離）
         Why: 下半身動作の正規化基準（skater_lunge, cross_step）
         Design Decision: LEFT_HIP - RIGHT_HIP 距離（ADR-003）
 
         Args:
-            landmarks: ランドマークリスト（33個想定）
+            landmarks: ランドマークリスト（33個想定）、または(33, 4) / (F, 33, 4)配列
 
         Returns:
-            float: 骨盤幅、計算不可の場合はNone
+            float: 骨盤幅、計算不可の場合はNone（(F, 33, 4)配列入力時は(F,)配列、計算不可はNaN）
 
         CRITICAL: landmarks不足時はNoneを返す（エラー投げない）
         """
         # PHASE CORE LOGIC: landmarks 23-24 distance
-        if len(landmarks) <= max(self.LEFT_HIP, self.RIGHT_HIP):
-            return None
-
-        left_hip = landmarks[self.LEFT_HIP]
-        right_hip = landmarks[self.RIGHT_HIP]
+        return self._pair_distance(landmarks, self.LEFT_HIP, self.RIGHT_HIP)
 
-        return self.calculate_distance(left_hip, right_hip)
-
-    def calculate_leg_length(self, landmarks: List[Dict]) -> Optional[float]:
+    def calculate_leg_length(self, landmarks: FrameLandmarks) -> Optional[float]:
         """
         What: 下肢長計算（hip to ankle平均距離）
         Why: 脚動作の正規化基準（stride_mimic, jump_landing）
         Design Decision: 左右脚の平均値で個人差吸収（ADR-003）
 
         Args:
-            landmarks: ランドマークリスト（33個想定）
+            landmarks: ランドマークリスト（33個想定）、または(33, 4) / (F, 33, 4)配列
 
         Returns:
-            float: 下肢長、計算不可の場合はNone
+            float: 下肢長、計算不可の場合はNone（(F, 33, 4)配列入力時は(F,)配列、計算不可はNaN）
 
         CRITICAL: 片側のみ計算可能な場合はその値を使用（両側NaNの場合のみNone）
         """
+        if isinstance(landmarks, np.ndarray) and landmarks.ndim == 3:
+            return self.calculate_reference_series(landmarks)['leg_length']
+
         # PHASE CORE LOGIC: average hip to ankle distance
-        if len(landmarks) <= max(self.LEFT_ANKLE, self.RIGHT_ANKLE):
+        if len(landmarks) < self._MIN_LANDMARKS_LOWER:
             return None
 
         # 左脚長計算
-        left_leg_length = self.calculate_distance(
-            landmarks[self.LEFT_HIP],
-            landmarks[self.LEFT_ANKLE]
-        )
+        left_leg_length = self._pair_distance(landmarks, self.LEFT_HIP, self.LEFT_ANKLE)
 
         # 右脚長計算
-        right_leg_length = self.calculate_distance(
-            landmarks[self.RIGHT_HIP],
-            landmarks[self.RIGHT_ANKLE]
-        )
+        right_leg_length = self._pair_distance(landmarks, self.RIGHT_HIP, self.RIGHT_ANKLE)
 
         # CRITICAL: NaN処理（両側使用可能なら平均、片側のみなら単独値）
         if left_leg_length is not None and right_leg_length is not None:
@@ -174,20 +226,23 @@ class BodyNormalizer:
         else:
             return None
 
-    def calculate_base_width(self, landmarks: List[Dict]) -> Optional[float]:
+    def calculate_base_width(self, landmarks: FrameLandmarks) -> Optional[float]:
         """
         What: 基準幅計算（max(shoulder_width, pelvis_width)）
         Why: 全身動作の統一正規化基準（skater_lunge, cross_step）
         Design Decision: 肩幅と骨盤幅の大きい方を採用（ADR-003）
 
         Args:
-            landmarks: ランドマークリスト（33個想定）
+            landmarks: ランドマークリスト（33個想定）、または(33, 4) / (F, 33, 4)配列
 
         Returns:
-            float: 基準幅、計算不可の場合はNone
+            float: 基準幅、計算不可の場合はNone（(F, 33, 4)配列入力時は(F,)配列、計算不可はNaN）
 
         CRITICAL: 片側のみ計算可能な場合はその値を使用
         """
+        if isinstance(landmarks, np.ndarray) and landmarks.ndim == 3:
+            return self.calculate_reference_series(landmarks)['base_width']
+
         # PHASE CORE LOGIC: max(shoulder_width, pelvis_width)
         shoulder_width = self.calculate_shoulder_width(landmarks)
         pelvis_width = self.calculate_pelvis_width(landmarks)
@@ -228,53 +283,144 @@ class BodyNormalizer:
             'base_width': self.calculate_base_width(landmarks)
         }
 
+    def _reference_widths(self, lm: np.ndarray) -> np.ndarray:
+        """
+        What: 全フレームの正規化基準値を(4, F)行列として一括計算
+        Why: 基準値ごとの中間配列確保を避け、1つの行列へ直接書き込む
+        Design Decision: 行順序はREFERENCE_KEYS、float64（ADR-010）
+
+        CRITICAL: 計算不可フレームはNaN、片側のみ計算可能な場合はその値を使用
+        """
+        coords = lm[:, :, X:Z + 1]
+        widths = np.empty((len(REFERENCE_KEYS), len(lm)))
+        shoulder, pelvis, leg, base = widths
+
+        # PHASE CORE LOGIC: 基準距離の一括計算（各行へ直接書き込み）
+        self._distance_series(coords, self.LEFT_SHOULDER, self.RIGHT_SHOULDER, out=shoulder)
+        self._distance_series(coords, self.LEFT_HIP, self.RIGHT_HIP, out=pelvis)
+
+        # np.fmax: 片側NaNなら他方、両側NaNならNaN
+        np.fmax(shoulder, pelvis, out=base)
+
+        # CRITICAL: NaN処理（両側使用可能なら平均、片側のみなら単独値）
+        # 欠損側を他方で補完してから平均（両側NaNのみNaN、np.nanmeanの警告回避）
+        self._distance_series(coords, self.LEFT_HIP, self.LEFT_ANKLE, out=leg)
+        right_leg = self._distance_series(coords, self.RIGHT_HIP, self.RIGHT_ANKLE)
+        np.copyto(leg, right_leg, where=np.isnan(leg))
+        np.copyto(right_leg, leg, where=np.isnan(right_leg))
+        leg += right_leg
+        leg *= 0.5
+
+        return widths
+
+    def calculate_reference_series(self, landmarks_data: LandmarkInput) -> Dict[str, np.ndarray]:
+        """
+        What: 全フレームの正規化基準値を時系列配列として一括計算
+        Why: フレームごとのdictアクセス・スカラー演算を排除（ADR-010）
+        Design Decision: normalize_frame_data()と同一の欠損規則をNaNで表現
+
+        Args:
+            landmarks_data: フレームごとのランドマークデータ、または(F, 33, 4)配列
+
+        Returns:
+            Dict: {'shoulder_width': np.ndarray (F,), ...}、計算不可フレームはNaN
+
+        CRITICAL: 片側のみ計算可能な場合はその値を使用（leg_length, base_width）
+        """
+        widths = self._reference_widths(as_landmark_array(landmarks_data))
+        return dict(zip(REFERENCE_KEYS, widths))
+
     def normalize_landmarks_sequence(
         self,
-        landmarks_data: List[Dict]
-    ) -> Tuple[Dict[str, float], List[Dict[str, Optional[float]]]]:
+        landmarks_data: LandmarkInput
+    ) -> Tuple[Dict[str, float], FrameNormalizations]:
         """
         What: 全フレームの正規化基準値計算と代表値抽出
         Why: 動画全体の平均的な身体スケールで正規化
         Design Decision: 各フレームで計算後、中央値を代表値とする（ADR-003）
+                         計算は_reference_widths()で一括実行（ADR-010）
 
         Args:
-            landmarks_data: フレームごとのランドマークデータ
+            landmarks_data: フレームごとのランドマークデータ、または(F, 33, 4)配列
                 [{'frame': int, 'timestamp': float, 'landmarks': [...]}, ...]
 
         Returns:
-            Tuple[Dict, List]:
+            Tuple[Dict, FrameNormalizations]:
                 - 代表値: {'shoulder_width': float, 'pelvis_width': float, ...}
-                - フレーム別値: [{'shoulder_width': Optional[float], ...}, ...]
+                - フレーム別値: [{'shoulder_width': Optional[float], ...}, ...]（参照時に辞書生成）
 
         CRITICAL: 代表値はNaN除外後の中央値（外れ値に強い）
         """
-        frame_normalizations = []
-
-        # PHASE CORE LOGIC: 各フレームで正規化基準計算
-        for frame_data in landmarks_data:
-            landmarks = frame_data.get('landmarks', [])
-            norm_values = self.normalize_frame_data(landmarks)
-            frame_normalizations.append(norm_values)
-
-        # CRITICAL: 代表値計算（中央値使用）
-        representative_values = {}
-
-        for key in ['shoulder_width', 'pelvis_width', 'leg_length', 'base_width']:
-            # NaN除外
-            valid_values = [
-                frame[key] for frame in frame_normalizations
-                if frame[key] is not None
-            ]
-
-            if valid_values:
-                # 中央値計算（外れ値に強い）
-                representative_values[key] = float(np.median(valid_values))
-            else:
-                # CRITICAL: 全フレームでNaNの場合はNaN保持
-                representative_values[key] = np.nan
+        widths = self._reference_widths(as_landmark_array(landmarks_data))
+
+        # CRITICAL: 代表値計算（NaN除外の中央値、4指標を1回で計算）
+        representative_values = dict(zip(REFERENCE_KEYS, self._nanmedian_rows(widths).tolist()))
+
+        # フレーム別値（計算不可はNone、既存の辞書形式を参照時に生成）
+        frame_normalizations = FrameNormalizations(widths)
 
         return representative_values, frame_normalizations
 
+    def normalize_landmarks_batch(self, clips: List[LandmarkInput]) -> List[Dict[str, float]]:
+        """
+        What: 複数動画の正規化基準代表値を一括計算
+        Why: ディレクトリ単位の正規化で動画ごとのNumPy呼び出しオーバーヘッドを集約
+        Design Decision: 全動画を連結して_reference_widths()を1回実行し、
+                         (4, V, Fmax)のNaNパディング行列で中央値を一括計算（ADR-010）
+
+        Args:
+            clips: 動画ごとのランドマークデータ（各要素はnormalize_landmarks_sequence()の入力と同形式）
+
+        Returns:
+            List[Dict]: 動画順の代表値（normalize_landmarks_sequence()の代表値と同一）
+
+        CRITICAL: パディング部分はNaN（中央値計算から除外）
+        """
+        arrays = [as_landmark_array(clip) for clip in clips]
+        if not arrays:
+            return []
+
+        # PHASE CORE LOGIC: 連結配列で基準値を一括計算し、(V, Fmax)へ詰め直す
+        widths = self._reference_widths(np.concatenate(arrays))
+        lengths = np.array([len(arr) for arr in arrays])
+        frame_mask = np.arange(lengths.max()) < lengths[:, None]
+
+        padded = np.full((len(REFERENCE_KEYS),) + frame_mask.shape, np.nan)
+        padded[:, frame_mask] = widths
+
+        medians = self._nanmedian_rows(padded)
+        return [dict(zip(REFERENCE_KEYS, column)) for column in medians.T.tolist()]
+
+    @staticmethod
+    def _nanmedian_rows(widths: np.ndarray) -> np.ndarray:
+        """
+        What: 最終軸方向のNaN除外中央値
+        Why: 単一動画(4, F)・複数動画(4, V, Fmax)の代表値計算を共通化
+
+        CRITICAL: 全要素NaNの行はNaN保持（nanmedianの全NaN警告を避けるため対象外）
+        """
+        valid = ~np.isnan(widths).all(axis=-1)
+        medians = np.full(widths.shape[:-1], np.nan)
+        if valid.any():
+            medians[valid] = np.nanmedian(widths[valid], axis=-1)
+        return medians
+
+
+@lru_cache(maxsize=8)
+def _shared_normalizer(resolved_path: str, mtime_ns: int) -> BodyNormalizer:
+    return BodyNormalizer(resolved_path)
+
+
+def get_shared_normalizer(config_path: str = 'config.json') -> BodyNormalizer:
+    """
+    What: config.jsonごとに共有BodyNormalizerインスタンスを取得
+    Why: 評価器インスタンスごとのconfig.json再読み込み・再解析を排除
+    Design Decision: (絶対パス, 更新時刻)単位のlru_cache（ADR-013）
+
+    CRITICAL: BodyNormalizerは設定以外の状態を持たないため共有可能
+    """
+    return _shared_normalizer(*config_cache_key(config_path))
+
 
 def normalize_value(
     value: float,
@@ -1,21 +1,45 @@
 """
 Purpose: MediaPipe Poseを使用した姿勢ランドマーク抽出
 Responsibility: 動画から33キーポイントのランドマークデータを抽出、CLI経由でJSON出力
-Dependencies: cv2, mediapipe, argparse, json, datetime
+Dependencies: cv2, mediapipe, numpy, threading, argparse, datetime, video_io.py, landmarks.py, pose_landmarker.py, json_io.py
 Created: 2025-10-18 by Claude
-Decision Log: ADR-005
+Decision Log: ADR-005, ADR-015
 
 CRITICAL: MediaPipe Pose初期化・解放処理、RGB変換必須
 """
 import cv2
 import mediapipe as mp
-from typing import List, Dict, Optional
+import numpy as np
+from typing import List, Dict, Optional, Sequence
 import argparse
-import json
+import queue
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
 
+from .json_io import dump_json
+from .landmarks import (
+    LANDMARK_DTYPE,
+    NUM_CHANNELS,
+    NUM_LANDMARKS,
+    VISIBILITY,
+    landmark_list_to_array,
+    landmarks_to_records,
+    save_landmarks_npz,
+)
+from .pose_landmarker import TasksPose, resolve_model_asset
+from .video_io import (
+    DECODE_QUEUE_SIZE,
+    FramePreprocessor,
+    decode_frames,
+    open_capture,
+    preprocess_frames,
+)
+
+# 疎なフレーム指定時、この間隔を超える前方移動はシーク（以下はgrab()で読み飛ばし）
+SEEK_MIN_GAP = 30
+
 
 class PoseExtractor:
     """
@@ -23,14 +47,20 @@ class PoseExtractor:
     Why: THF評価の入力データ生成
     Design Decision: MediaPipe Pose使用、model_complexity=2でバランス重視（ADR-005）
 
-    CRITICAL: MediaPipe Poseリソース管理必須（__del__で解放）
+    CRITICAL: MediaPipe Poseリソース管理必須（withブロックまたはclose()で解放）
     """
 
     def __init__(self,
                  static_image_mode: bool = False,
                  model_complexity: int = 2,
                  min_detection_confidence: float = 0.5,
-                 min_tracking_confidence: float = 0.5):
+                 min_tracking_confidence: float = 0.5,
+                 reuse_interval: int = 1,
+                 reuse_min_visibility: float = 0.7,
+                 max_frame_height: Optional[int] = None,
+                 model_asset_path: Optional[str] = None,
+                 delegate: str = 'auto',
+                 precision: str = 'float16'):
         """
         What: MediaPipe Pose初期化
         Why: ランドマーク抽出エンジン準備
@@ -41,30 +71,54 @@ class PoseExtractor:
             model_complexity: モデルの複雑さ (0=Lite, 1=Full, 2=Heavy)
             min_detection_confidence: 検出の最小信頼度（0.5推奨）
             min_tracking_confidence: トラッキングの最小信頼度（0.5推奨）
+            reuse_interval: 推論間隔K（K>1でKフレームごとに推論、中間フレームは直前の結果を再利用。1で全フレーム推論）
+            reuse_min_visibility: 再利用を許可する直前推論結果の平均visibility下限
+            max_frame_height: 推論前に縮小する縦画素数の上限（Noneで縮小なし、analyzerはconfig.jsonで540）
+            model_asset_path: PoseLandmarkerモデル（.task）またはモデルディレクトリのパス（指定時はTasks APIで推論）
+            delegate: Tasks API使用時のデリゲート（'auto': 起動時に計測して選択, 'gpu', 'cpu'）
+            precision: モデルディレクトリ指定時の重み精度（'float32', 'float16', 'int8'）
 
         CRITICAL: static_image_mode=Falseで動画最適化、Trueは静止画用
         """
         # CRITICAL: MediaPipe Pose初期化（削除厳禁）
         self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
-            static_image_mode=static_image_mode,
-            model_complexity=model_complexity,
-            min_detection_confidence=min_detection_confidence,
-            min_tracking_confidence=min_tracking_confidence
-        )
-
-    def extract_landmarks(self, video_path: str) -> Dict:
+        if model_asset_path:
+            # solutions.poseはCPU固定のため、GPUデリゲートはTasks APIで選択（ADR-015）
+            # ディレクトリ指定時はmodel_complexity・precisionでモデルファイルを選択
+            self.pose = TasksPose(
+                resolve_model_asset(model_asset_path, model_complexity, precision),
+                delegate=delegate,
+                min_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence
+            )
+        else:
+            self.pose = self.mp_pose.Pose(
+                static_image_mode=static_image_mode,
+                model_complexity=model_complexity,
+                min_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence
+            )
+        self.reuse_interval = max(1, int(reuse_interval))
+        self.reuse_min_visibility = reuse_min_visibility
+        self.max_frame_height = max_frame_height
+
+    def extract_landmarks(self, video_path: str, hw_decode: bool = True) -> Dict:
         """
         What: 動画からフレームごとのランドマークを抽出
         Why: THF評価器への入力データ生成
         Design Decision: MediaPipe Pose使用、33キーポイント抽出（ADR-005）
+                         デコードは利用可能ならHW（open_capture()、非対応環境はCPUデコードにフォールバック）
+                         デコード・前処理（縮小/RGB変換）・推論を有界キューで接続した3段パイプラインで並行実行
+                         reuse_interval>1の場合、直前推論の平均visibilityが高い区間のみ中間フレームで推論を省略
 
         Args:
             video_path: 動画ファイルのパス
+            hw_decode: Falseで常にCPUデコード
 
         Returns:
             Dict: {
-                'landmarks': List[Dict] - フレームごとのランドマークデータ,
+                'landmarks': np.ndarray - 検出成功フレームのランドマーク (F, 33, 4) float32,
+                'frames': np.ndarray - 各行のフレーム番号 (F,) int64,
                 'fps': float - 動画のFPS,
                 'frame_count': int - 総フレーム数,
                 'duration': float - 動画の長さ（秒）,
@@ -77,71 +131,208 @@ class PoseExtractor:
         CRITICAL: RGB変換必須（MediaPipeはRGB入力前提）、cap.release()必須
         """
         # PHASE CORE LOGIC: 動画読み込みと基本情報取得
-        cap = cv2.VideoCapture(str(video_path))
+        cap = open_capture(video_path, hw_decode)
         if not cap.isOpened():
+            cap.release()
             raise ValueError(f"動画を開けません: {video_path}")
 
         fps = cap.get(cv2.CAP_PROP_FPS)
         frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         duration = frame_count / fps if fps > 0 else 0
+        # CRITICAL: 前の動画のトラッキング状態を破棄（同一動画の再抽出で結果を一致させる）
+        self.pose.reset()
+        if isinstance(self.pose, TasksPose):
+            self.pose.start_video(fps)
+
+        # CRITICAL: ランドマークはSoA配列（F, 33, 4）に直接格納（ADR-010）
+        # CAP_PROP_FRAME_COUNTは概算値のため、不足時は倍増で拡張
+        landmarks = np.empty((max(frame_count, 1), NUM_LANDMARKS, NUM_CHANNELS), dtype=LANDMARK_DTYPE)
+        detected_mask = np.zeros(len(landmarks), dtype=bool)
+        processed_frames = 0
+        # 直前フレームの推論結果を中間フレームで再利用可能か（検出成功かつ平均visibility閾値以上）
+        reusable = False
+
+        # PHASE CORE LOGIC: デコード・前処理（各別スレッド）と姿勢推定（本スレッド）を並行実行
+        # CRITICAL: RGB変換（MediaPipeはRGB入力前提、BGRではNG）
+        # 前処理の出力バッファはキュー滞留分 + 前処理中 + 推論中の分を順番に再利用
+        preprocess = FramePreprocessor(self.max_frame_height, n_buffers=DECODE_QUEUE_SIZE + 2)
+        frame_queue = queue.Queue(maxsize=DECODE_QUEUE_SIZE)
+        rgb_queue = queue.Queue(maxsize=DECODE_QUEUE_SIZE)
+        stop_event = threading.Event()
+        workers = [
+            threading.Thread(target=decode_frames, args=(cap, frame_queue, stop_event), daemon=True),
+            threading.Thread(target=preprocess_frames, args=(frame_queue, rgb_queue, stop_event, preprocess),
+                             daemon=True),
+        ]
+
+        try:
+            for worker in workers:
+                worker.start()
+            while True:
+                item = rgb_queue.get()
+                if item is None:
+                    break
+                frame_idx, image = item
+                processed_frames = frame_idx + 1
+
+                while frame_idx >= len(landmarks):
+                    landmarks = np.concatenate([landmarks, np.empty_like(landmarks)])
+                    detected_mask = np.concatenate([detected_mask, np.zeros_like(detected_mask)])
+
+                # 中間フレーム: 直前の結果を複製（推論を省略）
+                if reusable and frame_idx % self.reuse_interval:
+                    landmarks[frame_idx] = landmarks[frame_idx - 1]
+                    detected_mask[frame_idx] = True
+                    continue
+
+                results = self.pose.process(image)
+
+                # CRITICAL: ランドマーク検出成功時のみデータ保存
+                if results.pose_landmarks:
+                    # 33ランドマーク分を一括コピー（ランドマークごとのdict生成を回避）
+                    landmarks[frame_idx] = landmark_list_to_array(results.pose_landmarks.landmark)
+                    detected_mask[frame_idx] = True
+                    # CRITICAL: visibility低下時は次フレームで即座に推論（再利用しない）
+                    reusable = landmarks[frame_idx, :, VISIBILITY].mean() >= self.reuse_min_visibility
+                else:
+                    reusable = False
+        finally:
+            # CRITICAL: 例外時（スレッド起動失敗含む）もスレッド停止後にリソース解放必須
+            stop_event.set()
+            for worker in workers:
+                if worker.ident is not None:
+                    worker.join()
+            cap.release()
+
+        # 検出成功フレームのみ抽出（フレーム番号は別配列で保持）
+        detected_frames = np.flatnonzero(detected_mask[:processed_frames])
+
+        return {
+            'landmarks': landmarks[detected_frames],
+            'frames': detected_frames,
+            'fps': fps,
+            'frame_count': frame_count,
+            'duration': duration,
+            'detected_frames': len(detected_frames)
+        }
 
-        all_landmarks = []
-        frame_idx = 0
-
-        # PHASE CORE LOGIC: フレームごとのランドマーク抽出
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            # CRITICAL: RGB変換（MediaPipeはRGB入力前提、BGRではNG）
-            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.pose.process(image)
-
-            # CRITICAL: ランドマーク検出成功時のみデータ保存
-            if results.pose_landmarks:
-                landmarks = []
-                for lm in results.pose_landmarks.landmark:
-                    landmarks.append({
-                        'x': lm.x,
-                        'y': lm.y,
-                        'z': lm.z,
-                        'visibility': lm.visibility
-                    })
-                all_landmarks.append({
-                    'frame': frame_idx,
-                    'timestamp': frame_idx / fps if fps > 0 else 0,
-                    'landmarks': landmarks
-                })
-
-            frame_idx += 1
-
-        # CRITICAL: リソース解放必須
-        cap.release()
+    def extract_landmarks_at(self,
+                             video_path: str,
+                             indices: Optional[Sequence[int]] = None,
+                             hw_decode: bool = True) -> Dict:
+        """
+        What: 指定フレームのみランドマークを抽出
+        Why: 特定区間・N フレームごとのみ必要な場合に全フレームのデコード・推論を省略
+        Design Decision: 指定外フレームはcap.grab()で読み飛ばし（デコード結果の取得・RGB変換なし）、
+                         SEEK_MIN_GAPを超える間隔はCAP_PROP_POS_FRAMESでシーク
+
+        Args:
+            video_path: 動画ファイルのパス
+            indices: 抽出するフレーム番号（重複・順不同可、Noneでextract_landmarks()と同一の全フレーム抽出）
+            hw_decode: Falseで常にCPUデコード
+
+        Returns:
+            Dict: extract_landmarks()と同一形式（'frames'は検出成功した指定フレームの番号、昇順）
+
+        Raises:
+            ValueError: 動画ファイルが開けない場合
+
+        CRITICAL: 指定フレームは疎なためreuse_intervalによる推論省略は適用しない
+        """
+        if indices is None:
+            return self.extract_landmarks(video_path, hw_decode)
+
+        cap = open_capture(video_path, hw_decode)
+        if not cap.isOpened():
+            cap.release()
+            raise ValueError(f"動画を開けません: {video_path}")
+
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        duration = frame_count / fps if fps > 0 else 0
+        # CRITICAL: 前の動画のトラッキング状態を破棄（同一動画の再抽出で結果を一致させる）
+        self.pose.reset()
+        if isinstance(self.pose, TasksPose):
+            self.pose.start_video(fps)
+
+        targets = np.unique(np.asarray(indices, dtype=np.int64))
+        targets = targets[targets >= 0]
+        landmarks = np.empty((len(targets), NUM_LANDMARKS, NUM_CHANNELS), dtype=LANDMARK_DTYPE)
+        detected_mask = np.zeros(len(targets), dtype=bool)
+        preprocess = FramePreprocessor(self.max_frame_height)
+
+        # PHASE CORE LOGIC: 指定フレームまで読み飛ばし・シークして推論
+        try:
+            position = 0
+            for i, target in enumerate(targets.tolist()):
+                if target - position > SEEK_MIN_GAP:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+                    position = target
+                while position < target and cap.grab():
+                    position += 1
+                if position < target:
+                    break
+
+                ret, frame = cap.read()
+                if not ret:
+                    break
+                position += 1
+
+                # CRITICAL: RGB変換（MediaPipeはRGB入力前提、BGRではNG）
+                results = self.pose.process(preprocess(frame))
+                if results.pose_landmarks:
+                    landmarks[i] = landmark_list_to_array(results.pose_landmarks.landmark)
+                    detected_mask[i] = True
+        finally:
+            # CRITICAL: 例外時もリソース解放必須
+            cap.release()
 
         return {
-            'landmarks': all_landmarks,
+            'landmarks': landmarks[detected_mask],
+            'frames': targets[detected_mask],
             'fps': fps,
             'frame_count': frame_count,
             'duration': duration,
-            'detected_frames': len(all_landmarks)
+            'detected_frames': int(detected_mask.sum())
         }
 
+    @staticmethod
+    def to_records(data: Dict) -> Dict:
+        """
+        What: extract_landmarks()の戻り値のランドマークをList[Dict]形式に変換
+        Why: JSON出力の既存フォーマット互換性維持（ADR-005）
+        Design Decision: 変換は保存時の1回のみ（抽出ループ内でdictを生成しない、ADR-010）
+
+        Returns:
+            Dict: 'landmarks'をList[Dict]に置換し'frames'を除いたコピー
+
+        CRITICAL: 出力キー構成は従来のextract_landmarks()戻り値と同一
+        """
+        records = {key: value for key, value in data.items() if key != 'frames'}
+        records['landmarks'] = landmarks_to_records(data['landmarks'], data['frames'], data['fps'])
+        return records
+
     def save_to_json(
         self,
         data: Dict,
         output_path: str,
-        video_path: Optional[str] = None
+        video_path: Optional[str] = None,
+        indent: bool = False,
+        landmarks_sidecar: bool = False
     ) -> None:
         """
         What: ランドマークデータをJSON形式で保存（メタデータ拡張版）
         Why: テストフィクスチャ生成、デバッグ容易化
         Design Decision: 提案B（メタデータ拡張版）採用（ADR-005）
+                         dump_json()でorjson優先・既定はインデントなし（ファイルサイズ約1/3、ADR-012）
 
         Args:
             data: extract_landmarks()の戻り値
             output_path: 出力JSONファイルパス
             video_path: 動画ファイルパス（メタデータ用）
+            indent: 2スペースインデントの有無（目視確認用）
+            landmarks_sidecar: Trueでランドマークを同名.npzにint16量子化で保存し、JSONはメタデータのみ
+                               （analyzer.save_results()と同一形式、ADR-011）
 
         Raises:
             IOError: ファイル書き込み失敗時
@@ -161,30 +352,43 @@ class PoseExtractor:
             'pose_extractor_version': '1.0.0'
         }
 
-        # CRITICAL: 既存コード互換性維持（data['landmarks']をそのまま保存）
-        output_data = {
-            'metadata': metadata,
-            'landmarks': data['landmarks']
-        }
-
         # PHASE CORE LOGIC: JSON書き込み
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        if landmarks_sidecar:
+            # 数値主体のランドマークは10進文字列化せずバイナリで保存、復元はload_landmarks_npz()
+            landmarks_path = output_file.with_suffix('.npz')
+            save_landmarks_npz(landmarks_path, data['landmarks'], data['frames'], data['fps'])
+            output_data = {'metadata': metadata, 'landmarks_file': landmarks_path.name}
+        else:
+            # CRITICAL: 既存コード互換性維持（data['landmarks']はList[Dict]形式で保存）
+            output_data = {
+                'metadata': metadata,
+                'landmarks': self.to_records(data)['landmarks']
+            }
+
+        dump_json(output_data, output_file, indent=indent)
 
-    def __del__(self):
+    def close(self):
         """
         What: MediaPipe Poseリソース解放
         Why: メモリリーク防止
-        Design Decision: __del__でリソース解放（ADR-005）
+        Design Decision: 呼び出し側で明示的に解放（__del__はGC時期が不定で、例外・参照循環時に解放が遅延、ADR-005）
 
-        CRITICAL: pose.close()必須（MediaPipeリソース解放）
+        CRITICAL: pose.close()必須（MediaPipeリソース解放）、2回目以降の呼び出しは何もしない
         """
         # CRITICAL: MediaPipe Poseリソース解放（メモリリーク防止）
-        if hasattr(self, 'pose'):
-            self.pose.close()
+        pose = getattr(self, 'pose', None)
+        if pose is not None:
+            self.pose = None
+            pose.close()
+
+    def __enter__(self) -> 'PoseExtractor':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 def main():
@@ -238,9 +442,52 @@ def main():
     parser.add_argument(
         '--format',
         type=str,
-        choices=['dict', 'json'],
+        choices=['dict', 'json', 'npz'],
         default='json',
-        help='出力形式（dict: 既存互換, json: メタデータ拡張版、デフォルト: json）'
+        help='出力形式（dict: 既存互換, json: メタデータ拡張版, npz: メタデータJSON + ランドマーク.npz、デフォルト: json）'
+    )
+
+    parser.add_argument(
+        '--no-hw-decode',
+        action='store_true',
+        help='ハードウェアデコードを使用せずCPUでデコード'
+    )
+
+    parser.add_argument(
+        '--reuse-interval',
+        type=int,
+        default=1,
+        help='推論間隔（2以上で高visibility区間の中間フレームは直前の結果を再利用、デフォルト: 1=全フレーム推論）'
+    )
+
+    parser.add_argument(
+        '--max-frame-height',
+        type=int,
+        default=None,
+        help='推論前に縮小する縦画素数の上限（デフォルト: 縮小なし）'
+    )
+
+    parser.add_argument(
+        '--model-asset-path',
+        type=str,
+        default=None,
+        help='PoseLandmarkerモデル（.task）またはモデルディレクトリ（<精度>/<モデル名>.task）のパス（指定時はTasks APIで推論）'
+    )
+
+    parser.add_argument(
+        '--delegate',
+        type=str,
+        choices=['auto', 'gpu', 'cpu'],
+        default='auto',
+        help='--model-asset-path指定時の推論デリゲート（auto: 起動時に計測して高速な方を選択）'
+    )
+
+    parser.add_argument(
+        '--precision',
+        type=str,
+        choices=['float32', 'float16', 'int8'],
+        default='float16',
+        help='--model-asset-pathがディレクトリの場合のモデル重み精度（デフォルト: float16）'
     )
 
     parser.add_argument(
@@ -262,8 +509,12 @@ def main():
         print(f"🎥 動画を解析中: {args.input}")
 
     try:
-        extractor = PoseExtractor()
-        data = extractor.extract_landmarks(str(input_path))
+        with PoseExtractor(reuse_interval=args.reuse_interval,
+                           max_frame_height=args.max_frame_height,
+                           model_asset_path=args.model_asset_path,
+                           delegate=args.delegate,
+                           precision=args.precision) as extractor:
+            data = extractor.extract_landmarks(str(input_path), hw_decode=not args.no_hw_decode)
 
         if args.verbose:
             print(f"📊 動画情報:")
@@ -282,15 +533,16 @@ def main():
         print(f"💾 JSON保存中: {args.output}")
 
     try:
-        if args.format == 'json':
-            # メタデータ拡張版（提案B）
-            extractor.save_to_json(data, args.output, args.input)
+        if args.format in ('json', 'npz'):
+            # メタデータ拡張版（提案B）、npzはランドマークを同名.npzサイドカーに保存
+            # インデントは--verbose時のみ（目視確認用）
+            extractor.save_to_json(data, args.output, args.input, indent=args.verbose,
+                                   landmarks_sidecar=args.format == 'npz')
         else:
             # 既存互換版（提案A）
             output_file = Path(args.output)
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            dump_json(extractor.to_records(data), output_file, indent=args.verbose)
 
         if args.verbose:
             print(f"✅ 完了: {args.output}")
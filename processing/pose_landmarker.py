@@ -0,0 +1,219 @@
+"""
+Purpose: MediaPipe Tasks PoseLandmarkerによる姿勢推定（GPU/CPUデリゲート選択）
+Responsibility: PoseLandmarkerをsolutions.pose.Pose互換のprocess()で提供、デリゲートの自動選択、
+                モデル精度（float32/float16/int8）に応じたモデルファイル解決
+Dependencies: mediapipe（tasks API）, numpy
+Created: 2026-10-15 by Claude
+Decision Log: ADR-005, ADR-015
+
+CRITICAL: GPUデリゲートは常に高速とは限らない（CPUへのフォールバック必須）
+"""
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import mediapipe as mp
+import numpy as np
+from mediapipe.tasks.python import BaseOptions, vision
+
+# デリゲート指定（'auto'は両方を計測して高速な方を選択）
+DELEGATES = {
+    'cpu': BaseOptions.Delegate.CPU,
+    'gpu': BaseOptions.Delegate.GPU,
+}
+
+# model_complexity (0=Lite, 1=Full, 2=Heavy) に対応するモデル名
+MODEL_NAMES = ('pose_landmarker_lite', 'pose_landmarker_full', 'pose_landmarker_heavy')
+
+# モデル重みの精度（MediaPipe公式配布はfloat16、int8/float32は変換済みファイルを配置）
+MODEL_PRECISIONS = ('float32', 'float16', 'int8')
+
+# デリゲート計測の推論回数（初回のグラフ初期化分は別途1回実行して除外）
+BENCHMARK_FRAMES = 5
+
+
+def resolve_model_asset(model_asset_path, model_complexity=2, precision='float16'):
+    """
+    What: モデル精度・複雑さに対応するモデルファイルのパスを解決
+    Why: 重みの低精度化（float16/int8）でメモリ帯域・SIMD演算効率を改善
+    Design Decision: ディレクトリ指定時は公式配布と同じ<精度>/<モデル名>.task配置を参照、
+                     ファイル指定時はそのまま使用（ADR-015）
+
+    Args:
+        model_asset_path: モデルファイル（.task）またはモデルディレクトリのパス
+        model_complexity: 0=Lite, 1=Full, 2=Heavy
+        precision: 'float32', 'float16', 'int8'
+
+    Returns:
+        Path: モデルファイルのパス
+
+    Raises:
+        ValueError: 未対応のprecision / model_complexity
+        FileNotFoundError: モデルファイルが存在しない場合
+
+    CRITICAL: 精度を黙って切り替えない（該当ファイルがなければエラー）
+    """
+    if precision not in MODEL_PRECISIONS:
+        raise ValueError(f"未対応のprecision: {precision}")
+    if model_complexity not in range(len(MODEL_NAMES)):
+        raise ValueError(f"未対応のmodel_complexity: {model_complexity}")
+
+    path = Path(model_asset_path)
+    if path.is_dir():
+        path = path / precision / f"{MODEL_NAMES[model_complexity]}.task"
+    if not path.is_file():
+        raise FileNotFoundError(f"モデルファイルが見つかりません: {path}")
+    return path
+
+
+def _create_landmarker(model_asset_path, delegate, min_detection_confidence, min_tracking_confidence):
+    """
+    What: VIDEOモードのPoseLandmarker生成
+    Why: solutions.poseはデリゲート選択不可、Tasks APIのBaseOptionsで指定
+
+    Raises:
+        RuntimeError: デリゲート非対応環境（GPU未搭載等）
+    """
+    options = vision.PoseLandmarkerOptions(
+        base_options=BaseOptions(model_asset_path=str(model_asset_path), delegate=DELEGATES[delegate]),
+        running_mode=vision.RunningMode.VIDEO,
+        min_pose_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence
+    )
+    return vision.PoseLandmarker.create_from_options(options)
+
+
+def _benchmark(landmarker, frames=BENCHMARK_FRAMES):
+    """
+    What: 黒画像での推論1回あたりの所要時間（秒）を計測
+    Why: デリゲートの速度はモデル・端末ごとに異なり事前に決められない
+
+    CRITICAL: 計測後のlandmarkerはトラッキング状態を持つため呼び出し側で破棄
+    """
+    image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.zeros((256, 256, 3), dtype=np.uint8))
+    landmarker.detect_for_video(image, 0)
+    start = time.perf_counter()
+    for timestamp_ms in range(1, frames + 1):
+        landmarker.detect_for_video(image, timestamp_ms)
+    return (time.perf_counter() - start) / frames
+
+
+def select_delegate(model_asset_path, min_detection_confidence=0.5, min_tracking_confidence=0.5):
+    """
+    What: 利用可能なデリゲートを計測し最速のものを選択
+    Why: GPUデリゲートは転送コストにより小モデルではCPUより遅い場合がある
+
+    Returns:
+        str: 'gpu' または 'cpu'
+
+    CRITICAL: GPUデリゲートの生成・推論に失敗した場合は'cpu'
+    """
+    timings = {}
+    for name in ('gpu', 'cpu'):
+        try:
+            landmarker = _create_landmarker(
+                model_asset_path, name, min_detection_confidence, min_tracking_confidence
+            )
+        except (RuntimeError, ValueError):
+            continue
+        try:
+            timings[name] = _benchmark(landmarker)
+        except (RuntimeError, ValueError):
+            continue
+        finally:
+            landmarker.close()
+
+    return min(timings, key=timings.get) if timings else 'cpu'
+
+
+class TasksPose:
+    """
+    What: PoseLandmarkerをsolutions.pose.Pose互換のインターフェースで提供
+    Why: PoseExtractorの推論ループを変更せずにデリゲート選択可能なTasks APIへ切り替え
+    Design Decision: process()の戻り値はresults.pose_landmarks.landmark形式（1人目のみ、ADR-015）
+
+    CRITICAL: VIDEOモードのタイムスタンプは単調増加必須（reset()によるグラフ再生成時のみ0に戻す）
+    """
+
+    def __init__(self,
+                 model_asset_path,
+                 delegate='auto',
+                 min_detection_confidence=0.5,
+                 min_tracking_confidence=0.5):
+        """
+        Args:
+            model_asset_path: PoseLandmarkerモデル（.task）のパス
+            delegate: 'auto'（計測して選択）, 'gpu', 'cpu'
+            min_detection_confidence: 検出の最小信頼度
+            min_tracking_confidence: トラッキングの最小信頼度
+
+        Raises:
+            ValueError: 未対応のdelegate
+
+        CRITICAL: 'gpu'指定でも生成失敗時はCPUにフォールバック
+        """
+        if delegate != 'auto' and delegate not in DELEGATES:
+            raise ValueError(f"未対応のdelegate: {delegate}")
+        if delegate == 'auto':
+            delegate = select_delegate(model_asset_path, min_detection_confidence, min_tracking_confidence)
+
+        try:
+            self.landmarker = _create_landmarker(
+                model_asset_path, delegate, min_detection_confidence, min_tracking_confidence
+            )
+        except RuntimeError:
+            if delegate == 'cpu':
+                raise
+            delegate = 'cpu'
+            self.landmarker = _create_landmarker(
+                model_asset_path, delegate, min_detection_confidence, min_tracking_confidence
+            )
+        self.delegate = delegate
+        self._options = (model_asset_path, min_detection_confidence, min_tracking_confidence)
+        self._timestamp_ms = 0
+        self._frame_interval_ms = 1
+
+    def reset(self):
+        """
+        What: トラッキング状態の破棄（solutions.pose.Pose.reset()互換）
+        Why: 前の動画の追跡結果が次の動画の先頭フレームに影響しないようにする
+        Design Decision: PoseLandmarkerにはグラフリセットAPIがないため、同一delegateで再生成
+        """
+        model_asset_path, min_detection_confidence, min_tracking_confidence = self._options
+        self.landmarker.close()
+        self.landmarker = _create_landmarker(
+            model_asset_path, self.delegate, min_detection_confidence, min_tracking_confidence
+        )
+        self._timestamp_ms = 0
+
+    def start_video(self, fps):
+        """
+        What: 動画開始時のタイムスタンプ間隔設定
+        Why: トラッキングの平滑化はフレーム間の経過時間を使用
+        """
+        self._frame_interval_ms = max(1, round(1000 / fps)) if fps and fps > 0 else 1
+
+    def process(self, image):
+        """
+        What: RGBフレーム1枚の姿勢推定
+
+        Args:
+            image: RGBフレーム (H, W, 3) uint8
+
+        Returns:
+            solutions.pose互換の結果（未検出時pose_landmarks=None）
+        """
+        result = self.landmarker.detect_for_video(
+            mp.Image(image_format=mp.ImageFormat.SRGB, data=image), self._timestamp_ms
+        )
+        self._timestamp_ms += self._frame_interval_ms
+
+        if not result.pose_landmarks:
+            return SimpleNamespace(pose_landmarks=None)
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=result.pose_landmarks[0]))
+
+    def close(self):
+        """
+        What: PoseLandmarkerリソース解放
+        """
+        self.landmarker.close()
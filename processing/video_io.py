@@ -0,0 +1,192 @@
+"""
+Purpose: 動画読み込みの共通処理
+Responsibility: ハードウェアデコード優先の動画オープンとフォールバック、推論前のフレーム前処理、
+                デコード・前処理スレッド
+Dependencies: cv2, numpy, queue
+Created: 2026-10-15 by Claude
+Decision Log: ADR-005
+
+CRITICAL: HWデコード非対応環境でも従来と同一の動作にフォールバック
+"""
+import queue
+
+import cv2
+import numpy as np
+
+# スレッド間キューの上限（メモリ使用量をフレーム数個分に制限）
+DECODE_QUEUE_SIZE = 4
+
+
+def open_capture(video_path, hw_decode=True):
+    """
+    What: 動画を開く（利用可能ならハードウェアデコード）
+    Why: 720p超のH.264/H.265デコードは推論に次ぐ逐次コスト
+    Design Decision: FFmpegバックエンド + VIDEO_ACCELERATION_ANY（NVDEC等をOpenCVが自動選択）、
+                     開けない場合は既定バックエンド
+
+    Args:
+        video_path: 動画ファイルのパス
+        hw_decode: Falseで常に既定バックエンド（CPUデコード）
+
+    Returns:
+        cv2.VideoCapture: 呼び出し側でisOpened()確認・release()必須
+
+    CRITICAL: HWデコード非対応環境でも従来と同一の動作にフォールバック
+    """
+    if hw_decode and hasattr(cv2, 'VIDEO_ACCELERATION_ANY'):
+        cap = cv2.VideoCapture(
+            str(video_path),
+            cv2.CAP_FFMPEG,
+            [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY]
+        )
+        if cap.isOpened():
+            return cap
+        cap.release()
+
+    return cv2.VideoCapture(str(video_path))
+
+
+def _put(frame_queue, item, stop_event):
+    """
+    What: 停止要求を監視しながらキューへ投入
+    Why: 消費側の停止後に生産側スレッドがput待ちで残るのを防ぐ
+
+    Returns:
+        bool: 投入できた場合True（停止要求時False）
+    """
+    while not stop_event.is_set():
+        try:
+            frame_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(frame_queue, stop_event):
+    """
+    What: 停止要求を監視しながらキューから取得
+
+    Returns:
+        キュー要素（停止要求時None）
+    """
+    while not stop_event.is_set():
+        try:
+            return frame_queue.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return None
+
+
+def decode_frames(cap, frame_queue, stop_event, frame_stride=1):
+    """
+    What: 動画フレームを別スレッドでデコードしキューへ投入
+    Why: cap.read()とpose.process()を重ねて実行し、デコード待ちで推論が止まるのを防ぐ
+    Design Decision: 有界キュー + 終端None、停止要求時はput待ちを打ち切り
+                     間引き対象フレームはcap.grab()のみ（デコード結果の取得を省略）
+
+    Args:
+        frame_stride: 推論対象とするフレーム間隔（1で全フレーム）
+
+    キュー要素: (フレーム番号, BGRフレーム)
+
+    CRITICAL: 終了時は必ずNoneを投入（消費側の無限待機防止）
+    """
+    try:
+        frame_idx = 0
+        while not stop_event.is_set():
+            if frame_idx % frame_stride:
+                if not cap.grab():
+                    break
+            else:
+                ret, frame = cap.read()
+                if not ret or not _put(frame_queue, (frame_idx, frame), stop_event):
+                    break
+            frame_idx += 1
+    finally:
+        _put(frame_queue, None, stop_event)
+
+
+def preprocess_frames(frame_queue, rgb_queue, stop_event, preprocess):
+    """
+    What: デコード済みフレームを別スレッドで縮小・RGB変換しキューへ投入
+    Why: 前処理を推論スレッドから外し、デコード・前処理・推論を並行実行（スループットは最も遅い段で律速）
+    Design Decision: decode_frames()と同一の有界キュー + 終端None、cv2処理中はGIL解放
+
+    Args:
+        frame_queue: decode_frames()の出力キュー
+        rgb_queue: 出力キュー（要素: (フレーム番号, RGBフレーム)）
+        preprocess: FramePreprocessor（n_buffers >= rgb_queueの上限 + 2）
+
+    CRITICAL: 終了時は必ずNoneを投入（消費側の無限待機防止）
+    """
+    try:
+        while True:
+            item = _get(frame_queue, stop_event)
+            if item is None:
+                break
+            frame_idx, frame = item
+            if not _put(rgb_queue, (frame_idx, preprocess(frame)), stop_event):
+                break
+    finally:
+        _put(rgb_queue, None, stop_event)
+
+
+class FramePreprocessor:
+    """
+    What: BGRフレームの縮小とRGB変換（MediaPipe入力の生成）
+    Why: フレームごとのcvtColor・resizeで画像サイズ分の配列を毎回確保しない
+    Design Decision: 出力先バッファを初回フレームで確保し以降再利用（形状変化時のみ再確保）、
+                     縮小はRGB変換前に実施（変換対象の画素数を削減）、
+                     出力バッファはn_buffers個を順番に使用（スレッド間キューで受け渡す場合）
+
+    CRITICAL: 戻り値はn_buffers回後の呼び出しで上書きされる（保持が必要な場合は呼び出し側でコピー）
+    """
+
+    def __init__(self, max_height=None, n_buffers=1):
+        """
+        Args:
+            max_height: 縦画素数の上限（超えるフレームはアスペクト比維持で縮小、Noneで縮小なし）
+            n_buffers: 出力バッファ数（キュー上限 + 生産側1 + 消費側1以上）
+        """
+        self.max_height = max_height
+        self._rgb_bufs = [None] * n_buffers
+        self._next_buf = 0
+        self._small_buf = None
+
+    def __call__(self, frame):
+        """
+        What: BGRフレームをMediaPipe入力用RGBフレームに変換
+
+        Returns:
+            np.ndarray: RGBフレーム（内部バッファ）
+
+        CRITICAL: RGB変換必須（MediaPipeはRGB入力前提）
+        """
+        # 縮小（正規化座標で出力されるためランドマークの逆変換は不要）
+        if self.max_height and frame.shape[0] > self.max_height:
+            frame = self._downscale(frame)
+
+        idx = self._next_buf
+        self._next_buf = (idx + 1) % len(self._rgb_bufs)
+        rgb = self._rgb_bufs[idx]
+        if rgb is None or rgb.shape != frame.shape:
+            rgb = self._rgb_bufs[idx] = np.empty_like(frame)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+        return rgb
+
+    def _downscale(self, frame):
+        """
+        What: フレームを縦max_height以下にアスペクト比維持で縮小
+        Why: 1080p/4K入力のRGB変換・推論前処理のメモリ転送量削減（モデル入力は256x256）
+        Design Decision: 事前確保バッファへcv2.resize
+
+        CRITICAL: アスペクト比維持（正規化座標の縦横比を変えない）、
+                  モデル入力サイズ（256x256）への直接縮小は不可（ROI切り出しの解像度不足、ADR-015）
+        """
+        height, width = frame.shape[:2]
+        size = (max(1, round(width * self.max_height / height)), self.max_height)
+        if self._small_buf is None or self._small_buf.shape[1::-1] != size:
+            self._small_buf = np.empty((size[1], size[0], frame.shape[2]), dtype=frame.dtype)
+        cv2.resize(frame, size, dst=self._small_buf, interpolation=cv2.INTER_LINEAR)
+        return self._small_buf
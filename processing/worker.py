@@ -1,16 +1,18 @@
 """
 Purpose: 動画処理のメインワークフロー管理
 Responsibility: ランドマーク抽出→評価→Health Check→結果保存の統合処理
-Dependencies: pose_extractor, evaluators, health_check, config.json
+Dependencies: pose_extractor, evaluators, health_check, landmarks, json_io, config.json
 Created: 2025-10-19 by Claude
-Decision Log: ADR-002, ADR-004
+Decision Log: ADR-002, ADR-004, ADR-010
 
 CRITICAL: Health Check必須実行、warnings.json出力必須
 """
-import json
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+import numpy as np
 
 from .pose_extractor import PoseExtractor
 from .evaluators.single_leg_squat import SingleLegSquatEvaluator
@@ -21,6 +23,8 @@ from .evaluators.stride_mimic import StrideMimicEvaluator
 from .evaluators.push_pull import PushPullEvaluator
 from .evaluators.jump_landing import JumpLandingEvaluator
 from .health_check import HealthChecker, apply_random_seed
+from .json_io import dump_json
+from .landmarks import as_landmark_array
 
 
 class VideoProcessingWorker:
@@ -47,7 +51,10 @@ class VideoProcessingWorker:
         apply_random_seed(config_path)
 
         # PHASE CORE LOGIC: コンポーネント初期化
+        # CRITICAL: MediaPipeリソースはclose()でまとめて解放（__del__に依存しない）
+        self._exit_stack = ExitStack()
         self.pose_extractor = PoseExtractor()
+        self._exit_stack.callback(self.pose_extractor.close)
         self.evaluators = {
             'single_leg_squat': SingleLegSquatEvaluator(config_path),
             'upper_body_swing': UpperBodySwingEvaluator(config_path),
@@ -91,11 +98,6 @@ class VideoProcessingWorker:
 
         CRITICAL: Health Check必須、低品質データは警告出力
         """
-        # 動画ファイルの存在確認
-        video_file = Path(video_path)
-        if not video_file.exists():
-            raise FileNotFoundError(f"動画ファイルが見つかりません: {video_path}")
-
         # テストタイプの確認
         if test_type not in self.evaluators:
             raise ValueError(
@@ -104,9 +106,72 @@ class VideoProcessingWorker:
             )
 
         # PHASE CORE LOGIC: ワークフロー実行
+        print(f"📋 テストタイプ: {test_type}")
+        extraction_result, landmarks, quality_result = self._extract_and_check(video_path)
+
+        result = self._evaluate(test_type, landmarks, video_path, extraction_result, quality_result, output_dir)
+
+        # CRITICAL: warnings.json出力（ADR-004）
+        if output_dir:
+            self._save_warnings(output_dir)
+
+        return result
+
+    def process_all(self,
+                    video_path: str,
+                    output_dir: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        What: 1動画を全テストタイプで評価
+        Why: 同一動画を複数テストで評価する場合にデコード・姿勢推定を1回に削減
+        Design Decision: ランドマーク抽出・品質チェックは1回、評価器7種で同一SoA配列を共有（ADR-010）
+
+        Args:
+            video_path: 動画ファイルのパス
+            output_dir: 結果を保存するディレクトリ（Noneの場合は保存しない）
+
+        Returns:
+            Dict[str, Dict]: テストタイプ → process_video()と同一形式の結果
+
+        Raises:
+            FileNotFoundError: 動画ファイルが存在しない場合
+
+        CRITICAL: Health Check必須（1回のみ実行、全結果で共有）
+        """
+        # PHASE CORE LOGIC: 抽出1回 → 全評価器
+        extraction_result, landmarks, quality_result = self._extract_and_check(video_path)
+
+        results = {
+            test_type: self._evaluate(test_type, landmarks, video_path,
+                                      extraction_result, quality_result, output_dir)
+            for test_type in self.evaluators
+        }
+
+        # CRITICAL: warnings.json出力（ADR-004）
+        if output_dir:
+            self._save_warnings(output_dir)
+
+        return results
+
+    def _extract_and_check(self, video_path: str) -> Tuple[Dict, np.ndarray, Dict]:
+        """
+        What: ランドマーク抽出と品質チェック
+        Why: process_video() / process_all()の共通前段
+
+        Returns:
+            Tuple[Dict, np.ndarray, Dict]: (extract_landmarks()の戻り値, SoA配列, 品質チェック結果)
+
+        Raises:
+            FileNotFoundError: 動画ファイルが存在しない場合
+
+        CRITICAL: Health Check必須、低品質データは警告出力
+        """
+        # 動画ファイルの存在確認
+        video_file = Path(video_path)
+        if not video_file.exists():
+            raise FileNotFoundError(f"動画ファイルが見つかりません: {video_path}")
+
         # 1. ランドマーク抽出
         print(f"🎥 動画を解析中: {video_path}")
-        print(f"📋 テストタイプ: {test_type}")
 
         extraction_result = self.pose_extractor.extract_landmarks(video_path)
 
@@ -115,12 +180,16 @@ class VideoProcessingWorker:
               f"{extraction_result['duration']:.1f}秒")
         print(f"✅ ランドマーク抽出完了: {extraction_result['detected_frames']}フレーム検出")
 
+        # SoA配列への変換は取り込み時に1回のみ（品質チェックと評価で共有、ADR-010）
+        landmarks = as_landmark_array(extraction_result['landmarks'])
+
         # CRITICAL: Health Check実行（ADR-004）
         # 2. ランドマーク品質チェック
         print(f"🔍 品質チェック実行中...")
         is_quality_ok, quality_result = self.health_checker.check_landmark_quality(
-            extraction_result['landmarks'],
-            video_path
+            landmarks,
+            video_path,
+            frames=extraction_result.get('frames')
         )
 
         if is_quality_ok:
@@ -128,10 +197,23 @@ class VideoProcessingWorker:
         else:
             print(f"⚠️  品質チェック: 低品質データ検出 (検出率 {quality_result['detection_rate']:.1%})")
 
+        return extraction_result, landmarks, quality_result
+
+    def _evaluate(self,
+                  test_type: str,
+                  landmarks: np.ndarray,
+                  video_path: str,
+                  extraction_result: Dict,
+                  quality_result: Dict,
+                  output_dir: Optional[str]) -> Dict:
+        """
+        What: 1テストタイプの評価と結果組み立て・保存
+        Why: process_video() / process_all()の共通後段
+        """
         # 3. 評価
         print(f"📈 評価を実行中...")
         evaluator = self.evaluators[test_type]
-        evaluation_result = evaluator.evaluate(extraction_result['landmarks'])
+        evaluation_result = evaluator.evaluate(landmarks)
 
         print(f"✅ 評価完了: スコア {evaluation_result['score']}/3")
 
@@ -157,19 +239,23 @@ class VideoProcessingWorker:
             result['output_file'] = str(output_path)
             print(f"💾 結果を保存: {output_path}")
 
-            # CRITICAL: warnings.json出力（ADR-004）
-            warnings_path = self.health_checker.save_warnings(
-                str(Path(output_dir) / 'warnings.json')
-            )
-            print(f"📋 警告ログ保存: {warnings_path}")
-
         return result
 
+    def _save_warnings(self, output_dir: str) -> None:
+        """
+        What: warnings.json出力
+        Why: 品質チェックの警告を結果と同じディレクトリに保存（ADR-004）
+        """
+        warnings_path = self.health_checker.save_warnings(
+            str(Path(output_dir) / 'warnings.json')
+        )
+        print(f"📋 警告ログ保存: {warnings_path}")
+
     def _save_results(self, result: Dict, output_dir: str) -> Path:
         """
         What: 評価結果JSON保存
         Why: 結果永続化と後続処理での参照
-        Design Decision: タイムスタンプ付きファイル名（ADR-002）
+        Design Decision: タイムスタンプ付きファイル名（ADR-002）、dump_json()でインデントなし保存（ADR-012）
 
         Args:
             result: 結果データ
@@ -187,8 +273,7 @@ class VideoProcessingWorker:
         filename = f"{result['test_type']}_{timestamp}.json"
         filepath = output_path / filename
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        dump_json(result, filepath, indent=False)
 
         return filepath
 
@@ -224,6 +309,22 @@ class VideoProcessingWorker:
 
         return summary
 
+    def close(self) -> None:
+        """
+        What: 保持リソース（MediaPipe Pose）の解放
+        Why: GC時期に依存せず解放時点を確定（Lambdaウォームスタート時のメモリ上限を予測可能に）
+        Design Decision: ExitStackに登録した解放処理を逆順に実行、2回目以降は何もしない
+
+        CRITICAL: close()後のprocess_video()呼び出し禁止
+        """
+        self._exit_stack.close()
+
+    def __enter__(self) -> 'VideoProcessingWorker':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 def process_video(video_path: str,
                   test_type: str = 'single_leg_squat',
@@ -240,4 +341,7 @@ def process_video(video_path: str,
         Dict: 処理結果
     """
     worker = VideoProcessingWorker()
-    return worker.process_video(video_path, test_type, output_dir)
+    try:
+        return worker.process_video(video_path, test_type, output_dir)
+    finally:
+        worker.close()
@@ -5,38 +5,71 @@ Responsibility:
   - 動画ダウンロードと一時ファイル管理
   - VideoProcessingWorkerの実行
   - 結果のS3保存とDynamoDB記録
-Dependencies: processing.worker, boto3, config.json
+Dependencies: processing.worker, processing.json_io, boto3, config.json
 Created: 2025-10-24 by Claude
 Decision Log: ADR-007, ADR-008
 
 CRITICAL:
   - 環境変数RESULTS_BUCKET, TABLE_NAME必須
-  - 一時ファイルのクリーンアップ必須（os.unlink）
+  - 一時ファイルのクリーンアップ必須（NamedTemporaryFileのwithブロック内で処理、例外時も削除）
   - DynamoDB TTL設定（90日）必須
   - S3イベントとSQSイベント両対応
 """
+import atexit
 import json
 import os
 import sys
 import tempfile
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import boto3
+from botocore.config import Config
 from urllib.parse import unquote_plus
 
 # processingモジュールをインポート
 sys.path.append('/var/task')
+from processing.json_io import dumps_json
+from processing.health_check import apply_random_seed
 from processing.worker import VideoProcessingWorker
 
-# AWS クライアント初期化
-s3_client = boto3.client('s3')
-sqs_client = boto3.client('sqs')
-dynamodb = boto3.resource('dynamodb')
+# AWS クライアント初期化（モジュールスコープでウォームスタート間のコネクションを再利用）
+# TCP keep-aliveでTLSハンドシェイクを呼び出しごとに繰り返さない
+BOTO_CONFIG = Config(tcp_keepalive=True, max_pool_connections=50, retries={'mode': 'adaptive'})
+s3_client = boto3.client('s3', config=BOTO_CONFIG)
+sqs_client = boto3.client('sqs', config=BOTO_CONFIG)
+dynamodb = boto3.resource('dynamodb', config=BOTO_CONFIG)
 
 # 環境変数
 RESULTS_BUCKET = os.environ.get('RESULTS_BUCKET', 'thf-motion-scan-results')
 QUEUE_URL = os.environ.get('QUEUE_URL', '')
 TABLE_NAME = os.environ.get('TABLE_NAME', 'thf-motion-scan-results')
+CONFIG_PATH = '/var/task/config.json'
+
+# 全テストタイプで評価するテストタイプ指定（例: videos/all/xxx.mp4）
+ALL_TEST_TYPES = 'all'
+
+# コンテナ内で再利用するワーカー（get_worker()参照）
+_WORKER: Optional[VideoProcessingWorker] = None
+
+
+def get_worker() -> VideoProcessingWorker:
+    """
+    ウォームスタート間で共有するVideoProcessingWorkerを取得
+
+    Lambdaはコンテナを呼び出し間で再利用するため、MediaPipeモデル・評価器7種・config.jsonの
+    読み込みはコンテナ生存期間中1回のみ
+
+    CRITICAL: 再利用時は乱数シード再適用・警告リセット（新規生成時と同一の状態で処理）、
+              MediaPipeリソースはコンテナ終了時にclose()で解放
+    """
+    global _WORKER
+    if _WORKER is None:
+        _WORKER = VideoProcessingWorker(CONFIG_PATH)
+        atexit.register(_WORKER.close)
+    else:
+        apply_random_seed(CONFIG_PATH)
+        _WORKER.health_checker.warnings.clear()
+    return _WORKER
 
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -80,35 +113,51 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         test_type = extract_test_type(key)
         print(f"📋 テストタイプ: {test_type}")
         
-        # 動画をダウンロード
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-            video_path = tmp_file.name
+        # 動画をダウンロード（S3レスポンスを一時ファイルへ直接ストリーミング）
+        # OpenCVのデコーダーはファイルパス入力のため、メモリ上のデコードは行わない
+        # withブロック終了時（例外時含む）に一時ファイルを自動削除（ウォームスタートで/tmpに残さない）
+        with tempfile.NamedTemporaryFile(suffix='.mp4') as tmp_file:
             print(f"⬇️  動画ダウンロード中: {key}")
-            s3_client.download_file(bucket, key, video_path)
-        
-        # 動画処理
-        print(f"🎬 動画処理開始")
-        worker = VideoProcessingWorker('/var/task/config.json')
-        result = worker.process_video(video_path, test_type=test_type)
-        
-        # 一時ファイル削除
-        os.unlink(video_path)
+            s3_client.download_fileobj(bucket, key, tmp_file)
+            tmp_file.flush()
+            video_path = tmp_file.name
+            
+            # 動画処理
+            print(f"🎬 動画処理開始")
+            worker = get_worker()
+            if test_type == ALL_TEST_TYPES:
+                # ランドマーク抽出1回で全テストタイプを評価
+                results = worker.process_all(video_path)
+            else:
+                results = {test_type: worker.process_video(video_path, test_type=test_type)}
         
-        # 結果をS3に保存
-        result_key = save_results_to_s3(result, key)
-        print(f"💾 結果保存: s3://{RESULTS_BUCKET}/{result_key}")
+        result_keys = {}
+        items = []
+        for result_type, result in results.items():
+            # 結果をS3に保存
+            result_key = save_results_to_s3(result, key, suffix=result_type if test_type == ALL_TEST_TYPES else None)
+            print(f"💾 結果保存: s3://{RESULTS_BUCKET}/{result_key}")
+            items.append(make_dynamodb_item(result, bucket, key, result_key))
+            result_keys[result_type] = result_key
         
         # DynamoDBに記録
-        save_to_dynamodb(result, bucket, key, result_key)
+        save_to_dynamodb(items)
         print(f"📝 DynamoDB記録完了")
         
+        if test_type != ALL_TEST_TYPES:
+            body = {'result_key': result_keys[test_type], 'score': results[test_type]['score']}
+        else:
+            body = {
+                'result_keys': result_keys,
+                'scores': {result_type: result['score'] for result_type, result in results.items()}
+            }
+        
         return {
             'statusCode': 200,
             'body': json.dumps({
                 'message': '処理成功',
                 'video_key': key,
-                'result_key': result_key,
-                'score': result['score']
+                **body
             })
         }
         
@@ -131,6 +180,7 @@ def extract_test_type(s3_key: str) -> str:
     S3キーからテストタイプを抽出
     
     例: videos/single_leg_squat/video.mp4 → single_leg_squat
+        videos/all/video.mp4 → all（全テストタイプで評価）
     """
     parts = s3_key.split('/')
     if len(parts) >= 2:
@@ -138,13 +188,14 @@ def extract_test_type(s3_key: str) -> str:
     return 'single_leg_squat'  # デフォルト
 
 
-def save_results_to_s3(result: Dict, original_key: str) -> str:
+def save_results_to_s3(result: Dict, original_key: str, suffix: Optional[str] = None) -> str:
     """
     処理結果をS3に保存
     
     Args:
         result: 処理結果
         original_key: 元の動画のS3キー
+        suffix: ファイル名末尾に付与する識別子（全テストタイプ評価時のテストタイプ名）
         
     Returns:
         str: 保存したS3キー
@@ -156,33 +207,37 @@ def save_results_to_s3(result: Dict, original_key: str) -> str:
     date_path = datetime.now().strftime('%Y/%m/%d')
     
     filename = Path(original_key).stem
+    if suffix:
+        filename = f"{filename}_{suffix}"
     result_key = f"results/{date_path}/{filename}_{timestamp}.json"
     
     s3_client.put_object(
         Bucket=RESULTS_BUCKET,
         Key=result_key,
-        Body=json.dumps(result, ensure_ascii=False, indent=2),
+        # 機械処理向けのためインデントなし（orjson利用可能時は高速シリアライズ、ADR-012）
+        Body=dumps_json(result, indent=False),
         ContentType='application/json'
     )
     
     return result_key
 
 
-def save_to_dynamodb(result: Dict, bucket: str, video_key: str, result_key: str):
+def make_dynamodb_item(result: Dict, bucket: str, video_key: str, result_key: str) -> Dict:
     """
-    処理結果をDynamoDBに保存
+    処理結果からDynamoDBアイテムを作成
     
     Args:
         result: 処理結果
         bucket: 元のバケット名
         video_key: 動画のS3キー
         result_key: 結果のS3キー
+        
+    Returns:
+        Dict: DynamoDBアイテム
     """
     from datetime import datetime
     
-    table = dynamodb.Table(TABLE_NAME)
-    
-    item = {
+    return {
         'video_id': f"{bucket}/{video_key}",
         'processed_at': result['processed_at'],
         'test_type': result['test_type'],
@@ -192,5 +247,23 @@ def save_to_dynamodb(result: Dict, bucket: str, video_key: str, result_key: str)
         'health_check': result['health_check'],
         'ttl': int(datetime.now().timestamp()) + (90 * 24 * 60 * 60)  # 90日後に削除
     }
+
+
+def save_to_dynamodb(items: List[Dict]):
+    """
+    処理結果をDynamoDBに保存
+    
+    複数件（全テストタイプ評価時）はbatch_writerでまとめて書き込み（25件単位、未処理分は自動再送）
+    
+    Args:
+        items: make_dynamodb_item()で作成したアイテム
+    """
+    table = dynamodb.Table(TABLE_NAME)
+    
+    if len(items) == 1:
+        table.put_item(Item=items[0])
+        return
     
-    table.put_item(Item=item)
+    with table.batch_writer() as batch:
+        for item in items:
+            batch.put_item(Item=item)
@@ -22,6 +22,7 @@ from processing.evaluators.cross_step import CrossStepEvaluator
 from processing.evaluators.stride_mimic import StrideMimicEvaluator
 from processing.evaluators.push_pull import PushPullEvaluator
 from processing.evaluators.jump_landing import JumpLandingEvaluator
+from processing.landmarks import VISIBILITY, stack_landmarks
 from processing.worker import VideoProcessingWorker
 
 
@@ -110,6 +111,18 @@ class TestAllEvaluators:
             assert evaluator.config is not None, \
                 f"{evaluator_name}のconfigがNoneです"
 
+    def test_evaluators_share_config_and_normalizer(self, config_path):
+        """
+        What: 同一config.jsonの評価器間での設定・正規化器共有テスト
+        Why: 評価器インスタンスごとのconfig.json再解析・BodyNormalizer生成を排除
+        Design Decision: (絶対パス, 更新時刻)単位のキャッシュ（ADR-013）
+        """
+        first = UpperBodySwingEvaluator(config_path)
+        second = SkaterLungeEvaluator(config_path)
+
+        assert first.config is second.config
+        assert first.normalizer is second.normalizer
+
     def test_all_evaluators_evaluate_method(self, all_evaluators):
         """
         What: 全評価器のevaluate()メソッド存在確認
@@ -226,6 +239,114 @@ class TestAllEvaluators:
                 f"{evaluator_name}の評価結果が再現できません: " \
                 f"{results_1[evaluator_name]['score']} != {results_2[evaluator_name]['score']}"
 
+    @pytest.mark.parametrize('evaluator_name', [
+        'push_pull', 'jump_landing', 'single_leg_squat', 'stride_mimic'
+    ])
+    def test_evaluate_batch_matches_evaluate(self, all_evaluators, sample_landmarks, evaluator_name):
+        """
+        What: evaluate_batch()とクリップごとのevaluate()の一致テスト
+        Why: 連結計算・分割で結果が変わらないことを保証
+        Design Decision: 空クリップを含む3クリップで検証（ADR-010）
+
+        CRITICAL: クリップ境界をまたぐ計算がないこと
+        """
+        evaluator = all_evaluators[evaluator_name]
+        clips = [sample_landmarks[:25], [], sample_landmarks[25:60]]
+
+        batch_results = evaluator.evaluate_batch(clips)
+
+        assert len(batch_results) == len(clips)
+        for clip, batch_result in zip(clips, batch_results):
+            assert batch_result == evaluator.evaluate(clip)
+
+    @pytest.mark.parametrize('evaluator_name', [
+        'single_leg_squat', 'upper_body_swing', 'skater_lunge', 'cross_step',
+        'stride_mimic', 'push_pull', 'jump_landing'
+    ])
+    def test_evaluate_accepts_landmark_array(self, all_evaluators, sample_landmarks, evaluator_name):
+        """
+        What: SoA配列入力とList[Dict]入力の一致テスト
+        Why: 上流で変換済みの配列を渡しても同一結果を返すことを保証
+        Design Decision: stack_landmarks()の配列と比較（ADR-010）
+        """
+        evaluator = all_evaluators[evaluator_name]
+        arr = stack_landmarks(sample_landmarks)
+
+        assert evaluator.evaluate(arr) == evaluator.evaluate(sample_landmarks)
+        assert evaluator.evaluate(arr[:0])['score'] == 0
+
+    def test_stride_mimic_keeps_low_visibility_frames(self, all_evaluators, sample_landmarks):
+        """
+        What: StrideMimicのvisibility非依存テスト
+        Why: 低visibilityフレームの除外対象はSingleLegSquatのみ（ADR-014）、
+             StrideMimicのスコアがvisibilityで変わらないことを保証
+        """
+        evaluator = all_evaluators['stride_mimic']
+        arr = stack_landmarks(sample_landmarks)
+        hidden = arr.copy()
+        hidden[:, :, VISIBILITY] = 0.1
+
+        assert evaluator.evaluate(hidden) == evaluator.evaluate(arr)
+
+    @pytest.mark.parametrize('evaluator_name', ['upper_body_swing', 'skater_lunge'])
+    def test_truncated_frames_excluded(self, all_evaluators, sample_landmarks, evaluator_name):
+        """
+        What: 必要ランドマーク不足フレームの除外テスト
+        Why: フレームごとのランドマーク数チェックなしでも不足フレームが集計に影響しないことを保証
+        Design Decision: 不足分はSoA配列上でNaN、集計時に一括除外（ADR-010）
+        """
+        evaluator = all_evaluators[evaluator_name]
+        data = sample_landmarks[:40]
+        truncated = [{'frame': -1, 'landmarks': frame['landmarks'][:11]} for frame in data[:5]]
+
+        assert evaluator.evaluate(truncated + data) == evaluator.evaluate(data)
+
+    @pytest.mark.parametrize('evaluator_name', [
+        'upper_body_swing', 'skater_lunge', 'cross_step', 'stride_mimic', 'push_pull',
+        'jump_landing'
+    ])
+    def test_landmarks_stacked_once(self, all_evaluators, sample_landmarks, monkeypatch, evaluator_name):
+        """
+        What: List[Dict] → SoA配列変換回数テスト
+        Why: 正規化と指標計算でランドマークdictを二重走査しないことを保証
+        Design Decision: 変換済み配列を正規化処理へ渡す（ADR-010）
+        """
+        from processing import landmarks
+
+        calls = []
+        original = landmarks.stack_landmarks
+
+        def counting(landmarks_data):
+            calls.append(len(landmarks_data))
+            return original(landmarks_data)
+
+        monkeypatch.setattr(landmarks, 'stack_landmarks', counting)
+        all_evaluators[evaluator_name].evaluate(sample_landmarks[:40])
+
+        assert calls == [40]
+
+    @pytest.mark.parametrize('evaluator_name, first_metric', [
+        ('single_leg_squat', 'pelvic_stability'),
+        ('stride_mimic', 'hip_extension'),
+    ])
+    def test_evaluate_fast_matches_score(self, all_evaluators, sample_landmarks,
+                                         evaluator_name, first_metric):
+        """
+        What: fast=True評価の総合スコア一致テスト
+        Why: 先行指標スコア0での早期終了が総合スコアを変えないことを保証
+        Design Decision: 先行指標は省略時も同一結果（min集計、ADR-002）
+        """
+        evaluator = all_evaluators[evaluator_name]
+
+        for clip in (sample_landmarks, sample_landmarks[:30], sample_landmarks[::7]):
+            full = evaluator.evaluate(clip)
+            fast = evaluator.evaluate(clip, fast=True)
+
+            assert fast['score'] == full['score']
+            assert fast[first_metric] == full[first_metric]
+            if full[first_metric]['score'] > 0:
+                assert fast == full
+
     def test_worker_initialization(self, config_path):
         """
         What: VideoProcessingWorker初期化テスト
@@ -0,0 +1,108 @@
+"""
+Purpose: batch.pyの単体テスト
+Responsibility: 複数動画の品質チェック・正規化の並列実行が直列実行と一致することの検証
+Dependencies: pytest, batch.py, health_check.py, normalizer.py, sample_landmarks.json
+Created: 2026-10-15 by Claude
+Decision Log: ADR-004, ADR-010
+
+CRITICAL: 結果は入力順であること、並列・直列で同一結果であること
+"""
+import pytest
+import json
+import numpy as np
+from pathlib import Path
+import sys
+
+# CRITICAL: processing/モジュールをインポートパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processing.batch import batch_check_and_normalize, check_and_normalize
+from processing.health_check import HealthChecker
+from processing.landmarks import save_landmarks_npy, stack_landmarks
+from processing.normalizer import get_shared_normalizer
+
+
+class TestBatch:
+    """
+    What: 複数動画バッチ処理の単体テスト
+    Why: プロセスプール分散で結果が変わらないことを保証
+    Design Decision: 動画ごとのHealthChecker / BodyNormalizer呼び出し結果と比較（ADR-004）
+    """
+
+    @pytest.fixture
+    def config_path(self):
+        """
+        What: config.jsonパス取得
+        Why: ワーカープロセスでも同一config使用
+        Design Decision: プロジェクトルートのconfig.json（ADR-002）
+        """
+        return str(Path(__file__).parent.parent / 'config.json')
+
+    @pytest.fixture
+    def sample_landmarks(self):
+        """
+        What: sample_landmarks.json読み込み
+        Why: 実データでテスト
+        Design Decision: tests/fixtures/sample_landmarks.json使用（ADR-005）
+
+        CRITICAL: ファイルが存在しない場合はテストスキップ
+        """
+        json_path = Path(__file__).parent / 'fixtures' / 'sample_landmarks.json'
+        if not json_path.exists():
+            pytest.skip(f"sample_landmarks.json not found: {json_path}")
+
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+
+        return data['landmarks']
+
+    @pytest.fixture
+    def clips(self, sample_landmarks, tmp_path):
+        """
+        What: 入力形式の異なる動画群（List[Dict]、配列、.npyパス、空）
+        Why: 全入力形式がワーカーへ受け渡せることを検証
+        """
+        npy_path = tmp_path / 'clip.npy'
+        save_landmarks_npy(npy_path, stack_landmarks(sample_landmarks[20:50]))
+        return [sample_landmarks[:30], stack_landmarks(sample_landmarks[10:40]), str(npy_path), []]
+
+    def test_check_and_normalize(self, sample_landmarks, config_path):
+        """
+        What: 1動画分の処理結果テスト
+        Why: HealthChecker・BodyNormalizerを個別に呼んだ結果と一致することを検証
+        """
+        result = check_and_normalize(sample_landmarks, config_path)
+
+        is_quality_ok, quality_result = HealthChecker(config_path).check_landmark_quality(sample_landmarks)
+        rep_values, _ = get_shared_normalizer(config_path).normalize_landmarks_sequence(sample_landmarks)
+
+        assert result['is_quality_ok'] == is_quality_ok
+        assert result['health_check'] == quality_result
+        assert result['normalization'] == rep_values
+
+    def test_batch_parallel_matches_serial(self, clips, config_path):
+        """
+        What: 並列実行と直列実行の一致テスト
+        Why: spawnワーカーで同一結果・入力順が保たれることを検証
+        Design Decision: workers=1は同一プロセス実行（ADR-004）
+
+        CRITICAL: 空動画もエラーにせず品質NGとして返すこと
+        """
+        serial = batch_check_and_normalize(clips, workers=1, config_path=config_path)
+        parallel = batch_check_and_normalize(clips, workers=2, config_path=config_path)
+
+        assert len(parallel) == len(serial) == len(clips)
+        for par, ser in zip(parallel, serial):
+            assert par['is_quality_ok'] == ser['is_quality_ok']
+            assert par['health_check'] == ser['health_check']
+            for key, value in ser['normalization'].items():
+                assert par['normalization'][key] == pytest.approx(value, nan_ok=True)
+        assert serial[-1]['is_quality_ok'] is False
+        assert np.isnan(serial[-1]['normalization']['shoulder_width'])
+
+    def test_batch_empty(self, config_path):
+        """
+        What: 空入力テスト
+        Why: プールを起動せず空リストを返すことを確認
+        """
+        assert batch_check_and_normalize([], config_path=config_path) == []
@@ -9,6 +9,7 @@ CRITICAL: visibility閾値チェック必須、warnings.json出力検証必須
 """
 import pytest
 import json
+import numpy as np
 import tempfile
 from pathlib import Path
 from datetime import datetime
@@ -18,6 +19,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from processing.health_check import HealthChecker, apply_random_seed
+from processing.landmarks import stack_landmarks
 
 
 class TestHealthChecker:
@@ -137,6 +139,89 @@ class TestHealthChecker:
         assert result['low_visibility_frames'] > 0, \
             f"低品質フレームが検出されません: {result['low_visibility_frames']}"
 
+    def test_check_landmark_quality_ragged_frames(self, health_checker):
+        """
+        What: ランドマーク数不揃い・欠損データの品質チェックテスト
+        Why: 一括判定がフレームごとの判定（ランドマーク数基準の割合）と一致することを検証
+        Design Decision: visibilityキー欠損は0.0扱い、NaNは低visibility扱いしない（ADR-004）
+        """
+        low = health_checker.confidence_min / 2
+        high = min(1.0, health_checker.confidence_min + 0.1)
+
+        def frame(i, visibilities):
+            return {'frame': i, 'landmarks': [
+                {'x': 0.5, 'y': 0.5} if v is None else {'x': 0.5, 'y': 0.5, 'visibility': v}
+                for v in visibilities
+            ]}
+
+        data = [
+            frame(0, [low] * 4 + [high] * 6),       # 4/10 > 0.3 → 低品質フレーム
+            frame(1, []),                            # 未検出
+            frame(2, [None] * 3 + [high] * 7),      # キー欠損3/10 → 低品質ではない
+            frame(3, [float('nan')] * 33),          # NaNは判定しない
+            frame(4, [low] * 11 + [high] * 22),     # 11/33 > 0.3 → 低品質フレーム
+        ]
+
+        _, result = health_checker.check_landmark_quality(data)
+
+        assert result['total_frames'] == 5
+        assert result['detected_frames'] == 4
+        assert result['low_visibility_frames'] == 2
+        assert result['low_visibility_landmarks_count'] == 4 + 3 + 11
+        assert 'low_visibility_landmarks' not in result
+
+        _, verbose_result = health_checker.check_landmark_quality(data, verbose=True)
+        details = verbose_result['low_visibility_landmarks']
+
+        assert len(details) == result['low_visibility_landmarks_count']
+        assert details[0] == {'frame': 0, 'landmark_idx': 0, 'visibility': low}
+        assert details[4] == {'frame': 2, 'landmark_idx': 0, 'visibility': 0.0}
+        assert details[-1] == {'frame': 4, 'landmark_idx': 10, 'visibility': low}
+
+    def test_check_landmark_quality_accepts_landmark_array(self, health_checker, sample_landmarks):
+        """
+        What: SoA配列入力とList[Dict]入力の品質チェック一致テスト
+        Why: 取り込み時に変換済みの配列を渡しても同一判定になることを保証
+        Design Decision: x座標NaNのランドマークは未検出扱い（ADR-010）
+        """
+        data = sample_landmarks[:30] + [{'frame': 999, 'landmarks': []}]
+        data[0] = {'frame': data[0]['frame'], 'landmarks': [
+            dict(lm, visibility=0.0) for lm in data[0]['landmarks'][:20]
+        ]}
+        arr = stack_landmarks(data)
+
+        ok, result = health_checker.check_landmark_quality(data, verbose=True)
+        arr_ok, arr_result = health_checker.check_landmark_quality(arr, verbose=True)
+
+        assert arr_ok == ok
+        assert arr_result['detected_frames'] == result['detected_frames'] == 30
+        assert arr_result['low_visibility_frames'] == result['low_visibility_frames']
+        assert arr_result['low_visibility_landmarks_count'] == result['low_visibility_landmarks_count']
+        assert arr_result['low_visibility_landmarks'][0] == {
+            'frame': 0, 'landmark_idx': 0, 'visibility': 0.0
+        }
+        assert len(arr_result['low_visibility_landmarks']) == len(result['low_visibility_landmarks'])
+
+    def test_check_landmark_quality_array_frame_numbers(self, health_checker, sample_landmarks):
+        """
+        What: SoA配列 + framesの詳細出力テスト
+        Why: extract_landmarks()の'frames'を渡すとList[Dict]入力と同じ元のフレーム番号になることを検証
+        """
+        data = [dict(frame_data, frame=frame_data['frame'] + 100) for frame_data in sample_landmarks[:10]]
+        data[3] = {'frame': data[3]['frame'], 'landmarks': [
+            dict(lm, visibility=0.1) for lm in data[3]['landmarks']
+        ]}
+        frames = np.array([frame_data['frame'] for frame_data in data])
+
+        _, result = health_checker.check_landmark_quality(data, verbose=True)
+        _, arr_result = health_checker.check_landmark_quality(stack_landmarks(data), verbose=True, frames=frames)
+
+        def keys(details):
+            return [(d['frame'], d['landmark_idx']) for d in details]
+
+        assert keys(arr_result['low_visibility_landmarks']) == keys(result['low_visibility_landmarks'])
+        assert (103, 0) in keys(arr_result['low_visibility_landmarks'])
+
     def test_visibility_threshold(self, health_checker, config_values):
         """
         What: visibility閾値テスト
@@ -243,6 +328,13 @@ class TestHealthChecker:
             generated_at = warnings_data['generated_at']
             datetime.fromisoformat(generated_at.replace('Z', '+00:00'))  # パース確認
 
+            # 検証: 各warningのtimestampはISO 8601文字列（メモリ上のwarningsも同一形式）
+            assert warnings_data['total_warnings'] == len(warnings_data['warnings']) > 0
+            assert warnings_data['warnings'] == health_checker.warnings
+            for warning in health_checker.warnings:
+                assert isinstance(warning['timestamp'], str)
+                datetime.fromisoformat(warning['timestamp'])
+
         finally:
             # 一時ファイル削除
             Path(tmp_path).unlink(missing_ok=True)
@@ -283,6 +375,27 @@ class TestHealthChecker:
         assert is_valid is True, f"config.json検証失敗: {errors}"
         assert len(errors) == 0, f"エラーが存在します: {errors}"
 
+    def test_validate_config_missing_keys(self, health_checker):
+        """
+        What: 必須キー欠損・不正値の検出テスト
+        Why: 欠損キーごとにエラーメッセージが生成されることを確認
+        Design Decision: 共有設定dictは変更せず差し替え（ADR-013）
+        """
+        health_checker.config = {
+            'thresholds': {'confidence_min': 1.5},
+            'data_integrity': {'random_seed': '42'},
+        }
+
+        is_valid, errors = health_checker.validate_config()
+
+        assert is_valid is False
+        assert errors == [
+            "Missing required config key: thresholds.frame_skip_tolerance",
+            "Missing required config key: data_integrity.nan_handling",
+            "Invalid confidence_min: 1.5 (must be 0.0-1.0)",
+            "Invalid random_seed type: <class 'str'> (must be int)",
+        ]
+
     def test_empty_landmarks_data(self, health_checker):
         """
         What: 空データ処理テスト
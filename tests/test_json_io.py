@@ -0,0 +1,80 @@
+"""
+Purpose: json_io.pyの単体テスト
+Responsibility: orjson/標準jsonの出力互換性検証
+Dependencies: pytest, json_io.py
+Created: 2026-10-15 by Claude
+Decision Log: ADR-012
+
+CRITICAL: orjson有無で読み戻し結果が一致すること
+"""
+import pytest
+import json
+import numpy as np
+from pathlib import Path
+import sys
+
+# CRITICAL: processing/モジュールをインポートパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processing import json_io
+
+
+class TestJsonIO:
+    """
+    What: json_io.pyの単体テスト
+    Why: シリアライザ切り替えで保存内容が変わらないことを保証
+    Design Decision: monkeypatchでorjson未インストール環境を再現（ADR-012）
+    """
+
+    @pytest.fixture
+    def payload(self):
+        """
+        What: numpy型・非ASCII文字を含むテストデータ
+        Why: 両シリアライザの差異が出やすい入力で検証
+        """
+        return {
+            'score': np.int64(3),
+            'ratio': np.float32(1.5),
+            'frames': np.arange(3),
+            'details': '総合評価: 優秀'
+        }
+
+    def test_fallback_matches(self, payload, monkeypatch):
+        """
+        What: orjson未インストール時の出力互換性テスト
+        Why: 任意依存の有無で保存結果が変わらないことを検証
+        Design Decision: json.loadsで読み戻して比較（ADR-012）
+        """
+        default = json.loads(json_io.dumps_json(payload))
+        monkeypatch.setattr(json_io, 'orjson', None)
+        fallback = json.loads(json_io.dumps_json(payload))
+
+        assert default == fallback
+        assert fallback['frames'] == [0, 1, 2]
+
+    def test_dump_json_writes_utf8(self, payload, tmp_path):
+        """
+        What: ファイル保存テスト
+        Why: 非ASCII文字がエスケープされずに保存されることを検証
+        """
+        filepath = tmp_path / 'result.json'
+        json_io.dump_json(payload, filepath)
+
+        text = filepath.read_text(encoding='utf-8')
+        assert '総合評価' in text
+        assert json.loads(text)['score'] == 3
+
+    def test_load_json_fallback_matches(self, tmp_path, monkeypatch):
+        """
+        What: orjson未インストール時の読み込み互換性テスト
+        Why: config.json等の読み込み結果が任意依存の有無で変わらないことを検証
+        """
+        filepath = tmp_path / 'config.json'
+        filepath.write_text('{"thresholds": {"a": 1.5, "b": [1, 2]}, "名前": "値"}', encoding='utf-8')
+
+        default = json_io.load_json(filepath)
+        monkeypatch.setattr(json_io, 'orjson', None)
+        fallback = json_io.load_json(filepath)
+
+        assert default == fallback
+        assert fallback['thresholds']['a'] == 1.5
@@ -0,0 +1,197 @@
+"""
+Purpose: evaluators/_kernels.pyの単体テスト
+Responsibility: numba有無で左右関節角度集約が一致することの検証
+Dependencies: pytest, numpy, _kernels.py, _angles.py
+Created: 2026-10-15 by Claude
+Decision Log: ADR-010, ADR-012
+
+CRITICAL: 計算不能フレームはNaNで保持されること
+"""
+import pytest
+import os
+import subprocess
+import numpy as np
+from pathlib import Path
+import sys
+
+# CRITICAL: processing/モジュールをインポートパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processing.evaluators import _kernels
+from processing.evaluators._angles import batch_joint_angles, joint_angles
+
+LEFT = (23, 25, 27)
+RIGHT = (24, 26, 28)
+
+
+class TestKernels:
+    """
+    What: 左右関節角度集約カーネルの単体テスト
+    Why: JITカーネルとNumPyフォールバックの結果一致を保証
+    Design Decision: joint_angles()を参照実装として比較（ADR-012）
+    """
+
+    @pytest.fixture
+    def landmarks(self):
+        """
+        What: 欠損・ゼロ長ベクトルを含むランダムランドマーク
+        Why: NaN伝播の検証
+        """
+        rng = np.random.default_rng(0)
+        lm = rng.random((50, 33, 2)).astype(np.float32)
+        lm[3, 25] = np.nan           # 左膝欠損
+        lm[7, 26] = lm[7, 24]        # 右hip-knee長さ0
+        return lm
+
+    @pytest.mark.parametrize('numba_enabled', [False, True])
+    @pytest.mark.parametrize('func, reduce', [
+        (_kernels.min_joint_angles, np.minimum),
+        (_kernels.max_joint_angles, np.maximum),
+        (_kernels.mean_joint_angles, lambda a, b: 0.5 * (a + b)),
+    ])
+    def test_pair_joint_angles(self, landmarks, monkeypatch, numba_enabled, func, reduce):
+        """
+        What: 左右集約（min/max/平均）の一致テスト
+        Why: numba有無で同一結果を返すことを検証
+        Design Decision: numba未導入環境ではJIT側をスキップ（ADR-012）
+
+        CRITICAL: 片側が計算不能なフレームはNaN
+        """
+        if numba_enabled and not _kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(_kernels, 'NUMBA_AVAILABLE', numba_enabled)
+        monkeypatch.setattr(_kernels, 'JIT_MIN_FRAMES', 0)
+
+        left = joint_angles(*(landmarks[:, i] for i in LEFT))
+        right = joint_angles(*(landmarks[:, i] for i in RIGHT))
+        expected = reduce(left, right)
+
+        result = func(landmarks, LEFT, RIGHT)
+
+        assert result.shape == (50,)
+        assert np.isnan(result[3]) and np.isnan(result[7])
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+    @pytest.mark.parametrize('numba_enabled', [False, True])
+    def test_paired_joint_angles(self, landmarks, monkeypatch, numba_enabled):
+        """
+        What: 左右関節角度（非集約）の一致テスト
+        Why: numba有無で(F, 2)の同一結果を返すことを検証
+        Design Decision: batch_joint_angles()を参照実装として比較（ADR-012）
+        """
+        if numba_enabled and not _kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        monkeypatch.setattr(_kernels, 'NUMBA_AVAILABLE', numba_enabled)
+        monkeypatch.setattr(_kernels, 'JIT_MIN_FRAMES', 0)
+
+        expected = batch_joint_angles(landmarks, *zip(LEFT, RIGHT))
+
+        result = _kernels.paired_joint_angles(landmarks, LEFT, RIGHT)
+
+        assert result.shape == (50, 2)
+        assert np.isnan(result[3, 0]) and np.isnan(result[7, 1])
+        np.testing.assert_allclose(result, expected, rtol=1e-12, equal_nan=True)
+
+    def test_nan_min_max_mean(self):
+        """
+        What: NaN・inf除外の集計テスト
+        Why: フィルタ + min/max/meanの既存集計と一致することを検証
+        Design Decision: 全NaNは(NaN, NaN, NaN, 0)（ADR-012）
+        """
+        values = np.array([0.4, np.nan, 0.1, 0.7, np.inf], dtype=np.float32)
+        lo, hi, mean, count = _kernels.nan_min_max_mean(values)
+
+        finite = values[np.isfinite(values)]
+        assert count == 3
+        assert lo == pytest.approx(float(finite.min()))
+        assert hi == pytest.approx(float(finite.max()))
+        assert mean == pytest.approx(float(finite.mean()))
+
+        lo, hi, mean, count = _kernels.nan_min_max_mean(np.full(4, np.nan))
+        assert count == 0
+        assert np.isnan(lo) and np.isnan(hi) and np.isnan(mean)
+
+    def test_numba_import_deferred(self):
+        """
+        What: numba遅延importテスト
+        Why: 評価器・正規化モジュールのimportだけでnumba本体を読み込まないことを保証（起動時間短縮）
+        Design Decision: 新規プロセスでsys.modulesを確認（ADR-012）
+        """
+        code = (
+            "import sys\n"
+            "import processing.normalizer, processing.health_check\n"
+            "import processing.evaluators.upper_body_swing, processing.evaluators.skater_lunge\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       cwd=str(Path(__file__).parent.parent))
+
+    def test_short_series_skips_jit(self):
+        """
+        What: JIT_MIN_FRAMES未満の時系列でnumbaを読み込まないことのテスト
+        Why: 通常の動画長ではJITコンパイル（プロセスごと約2.5秒）を発生させない
+        Design Decision: 新規プロセスでsys.modulesを確認（ADR-012）
+        """
+        code = (
+            "import sys\n"
+            "import numpy as np\n"
+            "from processing.evaluators import _kernels\n"
+            "_kernels.NUMBA_AVAILABLE = True\n"
+            "lm = np.random.default_rng(0).random((1000, 33, 2))\n"
+            "_kernels.min_joint_angles(lm, (23, 25, 27), (24, 26, 28))\n"
+            "_kernels.paired_joint_angles(lm, (23, 25, 27), (24, 26, 28))\n"
+            "assert 'numba' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       cwd=str(Path(__file__).parent.parent))
+
+    @pytest.mark.parametrize('cache_dir, expected', [('', False), ('numba_cache', True)])
+    def test_jit_cache_requires_cache_dir(self, tmp_path, cache_dir, expected):
+        """
+        What: JITディスクキャッシュの有効化条件テスト
+        Why: NUMBA_CACHE_DIR未設定時はパッケージ配下へキャッシュを書き込まないことを保証
+        Design Decision: 新規プロセスで環境変数を切り替えて確認（ADR-012）
+        """
+        if not _kernels.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+        env = dict(os.environ)
+        env.pop('NUMBA_CACHE_DIR', None)
+        if cache_dir:
+            env['NUMBA_CACHE_DIR'] = str(tmp_path / cache_dir)
+        code = (
+            "from processing.evaluators import _kernels_numba\n"
+            f"assert _kernels_numba._CACHE is {expected}\n"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True, env=env,
+                       cwd=str(Path(__file__).parent.parent))
+
+    def test_float32_storage_precision(self):
+        """
+        What: float32座標保持時の角度誤差テスト
+        Why: LANDMARK_DTYPE=float32の許容誤差（0.01°未満）を保証
+        Design Decision: float64座標からの計算結果を参照値とする（ADR-010）
+        """
+        rng = np.random.default_rng(1)
+        lm64 = rng.random((1000, 33, 2))
+        lm32 = lm64.astype(np.float32)
+
+        expected = _kernels.mean_joint_angles(lm64, LEFT, RIGHT)
+        result = _kernels.mean_joint_angles(lm32, LEFT, RIGHT)
+
+        np.testing.assert_allclose(result, expected, atol=0.01)
+
+    def test_batch_joint_angles(self, landmarks):
+        """
+        What: 複数関節一括計算テスト
+        Why: 関節ごとのjoint_angles()と一致することを検証
+        Design Decision: 列指定で(F, J)、int指定で(F,)（ADR-010）
+        """
+        angles = batch_joint_angles(landmarks, *zip(LEFT, RIGHT))
+
+        assert angles.shape == (50, 2)
+        np.testing.assert_array_equal(
+            angles[:, 0], joint_angles(*(landmarks[:, i] for i in LEFT))
+        )
+        np.testing.assert_array_equal(
+            angles[:, 1], batch_joint_angles(landmarks, *RIGHT)
+        )
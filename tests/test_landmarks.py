@@ -0,0 +1,154 @@
+"""
+Purpose: landmarks.pyの単体テスト
+Responsibility: SoA変換・量子化保存の検証
+Dependencies: pytest, landmarks.py, sample_landmarks.json
+Created: 2026-10-15 by Claude
+Decision Log: ADR-010, ADR-011
+
+CRITICAL: NaN保持検証必須、往復変換の誤差検証必須
+"""
+import pytest
+import json
+import numpy as np
+from pathlib import Path
+import sys
+
+# CRITICAL: processing/モジュールをインポートパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processing.landmarks import (
+    QUANT_SCALE,
+    as_landmark_array,
+    load_landmarks_mmap,
+    load_landmarks_npz,
+    low_visibility_frames,
+    save_landmarks_npy,
+    save_landmarks_npz,
+    stack_landmarks,
+)
+
+
+class TestLandmarks:
+    """
+    What: landmarks.pyの単体テスト
+    Why: SoA変換・量子化の正確性保証
+    Design Decision: pytest標準準拠、sample_landmarks.json使用（ADR-005）
+
+    CRITICAL: 欠損値はNaNで保持されること
+    """
+
+    @pytest.fixture
+    def sample_landmarks(self):
+        """
+        What: sample_landmarks.json読み込み
+        Why: 実データでテスト
+        Design Decision: tests/fixtures/sample_landmarks.json使用（ADR-005）
+
+        CRITICAL: ファイルが存在しない場合はテストスキップ
+        """
+        json_path = Path(__file__).parent / 'fixtures' / 'sample_landmarks.json'
+        if not json_path.exists():
+            pytest.skip(f"sample_landmarks.json not found: {json_path}")
+
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+
+        return data['landmarks']
+
+    def test_stack_landmarks(self, sample_landmarks):
+        """
+        What: List[Dict] → SoA配列変換テスト
+        Why: 形状と値の一致を検証
+        Design Decision: 実データで検証（ADR-010）
+        """
+        arr = stack_landmarks(sample_landmarks)
+
+        assert arr.shape == (len(sample_landmarks), 33, 4)
+        assert arr.dtype == np.float32
+        lm = sample_landmarks[0]['landmarks'][23]
+        assert arr[0, 23, 1] == pytest.approx(lm['y'], abs=1e-6)
+        assert as_landmark_array(arr) is arr
+
+    def test_stack_landmarks_missing_keeps_nan(self):
+        """
+        What: ランドマーク不足・キー欠損時のNaN保持テスト
+        Why: データ整合性ルール検証（フレーム削除禁止）
+        Design Decision: 不足分とキー欠損はNaN（ADR-010）
+
+        CRITICAL: フレーム数は入力と一致すること
+        """
+        data = [
+            {'landmarks': [{'x': 0.5}]},
+            {'landmarks': []},
+        ]
+        arr = stack_landmarks(data)
+
+        assert arr.shape == (2, 33, 4)
+        assert arr[0, 0, 0] == pytest.approx(0.5)
+        assert np.isnan(arr[0, 0, 1])
+        assert np.isnan(arr[1]).all()
+
+    def test_as_landmark_array_rejects_bad_shape(self):
+        """
+        What: 形状不正ndarrayのエラーテスト
+        Why: 評価器のランドマーク数チェック省略の前提を保証
+        Design Decision: ValueError送出（ADR-010）
+        """
+        with pytest.raises(ValueError):
+            as_landmark_array(np.zeros((10, 17, 4), dtype=np.float32))
+
+    def test_npy_mmap_roundtrip(self, sample_landmarks, tmp_path):
+        """
+        What: .npy保存・メモリマップ読み込みの往復テスト
+        Why: メモリマップ配列がそのまま評価入力として使えることを検証
+        Design Decision: float32そのまま（量子化なし、ADR-010）
+
+        CRITICAL: NaNはNaNのまま復元されること、読み取り専用であること
+        """
+        arr = stack_landmarks(sample_landmarks)
+        arr[0, 0, 2] = np.nan
+        filepath = tmp_path / 'landmarks.npy'
+
+        save_landmarks_npy(filepath, arr)
+        restored = load_landmarks_mmap(filepath)
+
+        assert isinstance(restored, np.memmap)
+        assert not restored.flags.writeable
+        np.testing.assert_array_equal(restored, arr)
+        assert as_landmark_array(restored) is restored
+
+        np.save(tmp_path / 'float64.npy', arr.astype(np.float64))
+        with pytest.raises(ValueError):
+            load_landmarks_mmap(tmp_path / 'float64.npy')
+
+    def test_low_visibility_frames(self):
+        """
+        What: 低visibilityフレーム判定テスト
+        Why: 指定ランドマークのいずれかが閾値未満のフレームのみ検出することを検証
+        Design Decision: visibility欠損（NaN）は除外しない（ADR-014）
+        """
+        arr = np.full((4, 33, 4), 0.9, dtype=np.float32)
+        arr[1, 25, 3] = 0.3         # 対象ランドマークが低visibility
+        arr[2, 0, 3] = 0.1          # 対象外ランドマーク
+        arr[3, 25, 3] = np.nan      # visibility欠損
+
+        low = low_visibility_frames(arr, (23, 25, 27), 0.5)
+
+        assert low.tolist() == [False, True, False, False]
+
+    def test_npz_roundtrip(self, sample_landmarks, tmp_path):
+        """
+        What: npzサイドカー保存の往復変換テスト
+        Why: 保存ファイルからランドマーク・フレーム番号が復元できることを検証
+        Design Decision: 誤差は量子化分解能の1/2以内（ADR-011）
+        """
+        arr = stack_landmarks(sample_landmarks)
+        frames = [f['frame'] for f in sample_landmarks]
+        filepath = tmp_path / 'result.npz'
+
+        save_landmarks_npz(filepath, arr, frames, 30.0)
+        restored = load_landmarks_npz(filepath)
+
+        assert restored['fps'] == 30.0
+        assert restored['frames'].tolist() == frames
+        np.testing.assert_allclose(restored['landmarks'], arr, atol=0.5 / QUANT_SCALE + 1e-7)
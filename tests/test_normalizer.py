@@ -16,6 +16,7 @@ import sys
 # CRITICAL: processing/モジュールをインポートパスに追加
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from processing.landmarks import stack_landmarks
 from processing.normalizer import BodyNormalizer, normalize_value
 
 
@@ -193,6 +194,104 @@ class TestBodyNormalizer:
                 assert abs(actual_value - expected_median) < 1e-6, \
                     f"代表値{key}が中央値と一致しません: {actual_value} != {expected_median}"
 
+    def test_reference_series_matches_frame_data(self, normalizer, sample_landmarks):
+        """
+        What: 一括計算とフレーム単位計算の一致テスト
+        Why: calculate_reference_series()がnormalize_frame_data()と同じ欠損規則に従うことを検証
+        Design Decision: 片側欠損・ランドマーク不足フレームを含めて比較（ADR-003, ADR-010）
+
+        CRITICAL: 計算不可フレームはNone（配列側はNaN）で一致すること
+        """
+        test_data = json.loads(json.dumps(sample_landmarks[:20]))
+        del test_data[1]['landmarks'][27]['z']          # 左足首z欠損 → 右脚のみ
+        test_data[2]['landmarks'][11]['x'] = float('nan')  # 左肩NaN → 骨盤幅のみ
+        test_data[3]['landmarks'] = test_data[3]['landmarks'][:20]  # ランドマーク不足
+
+        _, frame_values = normalizer.normalize_landmarks_sequence(test_data)
+
+        for frame_data, actual in zip(test_data, frame_values):
+            expected = normalizer.normalize_frame_data(frame_data['landmarks'])
+            for key, value in expected.items():
+                if value is None:
+                    assert actual[key] is None, f"{key}がNoneではありません"
+                else:
+                    assert actual[key] == pytest.approx(value, rel=1e-5)
+
+        assert frame_values[3]['leg_length'] is None
+        assert frame_values[1]['leg_length'] is not None
+
+    def test_frame_normalizations_view(self, normalizer, sample_landmarks):
+        """
+        What: フレーム別値ビューのリスト互換テスト
+        Why: 辞書生成を遅延してもlen・添字・スライス・反復が従来のリストと同じ結果を返すことを検証
+        Design Decision: normalize_frame_data()の結果と比較（ADR-003, ADR-010）
+        """
+        test_data = sample_landmarks[:5]
+        _, frame_values = normalizer.normalize_landmarks_sequence(test_data)
+        expected = [normalizer.normalize_frame_data(f['landmarks']) for f in test_data]
+
+        assert len(frame_values) == 5
+        assert list(frame_values[1:3]) == list(frame_values)[1:3]
+        assert frame_values[-1] == frame_values[4]
+        for actual, exp in zip(frame_values, expected):
+            assert actual.keys() == exp.keys()
+            for key in exp:
+                assert actual[key] == pytest.approx(exp[key], rel=1e-5)
+        with pytest.raises(IndexError):
+            frame_values[5]
+
+    def test_normalize_landmarks_batch(self, normalizer, sample_landmarks):
+        """
+        What: 複数動画一括正規化テスト
+        Why: 長さの異なる動画をパディングしても動画ごとの代表値と一致することを検証
+        Design Decision: normalize_landmarks_sequence()の代表値と比較（ADR-003, ADR-010）
+
+        CRITICAL: 全フレーム欠損の指標はNaN保持
+        """
+        missing_shoulder = stack_landmarks(sample_landmarks[:8])
+        missing_shoulder[:, 11] = np.nan
+        clips = [sample_landmarks[:30], [], missing_shoulder, sample_landmarks[40:45]]
+
+        batch = normalizer.normalize_landmarks_batch(clips)
+
+        assert len(batch) == len(clips)
+        for clip, rep in zip(clips, batch):
+            expected, _ = normalizer.normalize_landmarks_sequence(clip)
+            assert rep.keys() == expected.keys()
+            for key in expected:
+                assert rep[key] == pytest.approx(expected[key], nan_ok=True)
+        assert np.isnan(batch[1]['shoulder_width'])
+        assert np.isnan(batch[2]['shoulder_width'])
+        assert normalizer.normalize_landmarks_batch([]) == []
+
+    def test_frame_helpers_accept_landmark_array(self, normalizer, sample_landmarks):
+        """
+        What: 基準値計算の配列入力テスト
+        Why: (33, 4)配列はList[Dict]と同じスカラー、(F, 33, 4)配列は時系列を返すことを検証
+        Design Decision: stack_landmarks()の配列と比較（ADR-010）
+        """
+        arr = stack_landmarks(sample_landmarks[:10])
+        arr[2, 11, 0] = np.nan   # 左肩欠損
+
+        for method in (normalizer.calculate_shoulder_width, normalizer.calculate_pelvis_width,
+                       normalizer.calculate_leg_length, normalizer.calculate_base_width):
+            series = method(arr)
+            assert series.shape == (10,)
+
+            for frame_idx, frame_data in enumerate(sample_landmarks[:10]):
+                value = method(arr[frame_idx])
+                if frame_idx != 2:
+                    assert value == pytest.approx(method(frame_data['landmarks']), rel=1e-5)
+                if value is None:
+                    assert np.isnan(series[frame_idx])
+                else:
+                    assert series[frame_idx] == pytest.approx(value)
+
+        assert normalizer.calculate_shoulder_width(arr[2]) is None
+        assert normalizer.calculate_base_width(arr[2]) == pytest.approx(
+            normalizer.calculate_pelvis_width(arr[2])
+        )
+
     def test_normalize_value_normal(self):
         """
         What: 正規化ヘルパー関数テスト（正常系）
@@ -274,6 +373,21 @@ class TestBodyNormalizer:
         base_width = normalizer.calculate_base_width(insufficient_landmarks)
         assert base_width is None, f"ランドマーク不足時はNoneを返すべきですが: {base_width}"
 
+    def test_calculate_distance_invalid_points(self, normalizer):
+        """
+        What: 2点間距離の不正入力テスト
+        Why: スカラーNaN判定・例外捕捉でNone返却が維持されることを検証
+        Design Decision: NaN・キー欠損・None値・非dictはNone（ADR-003）
+        """
+        p1 = {'x': 0.0, 'y': 0.0, 'z': 0.0}
+        p2 = {'x': 3.0, 'y': 4.0, 'z': 0.0}
+
+        assert normalizer.calculate_distance(p1, p2) == pytest.approx(5.0)
+        assert normalizer.calculate_distance(p1, {**p2, 'z': float('nan')}) is None
+        assert normalizer.calculate_distance(p1, {'x': 3.0, 'y': 4.0}) is None
+        assert normalizer.calculate_distance({**p1, 'x': None}, p2) is None
+        assert normalizer.calculate_distance(None, p2) is None
+
     def test_real_data_integration(self, normalizer, sample_landmarks):
         """
         What: 実データ統合テスト
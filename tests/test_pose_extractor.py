@@ -0,0 +1,313 @@
+"""
+Purpose: pose_extractor.pyの単体テスト
+Responsibility: 抽出ループ（推論省略ポリシー含む）とJSON保存形式（List[Dict]）への変換検証
+Dependencies: pytest, cv2, pose_extractor.py, landmarks.py, sample_landmarks.json
+Created: 2026-10-15 by Claude
+Decision Log: ADR-005, ADR-010
+
+CRITICAL: 保存JSONのフォーマットは従来のextract_landmarks()出力と同一であること
+"""
+import pytest
+import cv2
+import json
+import numpy as np
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+import threading
+
+# CRITICAL: processing/モジュールをインポートパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processing.landmarks import VISIBILITY, load_landmarks_npz, stack_landmarks
+from processing.pose_extractor import PoseExtractor
+from processing.video_io import FramePreprocessor
+
+
+class FakePose:
+    """
+    What: MediaPipe Poseの代替（固定visibilityのランドマークを返す）
+    Why: モデルダウンロードなしで抽出ループを検証
+    Design Decision: x座標はreset()以降の推論回数に応じて変化（トラッキング状態の引き継ぎを再現）
+    """
+
+    def __init__(self, visibility):
+        self.visibility = visibility
+        self.calls = 0
+        self.tracked = 0
+        self.shapes = []
+        self.closed = 0
+
+    def process(self, image):
+        self.calls += 1
+        self.tracked += 1
+        self.shapes.append(image.shape)
+        x = 0.5 + 0.01 * self.tracked
+        landmark = [SimpleNamespace(x=x, y=0.5, z=0.0, visibility=self.visibility) for _ in range(33)]
+        return SimpleNamespace(pose_landmarks=SimpleNamespace(landmark=landmark))
+
+    def reset(self):
+        self.tracked = 0
+
+    def close(self):
+        self.closed += 1
+
+
+def make_extractor(visibility, reuse_interval=1, max_frame_height=None):
+    """
+    What: FakePoseを使うPoseExtractor生成（__init__のMediaPipe初期化を回避）
+    """
+    extractor = PoseExtractor.__new__(PoseExtractor)
+    extractor.pose = FakePose(visibility)
+    extractor.reuse_interval = reuse_interval
+    extractor.reuse_min_visibility = 0.7
+    extractor.max_frame_height = max_frame_height
+    return extractor
+
+
+class TestPoseExtractor:
+    """
+    What: PoseExtractorの単体テスト
+    Why: 抽出ループの推論省略・SoA化で結果と保存フォーマットが変わらないことを保証
+    Design Decision: MediaPipeモデルの代わりにFakePoseと合成動画で検証（ADR-005）
+    """
+
+    @pytest.fixture
+    def video_path(self, tmp_path):
+        """
+        What: 10フレームの合成動画生成
+        Why: tests/test_videos/の実動画がない環境でも抽出ループを検証
+        """
+        path = tmp_path / 'synthetic.avi'
+        writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*'MJPG'), 30.0, (64, 48))
+        for i in range(10):
+            writer.write(np.full((48, 64, 3), i * 20, dtype=np.uint8))
+        writer.release()
+        return str(path)
+
+    def test_extract_landmarks_every_frame(self, video_path):
+        """
+        What: 既定設定（reuse_interval=1）の抽出テスト
+        Why: 全フレームで推論し、SoA配列とフレーム番号を返すことを検証
+        """
+        extractor = make_extractor(visibility=0.9)
+        data = extractor.extract_landmarks(video_path, hw_decode=False)
+
+        assert extractor.pose.calls == 10
+        assert data['landmarks'].shape == (10, 33, 4)
+        assert data['frames'].tolist() == list(range(10))
+        assert data['detected_frames'] == 10
+
+    def test_reuse_high_visibility(self, video_path):
+        """
+        What: 高visibility区間の推論省略テスト
+        Why: reuse_interval=2で推論回数が半減し、中間フレームは直前の結果で埋まることを検証
+        """
+        extractor = make_extractor(visibility=0.9, reuse_interval=2)
+        data = extractor.extract_landmarks(video_path, hw_decode=False)
+
+        assert extractor.pose.calls == 5
+        assert data['frames'].tolist() == list(range(10))
+        assert np.all(data['landmarks'][:, :, VISIBILITY] == pytest.approx(0.9))
+
+    def test_no_reuse_low_visibility(self, video_path):
+        """
+        What: 低visibility時の推論継続テスト
+        Why: 平均visibilityが閾値未満の場合は中間フレームも推論することを検証
+        """
+        extractor = make_extractor(visibility=0.5, reuse_interval=2)
+        extractor.extract_landmarks(video_path, hw_decode=False)
+
+        assert extractor.pose.calls == 10
+
+    def test_repeat_extraction_identical(self, video_path):
+        """
+        What: 同一動画の連続抽出テスト
+        Why: 前回抽出のトラッキング状態が引き継がれず、2回目も同一のランドマークになることを検証
+        """
+        extractor = make_extractor(visibility=0.9)
+        first = extractor.extract_landmarks(video_path, hw_decode=False)
+        second = extractor.extract_landmarks(video_path, hw_decode=False)
+
+        np.testing.assert_array_equal(first['landmarks'], second['landmarks'])
+        assert first['frames'].tolist() == second['frames'].tolist()
+
+    def test_thread_start_failure_releases(self, video_path, monkeypatch):
+        """
+        What: 前処理スレッド起動失敗時の後始末テスト
+        Why: 起動済みのデコードスレッドのみjoinし、未起動スレッドのjoinで例外を上書きしないことを検証
+        """
+        started = []
+        original_start = threading.Thread.start
+
+        def start(thread):
+            if started:
+                raise RuntimeError("can't start new thread")
+            started.append(thread)
+            original_start(thread)
+
+        monkeypatch.setattr(threading.Thread, 'start', start)
+        extractor = make_extractor(visibility=0.9)
+
+        with pytest.raises(RuntimeError, match="can't start new thread"):
+            extractor.extract_landmarks(video_path, hw_decode=False)
+
+        assert not started[0].is_alive()
+
+    def test_extract_landmarks_at(self, video_path):
+        """
+        What: 指定フレームのみの抽出テスト
+        Why: 指定フレームのみ推論し、フレーム番号が昇順・重複なしで返ることを検証
+        """
+        extractor = make_extractor(visibility=0.9)
+        data = extractor.extract_landmarks_at(video_path, [7, 2, 9, 2, 15], hw_decode=False)
+
+        assert extractor.pose.calls == 3
+        assert data['frames'].tolist() == [2, 7, 9]
+        assert data['landmarks'].shape == (3, 33, 4)
+        assert data['detected_frames'] == 3
+
+    def test_extract_landmarks_at_none_is_dense(self, video_path):
+        """
+        What: indices=None時の全フレーム抽出テスト
+        """
+        extractor = make_extractor(visibility=0.9)
+        data = extractor.extract_landmarks_at(video_path, None, hw_decode=False)
+
+        assert data['frames'].tolist() == list(range(10))
+
+    def test_context_manager_closes_once(self):
+        """
+        What: withブロック終了時のリソース解放テスト
+        Why: __del__に依存せずpose.close()が1回だけ呼ばれることを検証
+        """
+        extractor = make_extractor(visibility=0.9)
+        pose = extractor.pose
+
+        with extractor as entered:
+            assert entered is extractor
+        extractor.close()
+
+        assert pose.closed == 1
+
+    def test_downscale_before_inference(self, video_path):
+        """
+        What: 推論前縮小テスト
+        Why: max_frame_height超のフレームがアスペクト比維持で縮小されることを検証
+        """
+        extractor = make_extractor(visibility=0.9, max_frame_height=24)
+        extractor.extract_landmarks(video_path, hw_decode=False)
+
+        assert set(extractor.pose.shapes) == {(24, 32, 3)}
+
+    def test_preprocessor_reuses_buffer(self):
+        """
+        What: FramePreprocessorのバッファ再利用テスト
+        Why: RGB変換結果が一致し、出力バッファがフレーム間で再確保されないことを検証
+        """
+        preprocess = FramePreprocessor()
+        frame = np.random.default_rng(0).integers(0, 256, (48, 64, 3), dtype=np.uint8)
+
+        first = preprocess(frame)
+        np.testing.assert_array_equal(first, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        assert preprocess(frame[::-1].copy()) is first
+
+    def test_preprocessor_buffer_ring(self):
+        """
+        What: 複数出力バッファの順番使用テスト
+        Why: キュー受け渡し中のフレームがn_buffers回の呼び出しまで上書きされないことを検証
+        """
+        preprocess = FramePreprocessor(n_buffers=3)
+        frames = [np.full((4, 4, 3), (i, 0, 0), dtype=np.uint8) for i in range(4)]
+
+        outputs = [preprocess(frame) for frame in frames[:3]]
+        assert [int(out[0, 0, 2]) for out in outputs] == [0, 1, 2]
+        assert preprocess(frames[3]) is outputs[0]
+
+    @pytest.fixture
+    def sample_data(self):
+        """
+        What: sample_landmarks.json読み込み
+        Why: 実データでテスト
+        Design Decision: tests/fixtures/sample_landmarks.json使用（ADR-005）
+
+        CRITICAL: ファイルが存在しない場合はテストスキップ
+        """
+        json_path = Path(__file__).parent / 'fixtures' / 'sample_landmarks.json'
+        if not json_path.exists():
+            pytest.skip(f"sample_landmarks.json not found: {json_path}")
+
+        with open(json_path, 'r') as f:
+            return json.load(f)
+
+    def test_to_records_matches_saved_format(self, sample_data):
+        """
+        What: SoA配列の抽出結果 → List[Dict]変換テスト
+        Why: save_to_json()の出力が従来のdict逐次構築時と同一であることを検証
+        """
+        metadata = sample_data['metadata']
+        records = sample_data['landmarks']
+        data = {
+            'landmarks': stack_landmarks(records),
+            'frames': np.array([r['frame'] for r in records], dtype=np.int64),
+            'fps': metadata['fps'],
+            'frame_count': metadata['total_frames'],
+            'duration': metadata['duration_sec'],
+            'detected_frames': metadata['detected_frames']
+        }
+
+        converted = PoseExtractor.to_records(data)
+
+        assert 'frames' not in converted
+        assert converted['detected_frames'] == metadata['detected_frames']
+        assert converted['landmarks'] == records
+
+    def test_save_to_json_compact(self, sample_data, tmp_path):
+        """
+        What: save_to_json()の保存内容テスト
+        Why: 既定（インデントなし）でも読み込み結果が従来フォーマットと同一であることを検証
+        """
+        records = sample_data['landmarks'][:20]
+        data = {
+            'landmarks': stack_landmarks(records),
+            'frames': np.array([r['frame'] for r in records], dtype=np.int64),
+            'fps': sample_data['metadata']['fps'],
+            'frame_count': 20,
+            'duration': 20 / sample_data['metadata']['fps'],
+            'detected_frames': 20
+        }
+        output_path = tmp_path / 'landmarks.json'
+
+        make_extractor(visibility=0.9).save_to_json(data, str(output_path), 'video.mp4')
+
+        assert b'\n' not in output_path.read_bytes()
+        with open(output_path, 'r') as f:
+            saved = json.load(f)
+        assert saved['landmarks'] == records
+        assert saved['metadata']['detection_rate'] == 1.0
+
+    def test_save_to_json_npz_sidecar(self, sample_data, tmp_path):
+        """
+        What: ランドマークの.npzサイドカー保存テスト
+        Why: JSONはメタデータとサイドカー名のみ、.npzからフレーム番号・座標が復元できることを検証
+        """
+        records = sample_data['landmarks'][:20]
+        landmarks = stack_landmarks(records)
+        data = {
+            'landmarks': landmarks,
+            'frames': np.array([r['frame'] for r in records], dtype=np.int64),
+            'fps': sample_data['metadata']['fps'],
+            'frame_count': 20,
+            'duration': 20 / sample_data['metadata']['fps'],
+            'detected_frames': 20
+        }
+        output_path = tmp_path / 'landmarks.json'
+
+        make_extractor(visibility=0.9).save_to_json(data, str(output_path), landmarks_sidecar=True)
+
+        with open(output_path, 'r') as f:
+            saved = json.load(f)
+        assert 'landmarks' not in saved
+        restored = load_landmarks_npz(tmp_path / saved['landmarks_file'])
+        assert restored['frames'].tolist() == data['frames'].tolist()
+        np.testing.assert_allclose(restored['landmarks'], landmarks, atol=1e-4)
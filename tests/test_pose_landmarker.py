@@ -0,0 +1,152 @@
+"""
+Purpose: pose_landmarker.pyの単体テスト
+Responsibility: デリゲート選択・フォールバック、solutions.pose互換の結果変換、モデルファイル解決の検証
+Dependencies: pytest, mediapipe, pose_landmarker.py
+Created: 2026-10-15 by Claude
+Decision Log: ADR-015
+
+CRITICAL: GPU非対応環境でもCPUにフォールバックすること
+"""
+import pytest
+import numpy as np
+from pathlib import Path
+from types import SimpleNamespace
+import sys
+
+# CRITICAL: processing/モジュールをインポートパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processing import pose_landmarker
+from processing.pose_landmarker import TasksPose, resolve_model_asset, select_delegate
+
+
+class FakeLandmarker:
+    """
+    What: PoseLandmarkerの代替（モデルファイル不要）
+    """
+
+    def __init__(self, delegate, detected=True):
+        self.delegate = delegate
+        self.detected = detected
+        self.timestamps = []
+        self.closed = False
+
+    def detect_for_video(self, image, timestamp_ms):
+        self.timestamps.append(timestamp_ms)
+        landmark = [SimpleNamespace(x=0.5, y=0.5, z=0.0, visibility=0.9) for _ in range(33)]
+        return SimpleNamespace(pose_landmarks=[landmark] if self.detected else [])
+
+    def close(self):
+        self.closed = True
+
+
+class TestPoseLandmarker:
+    """
+    What: TasksPose・select_delegateの単体テスト
+    Why: 実モデル・GPUなしでデリゲート選択ロジックを検証
+    Design Decision: _create_landmarker / _benchmarkをmonkeypatchで差し替え（ADR-015）
+    """
+
+    @pytest.fixture
+    def created(self, monkeypatch):
+        """
+        What: 生成されたFakeLandmarkerの記録（gpuは生成失敗を模擬可能）
+        """
+        created = []
+        state = {'gpu_available': True}
+
+        def create(model_asset_path, delegate, min_detection_confidence, min_tracking_confidence):
+            if delegate == 'gpu' and not state['gpu_available']:
+                raise RuntimeError("GPU delegate unavailable")
+            landmarker = FakeLandmarker(delegate)
+            created.append(landmarker)
+            return landmarker
+
+        monkeypatch.setattr(pose_landmarker, '_create_landmarker', create)
+        return SimpleNamespace(landmarkers=created, state=state)
+
+    def test_select_faster_delegate(self, created, monkeypatch):
+        """
+        What: 計測結果で高速なデリゲートを選択するテスト
+        Why: GPUが遅い端末ではCPUを選ぶことを検証
+        """
+        timings = {'gpu': 0.02, 'cpu': 0.01}
+        monkeypatch.setattr(pose_landmarker, '_benchmark', lambda landmarker: timings[landmarker.delegate])
+
+        assert select_delegate('model.task') == 'cpu'
+        assert all(landmarker.closed for landmarker in created.landmarkers)
+
+        timings['gpu'] = 0.005
+        assert select_delegate('model.task') == 'gpu'
+
+    def test_gpu_unavailable_falls_back_to_cpu(self, created, monkeypatch):
+        """
+        What: GPUデリゲート生成失敗時のフォールバックテスト
+        Why: 'auto'・'gpu'指定ともCPUで動作することを検証
+        """
+        created.state['gpu_available'] = False
+        monkeypatch.setattr(pose_landmarker, '_benchmark', lambda landmarker: 0.01)
+
+        assert select_delegate('model.task') == 'cpu'
+        assert TasksPose('model.task', delegate='gpu').delegate == 'cpu'
+
+    def test_unknown_delegate(self):
+        """
+        What: 未対応delegate指定テスト
+        """
+        with pytest.raises(ValueError):
+            TasksPose('model.task', delegate='npu')
+
+    def test_process_compatible_result(self, created):
+        """
+        What: process()の戻り値・タイムスタンプテスト
+        Why: solutions.pose互換の形式で返し、タイムスタンプがフレーム間隔で単調増加することを検証
+        """
+        pose = TasksPose('model.task', delegate='cpu')
+        pose.start_video(50.0)
+        image = np.zeros((48, 64, 3), dtype=np.uint8)
+
+        results = [pose.process(image) for _ in range(3)]
+
+        assert len(results[0].pose_landmarks.landmark) == 33
+        assert pose.landmarker.timestamps == [0, 20, 40]
+
+        pose.landmarker.detected = False
+        assert pose.process(image).pose_landmarks is None
+
+    def test_reset_recreates_landmarker(self, created):
+        """
+        What: reset()によるトラッキング状態破棄テスト
+        Why: 旧landmarkerを解放し、同一delegateで再生成してタイムスタンプが0から再開することを検証
+        """
+        pose = TasksPose('model.task', delegate='cpu')
+        pose.start_video(50.0)
+        image = np.zeros((48, 64, 3), dtype=np.uint8)
+        pose.process(image)
+        pose.process(image)
+        first = pose.landmarker
+
+        pose.reset()
+        pose.process(image)
+
+        assert first.closed
+        assert pose.landmarker is not first
+        assert pose.landmarker.delegate == 'cpu'
+        assert pose.landmarker.timestamps == [0]
+
+    def test_resolve_model_asset(self, tmp_path):
+        """
+        What: モデル精度・複雑さに対応するモデルファイル解決テスト
+        Why: ディレクトリ指定は<精度>/<モデル名>.task、ファイル指定はそのまま使うことを検証
+        """
+        model = tmp_path / 'int8' / 'pose_landmarker_heavy.task'
+        model.parent.mkdir()
+        model.write_bytes(b'')
+
+        assert resolve_model_asset(tmp_path, 2, 'int8') == model
+        assert resolve_model_asset(model) == model
+
+        with pytest.raises(FileNotFoundError):
+            resolve_model_asset(tmp_path, 2, 'float16')
+        with pytest.raises(ValueError):
+            resolve_model_asset(tmp_path, 2, 'bfloat16')
@@ -0,0 +1,125 @@
+"""
+Purpose: evaluators/_scoring.pyの単体テスト
+Responsibility: 閾値バンドのスコア判定が既存if/elifラダーと一致することの検証
+Dependencies: pytest, _scoring.py
+Created: 2026-10-15 by Claude
+Decision Log: ADR-002
+
+CRITICAL: 境界値（ちょうど閾値）の判定を必ず検証
+"""
+import pytest
+from pathlib import Path
+import sys
+
+# CRITICAL: processing/モジュールをインポートパスに追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from processing.evaluators._scoring import (
+    score_above,
+    score_at_least,
+    score_at_most,
+    score_below,
+    score_bands,
+)
+
+
+class TestScoring:
+    """
+    What: スコア判定関数の単体テスト
+    Why: 二分探索化で境界判定が変わらないことを保証
+    Design Decision: 既存ラダーを参照実装として比較（ADR-002）
+    """
+
+    @pytest.mark.parametrize('value', [0.0, 0.89, 0.9, 1.0, 1.2, 1.49, 1.5, 2.0])
+    def test_score_at_least(self, value):
+        """
+        What: 高いほど高得点（>=判定）のテスト
+        Why: ステップ幅等の基準幅比スコアリングと一致することを検証
+        """
+        ratio_min = 1.5
+        if value >= ratio_min:
+            expected = 3
+        elif value >= ratio_min * 0.8:
+            expected = 2
+        elif value >= ratio_min * 0.6:
+            expected = 1
+        else:
+            expected = 0
+
+        bands = score_bands([ratio_min * 0.6, ratio_min * 0.8, ratio_min])
+        assert score_at_least(value, bands) == expected
+
+    @pytest.mark.parametrize('value', [60.0, 87.0, 87.1, 97.0, 100.0, 107.0, 107.5, 180.0])
+    def test_score_at_most(self, value):
+        """
+        What: 低いほど高得点（<=判定）のテスト
+        Why: 膝屈曲角度スコアリングと一致することを検証
+        """
+        angle_min = 87
+        if value <= angle_min:
+            expected = 3
+        elif value <= angle_min + 10:
+            expected = 2
+        elif value <= angle_min + 20:
+            expected = 1
+        else:
+            expected = 0
+
+        bands = score_bands([angle_min, angle_min + 10, angle_min + 20])
+        assert score_at_most(value, bands) == expected
+
+    @pytest.mark.parametrize('value', [0.0, 4.9, 5.0, 10.0, 14.9, 15.0, 20.0, 30.0])
+    def test_score_above(self, value):
+        """
+        What: 高いほど高得点（>判定）のテスト
+        Why: 膝角度差スコアリングと一致することを検証
+        """
+        threshold = 20.0
+        if value > threshold:
+            expected = 3
+        elif value > threshold * 0.75:
+            expected = 2
+        elif value > threshold * 0.5:
+            expected = 1
+        else:
+            expected = 0
+
+        bands = score_bands([threshold * 0.5, threshold * 0.75, threshold])
+        assert score_above(value, bands) == expected
+
+    @pytest.mark.parametrize('value', [0.0, 0.019, 0.02, 0.03, 0.04, 0.05, 0.06, 0.1])
+    def test_score_below(self, value):
+        """
+        What: 低いほど高得点（<判定）のテスト
+        Why: 骨盤傾きスコアリングと一致することを検証
+        """
+        excellent, good, improvement = 0.02, 0.04, 0.06
+        if value < excellent:
+            expected = 3
+        elif value < good:
+            expected = 2
+        elif value < improvement:
+            expected = 1
+        else:
+            expected = 0
+
+        bands = score_bands([excellent, good, improvement])
+        assert score_below(value, bands) == expected
+
+    @pytest.mark.parametrize('func', [score_at_least, score_at_most, score_above, score_below])
+    @pytest.mark.parametrize('value', [float('nan'), float('inf'), float('-inf')])
+    def test_non_finite_scores_zero(self, func, value):
+        """
+        What: 非有限値（NaN・inf）の0点テスト
+        Why: searchsortedはNaNを全境界の後ろに置くため、未判定だと最高点になる
+        """
+        bands = score_bands([0.9, 1.2, 1.5])
+        assert func(value, bands) == 0
+
+    def test_score_bands_must_ascend(self):
+        """
+        What: 降順境界のエラーテスト
+        Why: 閾値設定ミスの黙殺防止
+        """
+        with pytest.raises(ValueError):
+            score_bands([1.5, 1.2, 0.9])
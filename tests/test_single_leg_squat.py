@@ -17,6 +17,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from processing.evaluators.single_leg_squat import SingleLegSquatEvaluator
+from processing.landmarks import as_landmark_array, stack_landmarks
 
 
 class TestSingleLegSquatEvaluator:
@@ -129,6 +130,51 @@ class TestSingleLegSquatEvaluator:
         assert evaluator.thresholds['knee_flexion_min'] == 87, \
             f"knee_flexion_minが87ではありません: {evaluator.thresholds['knee_flexion_min']}"
 
+    def test_visibility_min_default(self, tmp_path):
+        """
+        What: thresholds.visibility_min未設定のconfig.jsonでの初期化テスト
+        Why: キー追加前にデプロイ済みのconfig.jsonでKeyErrorにならないことを保証
+        Design Decision: 未設定時は既定値0.5（ADR-014）
+        """
+        with open('config.json', 'r', encoding='utf-8') as f:
+            config = json.load(f)
+        del config['thresholds']['visibility_min']
+        config_path = tmp_path / 'config.json'
+        config_path.write_text(json.dumps(config), encoding='utf-8')
+
+        evaluator = SingleLegSquatEvaluator(str(config_path))
+
+        assert evaluator._visibility_min == 0.5
+
+    @pytest.mark.parametrize('visibility, expected_frames', [(0.2, 10), (0.9, 15)])
+    def test_low_visibility_frames_excluded(self, evaluator, synthetic_single_leg_data,
+                                            visibility, expected_frames):
+        """
+        What: visibility_min未満フレームの評価除外テスト
+        Why: 骨盤が大きく傾いたフレームを追加した場合、visibility_min未満なら集計対象外で
+             frames_analyzed・スコアが変わらず、閾値以上なら集計されて骨盤スコアが下がることを検証
+        Design Decision: 5フレームの左hip visibilityのみ変更（ADR-014）
+        """
+        baseline = evaluator.evaluate(synthetic_single_leg_data)
+
+        data = [dict(frame, landmarks=list(frame['landmarks'])) for frame in synthetic_single_leg_data]
+        for i in range(5):
+            landmarks = [dict(lm) for lm in data[i]['landmarks']]
+            landmarks[23] = {'x': 0.6, 'y': 0.2, 'z': 0.0, 'visibility': visibility}  # 骨盤傾き（diff=0.2）
+            data.append({'frame': 10 + i, 'timestamp': (10 + i) * 0.033, 'landmarks': landmarks})
+
+        result = evaluator.evaluate(data)
+        pelvic = result['pelvic_stability']
+
+        assert evaluator._visibility_min == 0.5
+        assert pelvic['frames_analyzed'] == expected_frames
+        if expected_frames == 10:
+            assert pelvic == baseline['pelvic_stability']
+            assert result['score'] == baseline['score']
+        else:
+            assert pelvic['score'] < baseline['pelvic_stability']['score']
+            assert pelvic['avg_diff'] > baseline['pelvic_stability']['avg_diff']
+
     def test_landmark_indices(self, evaluator):
         """
         What: ランドマークインデックス定義テスト
@@ -153,59 +199,6 @@ class TestSingleLegSquatEvaluator:
         assert evaluator.LEFT_ANKLE == 27, f"LEFT_ANKLE != 27: {evaluator.LEFT_ANKLE}"
         assert evaluator.RIGHT_ANKLE == 28, f"RIGHT_ANKLE != 28: {evaluator.RIGHT_ANKLE}"
 
-    def test_calculate_knee_angle_normal(self, evaluator):
-        """
-        What: 膝角度計算テスト（正常系）
-        Why: _calculate_knee_angle()の正確性検証
-        Design Decision: 2Dベクトル内積で角度計算（ADR-003）
-
-        CRITICAL: 90°、180°等の既知角度で検証
-        """
-        # PHASE CORE LOGIC: 90°テスト
-        hip = {'x': 0.5, 'y': 0.3, 'z': 0.0}
-        knee = {'x': 0.5, 'y': 0.5, 'z': 0.0}
-        ankle = {'x': 0.7, 'y': 0.5, 'z': 0.0}
-
-        angle = evaluator._calculate_knee_angle(hip, knee, ankle)
-
-        # 検証: 90°±1°
-        assert angle is not None, "角度がNoneです"
-        assert 89 <= angle <= 91, f"90°期待ですが: {angle:.1f}°"
-
-        # PHASE CORE LOGIC: 180°テスト（完全伸展）
-        hip_straight = {'x': 0.5, 'y': 0.3, 'z': 0.0}
-        knee_straight = {'x': 0.5, 'y': 0.5, 'z': 0.0}
-        ankle_straight = {'x': 0.5, 'y': 0.7, 'z': 0.0}
-
-        angle_straight = evaluator._calculate_knee_angle(hip_straight, knee_straight, ankle_straight)
-
-        # 検証: 180°±1°
-        assert angle_straight is not None, "角度がNoneです"
-        assert 179 <= angle_straight <= 181, f"180°期待ですが: {angle_straight:.1f}°"
-
-    def test_calculate_knee_angle_edge_cases(self, evaluator):
-        """
-        What: 膝角度計算テスト（エッジケース）
-        Why: NaN/ゼロ除算時のNone返却確認
-        Design Decision: 例外投げずにNone返却（ADR-003）
-
-        CRITICAL: 例外投げずにNone返却
-        """
-        # PHASE CORE LOGIC: 同一座標（ゼロ除算）
-        same_point = {'x': 0.5, 'y': 0.5, 'z': 0.0}
-        angle_zero = evaluator._calculate_knee_angle(same_point, same_point, same_point)
-
-        # 検証: Noneを返す（例外投げない）
-        assert angle_zero is None, f"同一座標でNoneを返すべきですが: {angle_zero}"
-
-        # PHASE CORE LOGIC: 不正な座標（KeyError）
-        invalid_point = {'x': 0.5}  # y, z なし
-        valid_point = {'x': 0.5, 'y': 0.5, 'z': 0.0}
-        angle_invalid = evaluator._calculate_knee_angle(invalid_point, valid_point, valid_point)
-
-        # 検証: Noneを返す（例外投げない）
-        assert angle_invalid is None, f"不正座標でNoneを返すべきですが: {angle_invalid}"
-
     def test_evaluate_pelvic_stability(self, evaluator, synthetic_single_leg_data):
         """
         What: 骨盤水平性評価テスト
@@ -215,7 +208,8 @@ class TestSingleLegSquatEvaluator:
         CRITICAL: スコア0-3点、avg_diff/max_diff計算検証
         """
         # PHASE CORE LOGIC: 骨盤水平性評価
-        result = evaluator._evaluate_pelvic_stability(synthetic_single_leg_data)
+        hip_diffs, knee_angles = evaluator._compute_all(as_landmark_array(synthetic_single_leg_data))
+        result = evaluator._evaluate_pelvic_stability(hip_diffs)
 
         # 検証: 必須キー存在
         assert 'score' in result, "scoreが存在しません"
@@ -242,7 +236,8 @@ class TestSingleLegSquatEvaluator:
         CRITICAL: スコア0-3点、min_angle/avg_angle計算検証
         """
         # PHASE CORE LOGIC: 膝屈曲角度評価
-        result = evaluator._evaluate_knee_flexion(synthetic_single_leg_data)
+        hip_diffs, knee_angles = evaluator._compute_all(as_landmark_array(synthetic_single_leg_data))
+        result = evaluator._evaluate_knee_flexion(knee_angles)
 
         # 検証: 必須キー存在
         assert 'score' in result, "scoreが存在しません"
@@ -273,7 +268,8 @@ class TestSingleLegSquatEvaluator:
         CRITICAL: スコア0-3点、avg_diff/max_diff計算検証
         """
         # PHASE CORE LOGIC: 膝角度比評価
-        result = evaluator._evaluate_knee_angle_ratio(synthetic_single_leg_data)
+        hip_diffs, knee_angles = evaluator._compute_all(as_landmark_array(synthetic_single_leg_data))
+        result = evaluator._evaluate_knee_angle_ratio(knee_angles)
 
         # 検証: 必須キー存在
         assert 'score' in result, "scoreが存在しません"
@@ -361,6 +357,48 @@ class TestSingleLegSquatEvaluator:
         assert '検出できませんでした' in result['details'], \
             "detailsに検出失敗メッセージが含まれていません"
 
+    def test_evaluate_accepts_landmark_array(self, evaluator, sample_landmarks):
+        """
+        What: SoA配列入力の評価テスト
+        Why: 上流で変換済みの配列を渡した場合もList[Dict]入力と同一結果を返すことを検証
+        Design Decision: stack_landmarks()の配列と比較（ADR-010）
+        """
+        arr = stack_landmarks(sample_landmarks)
+
+        assert evaluator.evaluate(arr) == evaluator.evaluate(sample_landmarks)
+        assert evaluator.evaluate(arr[:0])['score'] == 0
+
+    def test_knee_angles_computed_once(self, evaluator, sample_landmarks, monkeypatch):
+        """
+        What: 膝角度の共有テスト
+        Why: 膝屈曲・膝角度比の2指標で左右膝角度を二重計算しないことを検証
+        Design Decision: _compute_all()で1回計算し両評価メソッドへ渡す（ADR-010）
+        """
+        from processing.evaluators import single_leg_squat
+
+        calls = []
+        original = single_leg_squat.paired_joint_angles
+
+        def counting(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(single_leg_squat, 'paired_joint_angles', counting)
+        evaluator.evaluate(sample_landmarks)
+
+        assert len(calls) == 1
+
+    def test_compute_all_dtypes(self, evaluator, sample_landmarks):
+        """
+        What: 時系列のdtypeテスト
+        Why: 座標差由来の時系列がfloat64へ昇格しないことを検証（帯域1/2の維持）
+        Design Decision: 角度はfloat64演算（arccos桁落ち対策、ADR-010）
+        """
+        hip_diffs, knee_angles = evaluator._compute_all(stack_landmarks(sample_landmarks))
+
+        assert hip_diffs.dtype == np.float32
+        assert knee_angles.dtype == np.float64
+
     def test_generate_details(self, evaluator):
         """
         What: 詳細メッセージ生成テスト
@@ -127,6 +127,30 @@ class TestVideoProcessingWorker:
             assert saved_data['score'] == result['score']
             assert saved_data['test_type'] == 'single_leg_squat'
 
+    def test_process_all_extracts_once(self, mock_extraction_result, tmp_path):
+        """全テストタイプ評価でランドマーク抽出が1回のみであることを確認"""
+        dummy_video = tmp_path / "dummy.mp4"
+        dummy_video.write_text("dummy")
+
+        # MediaPipeモデルを読み込まないようPoseExtractorをモック化して生成
+        with patch('processing.worker.PoseExtractor') as mock_pose_extractor_class:
+            worker = VideoProcessingWorker()
+        mock_extractor = mock_pose_extractor_class.return_value
+        mock_extractor.extract_landmarks.return_value = mock_extraction_result
+
+        results = worker.process_all(str(dummy_video), output_dir=str(tmp_path / "output"))
+
+        mock_extractor.extract_landmarks.assert_called_once_with(str(dummy_video))
+        assert set(results) == set(worker.evaluators)
+        for test_type, result in results.items():
+            assert result['test_type'] == test_type
+            assert 0 <= result['score'] <= 3
+            assert Path(result['output_file']).exists()
+        assert (tmp_path / "output" / "warnings.json").exists()
+
+        worker.close()
+        mock_extractor.close.assert_called_once_with()
+
     def test_get_summary(self, worker, mock_extraction_result, tmp_path):
         """サマリーが正しく生成されることを確認"""
         # ダミー動画ファイルを作成